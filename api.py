@@ -1,53 +1,315 @@
+import asyncio
+import gc
+import itertools
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+import torch
 from pororo import Pororo
-from fastapi import FastAPI
+from pororo.tasks.utils.base import module_nbytes
+from fastapi import FastAPI, HTTPException
 
 
 app = FastAPI()
-MAXIMUM_CACHE_SIZE = 1
 
-
-class LRUCache:
-    def __init__(self, capacity):
-        # From https://www.kunxi.org/2014/05/lru-cache-in-python/
-        self.capacity = capacity
-        self.tm = 0
-        self.cache = {}
-        self.lru = {}
+# Loaded models are evicted (least recently used first) once the size of
+# their weights exceeds this budget
+MODEL_POOL_BUDGET = int(os.environ.get("PORORO_MODEL_POOL_BUDGET", 4 * 1024 ** 3))
+# JSON file listing models to load (and pin) at startup, see preload_models()
+MODEL_POOL_CONFIG = os.environ.get("PORORO_MODEL_POOL_CONFIG")
+
+# Requests for the same (task, lang) arriving within MAXIMUM_BATCH_WAIT
+# seconds of each other share one forward pass
+MAXIMUM_BATCH_SIZE = 32
+MAXIMUM_BATCH_WAIT = 0.005
+MAXIMUM_QUEUE_SIZE = 512
+
+# Every model runs on its own worker thread so that a slow model never
+# blocks the event loop (or the other models)
+MAXIMUM_PENDING_CALLS = int(os.environ.get("PORORO_MAXIMUM_PENDING_CALLS", 64))
+INFERENCE_TIMEOUT = float(os.environ.get("PORORO_INFERENCE_TIMEOUT", 120))
+INTRA_OP_THREADS = int(os.environ.get("PORORO_INTRA_OP_THREADS", max(1, (os.cpu_count() or 1) // 2)))
+
+
+class ModelPool:
+    """
+    LRU pool of loaded models bounded by the measured size of their weights
+    rather than by a number of entries. Pinned models are always resident
+    and never evicted.
+    """
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self.nbytes = 0
+        self.stats = {'hits': 0, 'loads': 0, 'evictions': 0}
+        self.__lru = OrderedDict()  # key -> (model, nbytes), oldest first
+        self.__pinned = {}
+        # Models are loaded and used from several executor threads
+        self.lock = threading.RLock()
 
     def __contains__(self, key):
-        return key in self.cache
+        return key in self.__pinned or key in self.__lru
 
     def __getitem__(self, key):
-        if key in self.cache:
-            self.lru[key] = self.tm
-            self.tm += 1
-            return self.cache[key]
+        with self.lock:
+            return self.__get(key)
+
+    def __get(self, key):
+        if key in self.__pinned:
+            self.stats['hits'] += 1
+            return self.__pinned[key][0]
+        if key in self.__lru:
+            self.stats['hits'] += 1
+            self.__lru.move_to_end(key)
+            return self.__lru[key][0]
         raise KeyError(key)
 
     def __setitem__(self, key, value):
-        if len(self.cache) >= self.capacity:
-            # find the LRU entry
-            old_key = min(self.lru.keys(), key=lambda k:self.lru[k])
-            self.cache.pop(old_key)
-            self.lru.pop(old_key)
-        self.cache[key] = value
-        self.lru[key] = self.tm
-        self.tm += 1
-
-
-_cache = LRUCache(capacity=MAXIMUM_CACHE_SIZE)
+        with self.lock:
+            self.__set(key, value)
+
+    def __set(self, key, value):
+        self.pop(key)
+        nbytes = module_nbytes(value)
+        self.stats['loads'] += 1
+
+        # A model bigger than the whole budget is still kept, alone
+        evicted = False
+        while self.__lru and self.nbytes + nbytes > self.budget_bytes:
+            old_key, (_, old_nbytes) = self.__lru.popitem(last=False)
+            self.nbytes -= old_nbytes
+            self.stats['evictions'] += 1
+            evicted = True
+            print("Evicting key:", *old_key)
+        if evicted:
+            self.__release_memory()
+
+        self.__lru[key] = (value, nbytes)
+        self.nbytes += nbytes
+
+    def pop(self, key):
+        with self.lock:
+            for entries in (self.__pinned, self.__lru):
+                if key in entries:
+                    self.nbytes -= entries.pop(key)[1]
+                    self.__release_memory()
+
+    def __release_memory(self):
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def pin(self, key):
+        with self.lock:
+            if key in self.__lru:
+                self.__pinned[key] = self.__lru.pop(key)
+
+    def summary(self) -> dict:
+        with self.lock:
+            return self.__summary()
+
+    def __summary(self) -> dict:
+        return {
+            **self.stats,
+            'budget_bytes': self.budget_bytes,
+            'resident_bytes': self.nbytes,
+            'models': [
+                {'key': list(k), 'bytes': v[1], 'pinned': k in self.__pinned}
+                for k, v in itertools.chain(self.__pinned.items(), self.__lru.items())
+            ],
+        }
+
+
+_cache = ModelPool(budget_bytes=MODEL_POOL_BUDGET)
+_caching_dicts = {}
+# Loading is serialised to avoid loading one model twice, and to keep the
+# peak memory use of concurrent cold starts down
+_load_lock = threading.Lock()
 
 
 class CachingDict:
     def __init__(self, unique_key: str, backing_dict: dict):
         self.__unique_key = unique_key
         self.__backing_dict = backing_dict
+        _caching_dicts[unique_key] = self
     
     def __getitem__(self, item):
-        if (self.__unique_key, item) not in _cache:
-            print("Creating key:", self.__unique_key, item)
-            _cache[self.__unique_key, item] = self.__backing_dict[item]()
-        return _cache[self.__unique_key, item]
+        key = (self.__unique_key, item)
+        with _cache.lock:
+            if key in _cache:
+                return _cache[key]
+
+        with _load_lock:
+            if key in _cache:
+                return _cache[key]
+            print("Creating key:", *key)
+            model = self.__backing_dict[item]()
+            _cache[key] = model
+            return model
+
+
+def preload_models(config_path: str):
+    """
+    Loads (and optionally pins) models listed in a JSON config, e.g.
+    {"preload": [["ner", "en"]], "pinned": [["pos", "ko"]]}
+    """
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    for unique_key, item in config.get('preload', []) + config.get('pinned', []):
+        _caching_dicts[unique_key][item]
+    for unique_key, item in config.get('pinned', []):
+        _cache.pin((unique_key, item))
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests for one model and runs them as a single
+    batched call. `batch_fn` receives a list of inputs and must return a
+    list of outputs in the same order.
+    """
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]],
+                 max_batch_size: int = MAXIMUM_BATCH_SIZE,
+                 max_wait: float = MAXIMUM_BATCH_WAIT,
+                 max_queue_size: int = MAXIMUM_QUEUE_SIZE,
+                 executor: Optional['ModelExecutor'] = None):
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue_size = max_queue_size
+        self.__loop = None
+        self.__queue = None
+        self.__worker = None
+
+    async def __call__(self, item):
+        loop = asyncio.get_event_loop()
+        if self.__loop is not loop:
+            # Queues are bound to the event loop they were created in
+            self.__loop = loop
+            self.__queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self.__worker = loop.create_task(self.__run())
+
+        future = loop.create_future()
+        try:
+            self.__queue.put_nowait((item, future))
+        except asyncio.QueueFull:
+            raise HTTPException(status_code=503, detail="Server overloaded, please retry later")
+        return await future
+
+    async def __collect(self, batch: list):
+        loop = asyncio.get_event_loop()
+        batch.append(await self.__queue.get())
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.__queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+    async def __run(self):
+        while True:
+            batch = []
+            # Every failure is handed to the requests of the batch, so that
+            # the worker keeps serving the queue and no request waits forever
+            try:
+                await self.__collect(batch)
+                items = [item for item, _ in batch]
+                if self.executor is not None:
+                    outputs = await self.executor(self.batch_fn, items)
+                else:
+                    outputs = self.batch_fn(items)
+                if not isinstance(outputs, list) or len(outputs) != len(batch):
+                    raise RuntimeError(
+                        f"Batched call should return a list of {len(batch)} outputs, "
+                        f"got {type(outputs).__name__} {outputs!r:.100}")
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), output in zip(batch, outputs):
+                    if not future.done():
+                        future.set_result(output)
+
+
+class ModelExecutor:
+    """
+    Runs blocking model calls (including lazy model loading) on a dedicated
+    worker thread, with at most `max_pending` calls queued or running and
+    `timeout` seconds to produce a result.
+    """
+    def __init__(self, name: str,
+                 num_threads: int = INTRA_OP_THREADS,
+                 max_pending: int = MAXIMUM_PENDING_CALLS,
+                 timeout: float = INFERENCE_TIMEOUT):
+        self.timeout = timeout
+        self.__pending = threading.BoundedSemaphore(max_pending)
+        # With OpenMP builds of torch the intra-op thread count set here
+        # only applies to this worker thread
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=name,
+            initializer=torch.set_num_threads,
+            initargs=(num_threads,),
+        )
+
+    async def __call__(self, fn: Callable, *args, **kwargs):
+        if not self.__pending.acquire(blocking=False):
+            raise HTTPException(status_code=503, detail="Server overloaded, please retry later")
+        try:
+            future = self.__executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.__pending.release()
+            raise
+        # Released once the call really finishes (or is cancelled before
+        # it started), not when the waiter gives up
+        future.add_done_callback(lambda _: self.__pending.release())
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Inference timed out")
+
+
+_batchers: Dict[Hashable, MicroBatcher] = {}
+_executors: Dict[Hashable, ModelExecutor] = {}
+
+
+def offload(key: Hashable, **kwargs) -> ModelExecutor:
+    if key not in _executors:
+        _executors[key] = ModelExecutor('-'.join(map(str, key)), **kwargs)
+    return _executors[key]
+
+
+def batched(key: Hashable, batch_fn: Callable[[List[Any]], List[Any]], **kwargs) -> MicroBatcher:
+    if key not in _batchers:
+        # Batches run on the executor of the model they belong to
+        kwargs.setdefault('executor', offload(key[:2]))
+        _batchers[key] = MicroBatcher(batch_fn, **kwargs)
+    return _batchers[key]
+
+
+@app.on_event("startup")
+async def _():
+    if MODEL_POOL_CONFIG:
+        await asyncio.get_event_loop().run_in_executor(None, preload_models, MODEL_POOL_CONFIG)
+
+
+@app.get("/health")
+async def _():
+    return {'status': 'ok'}
+
+
+@app.get("/modelPool")
+async def _():
+    return _cache.summary()
 
 
 #===========================================================#
@@ -83,7 +345,7 @@ sa = CachingDict('sa', {
 
 @app.get("/dependencyParse")
 async def _(sentences: str):
-    return dp['ko'](sentences)
+    return await offload(('dep_parse', 'ko'))(lambda: dp['ko'](sentences))
 
 
 @app.get("/namedEntityRecognition")
@@ -91,20 +353,24 @@ async def _(iso: str, sentences: str):
     if iso == 'ko':
         # Can't imagine a situation where word sense disambiguation wouldn't 
         # be preferred if it's available for Korean - always enable
-        return ner[iso](sentences, apply_wsd=True)
-    return ner[iso](sentences)
+        return await batched(
+            ('ner', iso), lambda batch: ner[iso](batch, apply_wsd=True)
+        )(sentences)
+    return await batched(('ner', iso), lambda batch: ner[iso](batch))(sentences)
 
 
 @app.get("/partOfSpeech")
 async def _(iso: str, sentences: str):
-    return pos[iso](sentences)
+    return await offload(('pos', iso))(lambda: pos[iso](sentences))
 
 
 @app.get("/sentimentAnalysis")
 async def _(iso: str, sentences: str):
     r = {}
-    for k, v in sa[iso].items():
-        i = v(sentences, show_probs=True)
+    for k in await offload(('sa', iso))(lambda: list(sa[iso])):
+        i = await batched(('sa', iso, k), lambda batch, k=k: (
+            sa[iso][k](batch, show_probs=True)
+        ))(sentences)
         i['overall'] = 'Positive' if i['positive'] >= 0.5 else 'Negative'
         r[k] = i
     return r
@@ -131,12 +397,12 @@ nli = CachingDict('nli', {
 
 @app.get("/zeroShotTopicClassification")
 async def _(iso: str, sentences: str, topics: str):
-    return zsl[iso](sentences, topics.split(','))
+    return await offload(('zsl', iso))(lambda: zsl[iso](sentences, topics.split(',')))
 
 
 @app.get("/naturalLanguageInference")
 async def _(iso: str, sentence_1: str, sentence_2: str):
-    return nli[iso](sentence_1, sentence_2)
+    return await offload(('nli', iso))(lambda: nli[iso](sentence_1, sentence_2))
 
 
 #===========================================================#
@@ -154,7 +420,7 @@ g2p = CachingDict('g2p', {
 
 @app.get("/graphemeToPhoneme")
 async def _(iso: str, sentences: str):
-    return g2p[iso](sentences, align=True)
+    return await offload(('g2p', iso))(lambda: g2p[iso](sentences, align=True))
 
 
 #===========================================================#
@@ -168,7 +434,7 @@ inflection = CachingDict('inflection', {
     'ja': lambda: Pororo(task="inflection", lang="ja"),
 })
 ocr = CachingDict('ocr', {
-    'ko': Pororo(task="ocr", lang="ko")
+    'ko': lambda: Pororo(task="ocr", lang="ko"),
 })
 col = CachingDict('col', {
     'ko': lambda: Pororo(task="col", lang="ko"),
@@ -189,22 +455,22 @@ tokenizers = CachingDict('tokenizers', {
 
 @app.get("/morphologicalInflection")
 async def _(iso: str, word: str):
-    return inflection[iso](word)
+    return await offload(('inflection', iso))(lambda: inflection[iso](word))
 
 
 @app.get("/ocr")
 async def _(image_data: str):
-    return ocr['ko'](image_data, detail=True)
+    return await offload(('ocr', 'ko'))(lambda: ocr['ko'](image_data, detail=True))
 
 
 @app.get("/collocation")
 async def _(iso: str, word: str):
-    return col[iso](word, detail=True)
+    return await offload(('col', iso))(lambda: col[iso](word, detail=True))
 
 
 @app.get("/tokenizeText")
 async def _(iso: str, sentences: str):
-    return tokenizers[iso](sentences)
+    return await offload(('tokenizers', iso))(lambda: tokenizers[iso](sentences))
 
 
 @app.get("/wordTranslation")
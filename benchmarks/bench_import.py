@@ -0,0 +1,84 @@
+"""Benchmark `import pororo` and the first lookup of each task factory
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5] [--tasks ner,mt]
+
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules `import pororo` must never pull in by itself
+HEAVY_MODULES = [
+    "torch",
+    "fairseq",
+    "transformers",
+    "sentence_transformers",
+    "numpy",
+    "scipy",
+]
+
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import pororo
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+FACTORY_SNIPPET = """
+import time
+from pororo.pororo import get_factory
+start = time.perf_counter()
+get_factory({task!r})
+print(time.perf_counter() - start)
+"""
+
+
+def run(snippet: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", snippet],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.strip()
+
+
+def bench_import(repeat: int):
+    timings, heavy = [], ""
+    for _ in range(repeat):
+        elapsed, _, heavy = run(
+            IMPORT_SNIPPET.format(heavy=HEAVY_MODULES)).partition(" ")
+        timings.append(float(elapsed))
+
+    print(f"import pororo: {statistics.median(timings) * 1000:.1f} ms "
+          f"(median of {repeat})")
+    if heavy:
+        print(f"  heavy modules imported: {heavy}")
+
+
+def bench_factories(tasks):
+    for task in tasks:
+        try:
+            elapsed = float(run(FACTORY_SNIPPET.format(task=task)))
+            print(f"first lookup of {task!r}: {elapsed * 1000:.1f} ms")
+        except subprocess.CalledProcessError:
+            print(f"first lookup of {task!r}: failed (missing dependency?)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tasks", type=str, default="")
+    args = parser.parse_args()
+
+    bench_import(args.repeat)
+    bench_factories([t for t in args.tasks.split(",") if t])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Report the padding wasted by mini-batches in arrival order vs. `plan_batches`
+
+Lengths are drawn from a few synthetic distributions, or read from a text
+file (whitespace tokens per line) with `--file`. Every distribution reports
+the share of padded positions that hold padding, and the time planning takes.
+
+Usage:
+    python benchmarks/bench_padding.py [--samples 10000] [--batch-size 32] [--max-tokens 4096] [--file corpus.txt]
+
+"""
+
+import argparse
+import random
+import time
+
+from pororo.tasks.utils.batching import BatchPlan, plan_batches
+
+DISTRIBUTIONS = {
+    "uniform": lambda rng: rng.randint(1, 512),
+    "lognormal": lambda rng: min(512, max(1, int(rng.lognormvariate(3.5, 0.8)))),
+    "bimodal": lambda rng: rng.choice([rng.randint(5, 20), rng.randint(200, 500)]),
+}
+
+
+def arrival_order(lengths, batch_size):
+    """Mini-batches of consecutive samples, as tasks used to pad them"""
+    return BatchPlan(
+        batches=[
+            list(range(start, min(start + batch_size, len(lengths))))
+            for start in range(0, len(lengths), batch_size)
+        ],
+        lengths=lengths,
+    )
+
+
+def waste(plan: BatchPlan) -> float:
+    return plan.padding() / (plan.padding() + sum(plan.lengths))
+
+
+def report(name: str, lengths, batch_size: int, max_tokens: int):
+    naive = arrival_order(lengths, batch_size)
+
+    start = time.perf_counter()
+    planned = plan_batches(lengths, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    budgeted = plan_batches(lengths, max_tokens=max_tokens)
+
+    print(f"{name}: {len(lengths)} samples, "
+          f"arrival order {waste(naive):.1%} padding ({len(naive)} batches), "
+          f"planned {waste(planned):.1%} ({len(planned)} batches, "
+          f"{elapsed * 1000:.1f} ms), "
+          f"max_tokens={max_tokens} {waste(budgeted):.1%} "
+          f"({len(budgeted)} batches)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-tokens", type=int, default=4096)
+    parser.add_argument("--file", type=str, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            lengths = [len(line.split()) or 1 for line in f]
+        report(args.file, lengths, args.batch_size, args.max_tokens)
+        return
+
+    rng = random.Random(args.seed)
+    for name, draw in DISTRIBUTIONS.items():
+        lengths = [draw(rng) for _ in range(args.samples)]
+        report(name, lengths, args.batch_size, args.max_tokens)
+
+
+if __name__ == "__main__":
+    main()
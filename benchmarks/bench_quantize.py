@@ -0,0 +1,144 @@
+"""Compare int8 dynamically quantized BERT-family modules against fp32 on CPU
+
+Every task runs the fixture inputs below with `quantize=None` and
+`quantize="int8"`, reports how many outputs agree and the speedup, and exits
+with status 1 if any agreement is below `--min-agreement`.
+
+Usage:
+    python benchmarks/bench_quantize.py [--tasks nli:ko,sts:en] [--repeat 3]
+
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Both models are compared on CPU, where int8 kernels run
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+# (task, lang) to the argument tuples each module is called with
+FIXTURES = {
+    ("nli", "ko"): [
+        ("저는, 그냥 알아내려고 거기 있었어요", "나는 처음부터 그것을 잘 이해했다"),
+        ("저는 지금 많이 피곤합니다", "저는 지금 쉬고 싶습니다"),
+        ("그는 학교에 갔다", "그는 집에 있었다"),
+    ],
+    ("nli", "en"): [
+        ("A soccer game with multiple males playing.",
+         "Some men are playing a sport."),
+        ("A man inspects the uniform of a figure.", "The man is sleeping."),
+        ("An older and younger man smiling.",
+         "Two men are smiling and laughing at the cats playing on the floor."),
+    ],
+    ("sts", "ko"): [
+        ("나는 동물을 좋아하는 사람이야", "나는 동물을 좋아하는 사람이 아니야"),
+        ("오늘 날씨가 좋다", "오늘은 날씨가 맑다"),
+    ],
+    ("sts", "en"): [
+        ("I love animals", "I don't like animals"),
+        ("A man is playing a guitar.", "A man is playing a flute."),
+    ],
+    ("sentiment", "ko"): [
+        ("배송이 버트 학습시키는 것 만큼 느리네요",),
+        ("배송이 경량화되었는지 빠르네요",),
+        ("이 영화는 정말 재미있었다",),
+    ],
+    ("pi", "ko"): [
+        ("그 사람은 허아랑 눈이 마주쳤다", "허아는 그 사람과 눈이 마주쳤다"),
+        ("나는 학교에 간다", "나는 집에 간다"),
+    ],
+    ("review", "ko"): [
+        ("그냥저냥 다른데랑 똑같숩니다",),
+        ("정말 최고의 제품이에요",),
+    ],
+    ("ner", "en"): [
+        ("It was in midfield where Arsenal took control of the game.",),
+        ("Michael Jeffrey Jordan is an American businessman.",),
+    ],
+    ("mrc", "ko"): [
+        ("카카오브레인이 공개한 라이브러리 이름은?",
+         "카카오브레인은 자연어 처리와 음성 관련 태스크를 쉽게 수행할 수 있도록 도와 주는 라이브러리 pororo를 공개하였습니다."),
+    ],
+    ("fib", "en"): [
+        ("David Beckham is a famous __ player.",),
+        ("The __ sat on the mat.",),
+    ],
+    ("cse", "ko"): [
+        ("하늘을 나는 새",),
+        ("나는 동물을 좋아하는 사람이야",),
+    ],
+}
+
+
+def agrees(fp32, int8, tol: float) -> bool:
+    """Whether a quantized output matches the fp32 one"""
+    import numpy as np
+
+    if isinstance(fp32, np.ndarray):
+        a, b = fp32.reshape(-1), int8.reshape(-1)
+        cosine = a.dot(b) / (np.linalg.norm(a) * np.linalg.norm(b))
+        return cosine >= 1 - tol
+    if isinstance(fp32, float):
+        return abs(fp32 - int8) <= tol
+    return fp32 == int8
+
+
+def timed(module, fixtures, repeat: int):
+    outputs, timings = None, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [module(*args) for args in fixtures]
+        timings.append(time.perf_counter() - start)
+    return outputs, statistics.median(timings)
+
+
+def bench(task: str, lang: str, repeat: int, tol: float) -> float:
+    from pororo import Pororo
+
+    fixtures = FIXTURES[(task, lang)]
+    fp32, fp32_time = timed(Pororo(task, lang=lang), fixtures, repeat)
+    int8, int8_time = timed(
+        Pororo(task, lang=lang, quantize="int8"),
+        fixtures,
+        repeat,
+    )
+
+    agreement = sum(agrees(a, b, tol) for a, b in zip(fp32, int8)) / len(fp32)
+    print(f"{task}:{lang}: agreement {agreement:.2f}, "
+          f"fp32 {fp32_time * 1000:.1f} ms, int8 {int8_time * 1000:.1f} ms, "
+          f"speedup {fp32_time / int8_time:.2f}x")
+    return agreement
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--tasks",
+        type=str,
+        default=",".join(f"{task}:{lang}" for task, lang in FIXTURES),
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--tol",
+        type=float,
+        default=0.05,
+        help="largest difference of scores, or 1 - cosine of embeddings",
+    )
+    parser.add_argument("--min-agreement", type=float, default=0.9)
+    args = parser.parse_args()
+
+    failed = []
+    for spec in args.tasks.split(","):
+        task, _, lang = spec.partition(":")
+        if bench(task, lang, args.repeat, args.tol) < args.min_agreement:
+            failed.append(spec)
+
+    if failed:
+        print(f"agreement below {args.min_agreement}: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
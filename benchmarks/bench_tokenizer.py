@@ -0,0 +1,108 @@
+"""Benchmark loading and running the JaBERTa/ZhBERTa WordPiece tokenizers
+
+Every language reports the time to load the bundled vocabulary, to tokenize
+the fixture sentences one at a time and as a single batch. With `--baseline`,
+the transformers tokenizers the models were trained with are timed as well,
+and the share of sentences tokenized identically is reported.
+
+Usage:
+    python benchmarks/bench_tokenizer.py [--langs ja,zh] [--copies 1000] [--baseline]
+
+"""
+
+import argparse
+import statistics
+import time
+
+# lang to (tokenizer options, transformers baseline)
+TOKENIZERS = {
+    "ja": (dict(mecab=True), "cl-tohoku/bert-base-japanese-whole-word-masking"),
+    "zh": (dict(lowercase=True), "bert-base-chinese"),
+}
+
+FIXTURES = {
+    "ja": [
+        "日本の首都は東京です。",
+        "彼はサッカーを見るのが好きだ。",
+        "カカオブレインは自然言語処理ライブラリを公開しました。",
+        "2021年2月に、新しいモデルが発表された。",
+    ],
+    "zh": [
+        "中国的首都是北京。",
+        "他喜欢看足球比赛。",
+        "Kakao Brain发布了一个自然语言处理库。",
+        "2021年2月，新的模型被发布了。",
+    ],
+}
+
+
+def timed(fn, repeat: int):
+    result, timings = None, []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def bench(lang: str, copies: int, repeat: int, baseline: bool):
+    from pororo.tasks.utils.download_utils import download_or_load
+    from pororo.tasks.utils.tokenizer import WordPieceTokenizer
+
+    options, pretrained = TOKENIZERS[lang]
+    sents = FIXTURES[lang] * copies
+
+    tok_path = download_or_load(f"tokenizers/wordpiece.{lang}.zip", lang)
+    vocab_path = f"{tok_path}/vocab.txt"
+    tokenizer, load_time = timed(
+        lambda: WordPieceTokenizer.from_file(vocab_path, **options),
+        repeat,
+    )
+    _, loop_time = timed(
+        lambda: [tokenizer.encode(sent).tokens for sent in sents],
+        repeat,
+    )
+    tokens, batch_time = timed(
+        lambda: [e.tokens for e in tokenizer.encode_batch(sents)],
+        repeat,
+    )
+    print(f"{lang}: load {load_time * 1000:.1f} ms, "
+          f"tokenize {len(sents)} sentences {loop_time * 1000:.1f} ms, "
+          f"batched {batch_time * 1000:.1f} ms")
+
+    if not baseline:
+        return
+
+    from transformers import AutoTokenizer
+
+    reference, ref_load_time = timed(
+        lambda: AutoTokenizer.from_pretrained(pretrained, use_fast=False),
+        repeat,
+    )
+    expected, ref_time = timed(
+        lambda: [reference.tokenize(sent) for sent in sents],
+        repeat,
+    )
+    agreement = sum(a == b for a, b in zip(tokens, expected)) / len(sents)
+    print(f"{lang} (transformers): load {ref_load_time * 1000:.1f} ms, "
+          f"tokenize {ref_time * 1000:.1f} ms, agreement {agreement:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--langs", type=str, default=",".join(TOKENIZERS))
+    parser.add_argument("--copies", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="also time the transformers tokenizers, fetched from the hub",
+    )
+    args = parser.parse_args()
+
+    for lang in args.langs.split(","):
+        bench(lang, args.copies, args.repeat, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
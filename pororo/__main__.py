@@ -0,0 +1,5 @@
+import sys
+
+from pororo.cli import main
+
+sys.exit(main())
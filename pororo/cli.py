@@ -0,0 +1,161 @@
+"""Command line interface of Pororo
+
+Usage:
+    pororo fetch --tasks ner:ko,mt:multi [--dir DIR] [--workers 4]
+    pororo fetch --tasks ner:ko --dir DIR --offline
+    pororo export --tasks sentiment:ko,ner:ja --backend onnx
+
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional, Tuple
+
+BUNDLE_MANIFEST = "bundle.json"
+
+
+def parse_tasks(tasks: str) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Parse comma-separated `task:lang[:model]` specs
+
+    Args:
+        tasks (str): e.g. `ner:ko,mt:multi,tok:ko:bpe32k.ko`
+
+    Returns:
+        List[Tuple[str, str, Optional[str]]]: (task, lang, model) triples
+
+    """
+    specs = list()
+    for spec in tasks.split(","):
+        task, _, rest = spec.strip().partition(":")
+        lang, _, model = rest.partition(":")
+        specs.append((task, lang or "en", model or None))
+    return specs
+
+
+def fetch(args) -> int:
+    from pororo.pororo import resolve_assets
+    from pororo.tasks.utils.download_utils import (
+        download_assets,
+        get_save_dir,
+    )
+
+    if args.offline:
+        os.environ["PORORO_OFFLINE"] = "1"
+
+    specs = parse_tasks(args.tasks)
+    assets = resolve_assets(specs)
+    for n_model, lang in assets:
+        print(f"{lang}/{n_model}")
+    if args.list:
+        return 0
+
+    save_dir = get_save_dir(args.dir)
+    try:
+        download_assets(assets, save_dir, max_workers=args.workers)
+    except FileNotFoundError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    # Record what the bundle holds, so it can be checked or extended later
+    manifest_path = os.path.join(save_dir, BUNDLE_MANIFEST)
+    manifest = {"tasks": [], "assets": []}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    for key, items in [("tasks", specs), ("assets", assets)]:
+        for item in map(list, items):
+            if item not in manifest[key]:
+                manifest[key].append(item)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"{len(assets)} assets ready in {save_dir}", file=sys.stderr)
+    return 0
+
+
+def export(args) -> int:
+    from pororo import Pororo
+
+    # Graphs are exported next to the checkpoints when first loaded
+    for task, lang, model in parse_tasks(args.tasks):
+        try:
+            module = Pororo(
+                task,
+                lang=lang,
+                model=model,
+                quantize=args.quantize,
+                backend=args.backend,
+            )
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+
+        # Only heads run through `hub.predict` are exported
+        if not getattr(getattr(module, "_model", None), "_runtimes", None):
+            print(f"{task}:{lang} has no heads to export", file=sys.stderr)
+            return 1
+        print(f"{task}:{lang} exported with {args.backend}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="pororo")
+    commands = parser.add_subparsers(dest="command")
+
+    fetch_parser = commands.add_parser(
+        "fetch",
+        help="download every asset of the given tasks into a bundle directory",
+    )
+    fetch_parser.add_argument(
+        "--tasks",
+        required=True,
+        help="comma-separated task:lang[:model] list, e.g. ner:ko,mt:multi",
+    )
+    fetch_parser.add_argument(
+        "--dir",
+        default=None,
+        help="bundle directory, `PORORO_HOME` or ~/.pororo by default",
+    )
+    fetch_parser.add_argument("--workers", type=int, default=4)
+    fetch_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="only check that the bundle already holds every asset",
+    )
+    fetch_parser.add_argument(
+        "--list",
+        action="store_true",
+        help="only print the assets without downloading them",
+    )
+
+    export_parser = commands.add_parser(
+        "export",
+        help="export classification and tagging models of the given tasks to static graphs",
+    )
+    export_parser.add_argument(
+        "--tasks",
+        required=True,
+        help="comma-separated task:lang[:model] list, e.g. sentiment:ko,ner:ja",
+    )
+    export_parser.add_argument(
+        "--backend",
+        choices=["onnx", "torchscript"],
+        default="onnx",
+    )
+    export_parser.add_argument("--quantize", choices=["int8"], default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "fetch":
+        return fetch(args)
+    if args.command == "export":
+        return export(args)
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,6 @@
 # Copyright (c) SKT and its affiliates and Kakao Brain.
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import torch
 from transformers import (
@@ -9,6 +9,8 @@ from transformers import (
     PreTrainedTokenizerFast,
 )
 
+from pororo.tasks.utils.batching import plan_batches
+
 
 class KoBartModel(object):
     """KoBart Model from SKT"""
@@ -72,6 +74,30 @@ class KoBartModel(object):
 
         return self.add_bos_eos_tokens(tokens, eos_list)
 
+    def token_lengths(
+        self,
+        texts: List[str],
+        max_len: int = 1024,
+    ) -> List[int]:
+        """
+        Count the tokens `tokenize` gives each text, without padding
+
+        Args:
+            texts (List[str]): input texts
+            max_len (int): max token length (for truncation)
+
+        Returns:
+            List[int]: number of tokens of each text, including <s> and <eos>
+
+        """
+        tokens = self.tokenizer(
+            [f"<s> {text}" for text in texts],
+            truncation=True,
+            add_special_tokens=False,
+            max_length=max_len - 1,
+        )
+        return [len(input_id) + 1 for input_id in tokens["input_ids"]]
+
     def add_bos_eos_tokens(self, tokens, eos_list):
         input_ids = tokens["input_ids"]
         attention_mask = tokens["attention_mask"]
@@ -129,6 +155,9 @@ class KoBartModel(object):
         no_repeat_ngram_size: int = 4,
         return_tokens: bool = False,
         bad_words_ids=None,
+        batch_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_length: Optional[int] = None,
     ):
         """
         generate sentence from input sentence.
@@ -141,13 +170,16 @@ class KoBartModel(object):
             >>> from transformers.tokenization_mbart import FAIRSEQ_LANGUAGE_CODES
 
         Args:
-            text (str): input string
+            text (str): input string, or list of input strings
             beam (int): beam size
             sampling (bool): sampling or not
             temperature (float): temperature value
             sampling_topk (int): topk sampling
             sampling_topp (float): topp sampling probs
             return_tokens (bool): return tokens or not
+            batch_size (int): maximum number of texts per generation, all texts at once if neither this nor `max_tokens` is set
+            max_tokens (int): maximum number of (padded) source tokens per generation
+            max_length (int): maximum output length, `max_len_a` * longest text of each batch + `max_len_b` by default
 
         Returns:
             (str): generated sentence string (if return_tokens=False)
@@ -160,47 +192,51 @@ class KoBartModel(object):
         else:
             texts = text
 
-        tokenized = self.tokenize(texts)
-        input_ids = tokenized["input_ids"]
-        attention_mask = tokenized["attention_mask"]
-
-        generated = self.model.generate(
-            input_ids.to(self.device),
-            attention_mask=attention_mask.to(self.device),
-            use_cache=True,
-            early_stopping=False,
-            decoder_start_token_id=self.tokenizer.bos_token_id,
-            num_beams=beam,
-            do_sample=sampling,
-            temperature=temperature,
-            top_k=sampling_topk if sampling_topk > 0 else None,
-            top_p=sampling_topp if sampling_topk > 0 else None,
-            no_repeat_ngram_size=no_repeat_ngram_size,
-            bad_words_ids=[[self.tokenizer.convert_tokens_to_ids("<unk>")]]
-            if not bad_words_ids else bad_words_ids +
-            [[self.tokenizer.convert_tokens_to_ids("<unk>")]],
-            length_penalty=length_penalty,
-            max_length=max_len_a * len(input_ids[0]) + max_len_b,
+        # Texts of similar length are generated together, so short texts
+        # are neither padded nor given the output length of long ones
+        lengths = self.token_lengths(texts)
+        plan = plan_batches(
+            lengths,
+            batch_size=batch_size if batch_size or max_tokens else len(texts),
+            max_tokens=max_tokens,
         )
 
-        if return_tokens:
-            output = [
-                self.tokenizer.convert_ids_to_tokens(_)
-                for _ in generated.tolist()
-            ]
-
-            return (output[0] if isinstance(
-                text,
-                str,
-            ) else output)
-
-        else:
-            output = self.tokenizer.batch_decode(
-                generated.tolist(),
-                skip_special_tokens=True,
+        output = list()
+        for batch in plan:
+            tokenized = self.tokenize([texts[i] for i in batch])
+            input_ids = tokenized["input_ids"]
+            attention_mask = tokenized["attention_mask"]
+
+            generated = self.model.generate(
+                input_ids.to(self.device),
+                attention_mask=attention_mask.to(self.device),
+                use_cache=True,
+                early_stopping=False,
+                decoder_start_token_id=self.tokenizer.bos_token_id,
+                num_beams=beam,
+                do_sample=sampling,
+                temperature=temperature,
+                top_k=sampling_topk if sampling_topk > 0 else None,
+                top_p=sampling_topp if sampling_topk > 0 else None,
+                no_repeat_ngram_size=no_repeat_ngram_size,
+                bad_words_ids=[[self.tokenizer.convert_tokens_to_ids("<unk>")]]
+                if not bad_words_ids else bad_words_ids +
+                [[self.tokenizer.convert_tokens_to_ids("<unk>")]],
+                length_penalty=length_penalty,
+                max_length=max_length or
+                max_len_a * max(lengths[i] for i in batch) + max_len_b,
             )
 
-            return (output[0].strip() if isinstance(
-                text,
-                str,
-            ) else [o.strip() for o in output])
+            if return_tokens:
+                output.extend(
+                    self.tokenizer.convert_ids_to_tokens(_)
+                    for _ in generated.tolist())
+            else:
+                output.extend(
+                    o.strip() for o in self.tokenizer.batch_decode(
+                        generated.tolist(),
+                        skip_special_tokens=True,
+                    ))
+
+        output = plan.restore(output)
+        return output[0] if isinstance(text, str) else output
@@ -11,6 +11,8 @@ import torch.utils.data
 import torchvision.transforms as transforms
 from PIL import Image
 
+from pororo.tasks.utils.batching import plan_batches
+
 from .model import Model
 from .utils import CTCLabelConverter
 
@@ -83,11 +85,17 @@ class AlignCollate(object):
         self.keep_ratio_with_pad = True  # Do Not Change
         self.adjust_contrast = adjust_contrast
 
+    def resized_width(self, w: int, h: int) -> int:
+        """Width of an image once resized to `imgH` with its aspect ratio kept"""
+        ratio = w / float(h)
+        return min(math.ceil(self.imgH * ratio), self.imgW)
+
     def __call__(self, batch):
         batch = filter(lambda x: x is not None, batch)
-        images = batch
+        images = list(batch)
 
-        resized_max_w = self.imgW
+        # Images are only padded to the widest of the batch
+        resized_max_w = max(self.resized_width(*image.size) for image in images)
         input_channel = 1
         transform = NormalizePAD((input_channel, self.imgH, resized_max_w))
 
@@ -100,12 +108,7 @@ class AlignCollate(object):
                 image = adjust_contrast_grey(image, target=self.adjust_contrast)
                 image = Image.fromarray(image, "L")
 
-            ratio = w / float(h)
-            if math.ceil(self.imgH * ratio) > self.imgW:
-                resized_w = self.imgW
-            else:
-                resized_w = math.ceil(self.imgH * ratio)
-
+            resized_w = self.resized_width(w, h)
             resized_image = image.resize((resized_w, self.imgH), Image.BICUBIC)
             resized_images.append(transform(resized_image))
 
@@ -198,19 +201,27 @@ def get_text(image_list, recognizer, converter, opt2val: dict):
 
     coord = [item[0] for item in image_list]
     img_list = [item[1] for item in image_list]
-    AlignCollate_normal = AlignCollate(imgH, imgW, adjust_contrast)
-    test_data = ListDataset(img_list)
-    test_loader = torch.utils.data.DataLoader(
-        test_data,
-        batch_size=batch_size,
-        shuffle=False,
-        num_workers=n_workers,
-        collate_fn=AlignCollate_normal,
-        pin_memory=True,
-    )
+    align_collate = AlignCollate(imgH, imgW, adjust_contrast)
+
+    def _recognize(images: list) -> list:
+        # Images of similar width are batched together to minimize padding
+        plan = plan_batches(
+            [align_collate.resized_width(img.shape[1], img.shape[0])
+             for img in images],
+            batch_size=batch_size,
+        )
+        test_loader = torch.utils.data.DataLoader(
+            ListDataset(images),
+            batch_sampler=plan.batches,
+            num_workers=n_workers,
+            collate_fn=align_collate,
+            pin_memory=True,
+        )
+        return plan.restore(
+            recognizer_predict(recognizer, converter, test_loader, opt2val))
 
     # predict first round
-    result1 = recognizer_predict(recognizer, converter, test_loader, opt2val)
+    result1 = _recognize(img_list)
 
     # predict second round
     low_confident_idx = [
@@ -218,18 +229,7 @@ def get_text(image_list, recognizer, converter, opt2val: dict):
     ]
     if len(low_confident_idx) > 0:
         img_list2 = [img_list[i] for i in low_confident_idx]
-        AlignCollate_contrast = AlignCollate(imgH, imgW, adjust_contrast)
-        test_data = ListDataset(img_list2)
-        test_loader = torch.utils.data.DataLoader(
-            test_data,
-            batch_size=batch_size,
-            shuffle=False,
-            num_workers=n_workers,
-            collate_fn=AlignCollate_contrast,
-            pin_memory=True,
-        )
-        result2 = recognizer_predict(recognizer, converter, test_loader,
-                                     opt2val)
+        result2 = _recognize(img_list2)
 
     result = []
     for i, zipped in enumerate(zip(coord, result1)):
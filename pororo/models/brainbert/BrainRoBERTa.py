@@ -1,12 +1,17 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
-from typing import Dict, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
 from fairseq.models.roberta import RobertaHubInterface, RobertaModel
 
-from pororo.models.brainbert.utils import softmax
+from pororo.models.brainbert.utils import (
+    BatchedHubMixin,
+    quantize_hub,
+    softmax,
+)
+from pororo.tasks.utils.batching import bucket_by_length
 from pororo.tasks.utils.download_utils import download_or_load
 from pororo.tasks.utils.tokenizer import CustomTokenizer
 
@@ -22,10 +27,19 @@ class BrainRobertaModel(RobertaModel):
     """
 
     @classmethod
-    def load_model(cls, model_name: str, lang: str, **kwargs):
+    def load_model(
+        cls,
+        model_name: str,
+        lang: str,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
+        **kwargs,
+    ):
         """
         Load pre-trained model as RobertaHubInterface.
         :param model_name: model name from available_models
+        :param quantize: `int8` to quantize linear layers dynamically for CPU inference
+        :param backend: `onnx` or `torchscript` to run heads through an exported graph on CPU
         :return: pre-trained model
         """
         from fairseq import hub_utils
@@ -40,15 +54,18 @@ class BrainRobertaModel(RobertaModel):
             load_checkpoint_heads=True,
             **kwargs,
         )
-        return BrainRobertaHubInterface(
-            x["args"],
-            x["task"],
-            x["models"][0],
-            tok_path,
-        )
+        return quantize_hub(
+            BrainRobertaHubInterface(
+                x["args"],
+                x["task"],
+                x["models"][0],
+                tok_path,
+            ),
+            quantize,
+        ).use_backend(backend, ckpt_dir)
 
 
-class BrainRobertaHubInterface(RobertaHubInterface):
+class BrainRobertaHubInterface(BatchedHubMixin, RobertaHubInterface):
 
     def __init__(self, args, task, model, tok_path):
         super().__init__(args, task, model)
@@ -56,6 +73,11 @@ class BrainRobertaHubInterface(RobertaHubInterface):
             vocab_filename=f"{tok_path}/vocab.json",
             merges_filename=f"{tok_path}/merges.txt",
         )
+        self.id_map = self.build_id_map(self.bpe.get_vocab())
+
+    def token_ids(self, sentences: List[str]) -> List[List[int]]:
+        # Rust tokenizer encodes the batch across threads
+        return [encoding.ids for encoding in self.bpe.encode_batch(sentences)]
 
     def tokenize(self, sentence: str, add_special_tokens: bool = False):
         result = " ".join(self.bpe.encode(sentence).tokens)
@@ -86,21 +108,11 @@ class BrainRobertaHubInterface(RobertaHubInterface):
             >>> roberta.encode('world').tolist()
             [0, 8331, 2]
         """
-        bpe_sentence = self.tokenize(
-            sentence,
+        return self.encode_ids(
+            [(sentence, *addl_sentences)],
             add_special_tokens=add_special_tokens,
-        )
-
-        for s in addl_sentences:
-            bpe_sentence += " </s>" if not no_separator and add_special_tokens else ""
-            bpe_sentence += (" " + self.tokenize(s, add_special_tokens=False) +
-                             " </s>" if add_special_tokens else "")
-        tokens = self.task.source_dictionary.encode_line(
-            bpe_sentence,
-            append_eos=False,
-            add_if_not_exist=False,
-        )
-        return tokens.long()
+            no_separator=no_separator,
+        )[0]
 
     def decode(
         self,
@@ -145,12 +157,13 @@ class BrainRobertaHubInterface(RobertaHubInterface):
     @torch.no_grad()
     def predict_output(
         self,
-        sentence: str,
+        sentence: Union[str, List],
         *addl_sentences,
         add_special_tokens: bool = True,
         no_separator: bool = False,
         show_probs: bool = False,
-    ) -> Union[str, Dict]:
+        batch_size: int = 32,
+    ) -> Union[str, Dict, List]:
         """Predict output, either a classification label or regression target,
          using a fine-tuned sentence prediction model.
         :returns output
@@ -177,6 +190,15 @@ class BrainRobertaHubInterface(RobertaHubInterface):
             "sentence_classification_head" in self.model.classification_heads
         ), "need pre-trained sentence_classification_head to make predictions"
 
+        if isinstance(sentence, list):
+            return self.predict_output_batch(
+                sentence,
+                batch_size=batch_size,
+                show_probs=show_probs,
+                add_special_tokens=add_special_tokens,
+                no_separator=no_separator,
+            )
+
         tokens = self.encode(
             sentence,
             *addl_sentences,
@@ -204,16 +226,65 @@ class BrainRobertaHubInterface(RobertaHubInterface):
 
         return label_fn(prediction.argmax().item())  # str
 
-    @torch.no_grad()
-    def predict_span(
+    def encode_windows(
         self,
         question: str,
         context: str,
         add_special_tokens: bool = True,
         no_separator: bool = False,
-    ) -> Tuple:
+        doc_stride: int = 128,
+    ) -> List[Tuple[torch.LongTensor, int, int]]:
+        """
+        Encode the question once and tile the context into overlapping windows
+        that fit in `max_positions`
+
+        Args:
+            question (str): question string
+            context (str): context string
+            doc_stride (int): number of context tokens between the starts of two consecutive windows
+
+        Returns:
+            List[Tuple[torch.LongTensor, int, int]]: tokens of each window, index of its first context token and the context offset of the window
+
+        """
+        dictionary = self.task.source_dictionary
+        prefix = self.encode(question, add_special_tokens=add_special_tokens)
+        if add_special_tokens and not no_separator:
+            prefix = torch.cat([prefix, prefix.new_tensor([dictionary.eos()])])
+        suffix = prefix.new_tensor(
+            [dictionary.eos()] if add_special_tokens else [])
+        context = self.encode(context, add_special_tokens=False)
+
+        window = self.task.max_positions() - len(prefix) - len(suffix)
+        assert window > 0, "question is too long to leave room for the context"
+        doc_stride = min(doc_stride, window)
+
+        windows, offset = [], 0
+        while True:
+            tokens = torch.cat(
+                [prefix, context[offset:offset + window], suffix])
+            windows.append((tokens, len(prefix), offset))
+            if offset + window >= len(context):
+                break
+            offset += doc_stride
+        return windows
+
+    @torch.no_grad()
+    def predict_span(
+        self,
+        question: Union[str, List[Tuple[str, str]]],
+        context: Optional[str] = None,
+        add_special_tokens: bool = True,
+        no_separator: bool = False,
+        doc_stride: int = 128,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
+    ) -> Union[Tuple, List[Tuple]]:
         """
         Predict span from context using a fine-tuned span prediction model.
+        Contexts longer than `max_positions` are tiled into overlapping windows,
+        all of which run in batched forward passes, and the span with the best
+        start + end logit across the windows is returned.
 
         :returns answer
             str
@@ -227,26 +298,51 @@ class BrainRobertaHubInterface(RobertaHubInterface):
         한국어
 
         """
-
-        max_length = self.task.max_positions()
-        tokens = self.encode(
-            question,
-            context,
-            add_special_tokens=add_special_tokens,
-            no_separator=no_separator,
-        )[:max_length]
-        with torch.no_grad():
+        pairs = [(question, context)] if isinstance(question, str) else question
+
+        windows, owners = [], []
+        for i, (q, c) in enumerate(pairs):
+            for window in self.encode_windows(
+                    q,
+                    c,
+                    add_special_tokens=add_special_tokens,
+                    no_separator=no_separator,
+                    doc_stride=doc_stride,
+            ):
+                windows.append(window)
+                owners.append(i)
+
+        n_suffix = 1 if add_special_tokens else 0
+        # (score, window index, start, end) of the best span of each pair
+        best = [None] * len(pairs)
+        lengths = [len(tokens) for tokens, _, _ in windows]
+        for batch in bucket_by_length(lengths, batch_size, max_tokens):
             logits = self.predict(
                 "span_prediction_head",
-                tokens,
+                self.collate([windows[i][0] for i in batch]),
                 return_logits=True,
-            ).squeeze()  # T x 2
-            # first predict start position,
-            # then predict end position among the remaining logits
-            start = logits[:, 0].argmax().item()
-            mask = (torch.arange(
-                logits.size(0), dtype=torch.long, device=self.device) >= start)
-            end = (mask * logits[:, 1]).argmax().item()
+            )  # B x T x 2
+            for i, logit in zip(batch, logits):
+                # only context tokens can be part of the answer
+                lo, hi = windows[i][1], lengths[i] - n_suffix
+                if hi <= lo:
+                    continue
+                # first predict start position,
+                # then predict end position among the remaining logits
+                start = lo + logit[lo:hi, 0].argmax().item()
+                end = start + logit[start:hi, 1].argmax().item()
+                score = (logit[start, 0] + logit[end, 1]).item()
+                if best[owners[i]] is None or score > best[owners[i]][0]:
+                    best[owners[i]] = (score, i, start, end)
+
+        results = []
+        for span in best:
+            if span is None:
+                results.append(("", (0, 0)))
+                continue
+
+            _, i, start, end = span
+            tokens, _, offset = windows[i]
             # end position is shifted during training, so we add 1 back
             answer_tokens = tokens[start:end + 1]
 
@@ -256,33 +352,7 @@ class BrainRobertaHubInterface(RobertaHubInterface):
                 if isinstance(decoded, str):
                     answer = decoded
 
-        return (answer, (start, end + 1))
-
-    @torch.no_grad()
-    def predict_tags(
-        self,
-        sentence: str,
-        add_special_tokens: bool = True,
-        no_separator: bool = False,
-    ):
-        tokens = self.encode(
-            sentence,
-            add_special_tokens=add_special_tokens,
-            no_separator=no_separator,
-        )
-
-        label_fn = lambda label: self.task.label_dictionary.string([label])
+            # indices are given in the unwindowed `encode(question, context)`
+            results.append((answer, (start + offset, end + offset + 1)))
 
-        # Get first batch and ignore <s> & </s> tokens
-        preds = (self.predict(
-            "sequence_tagging_head",
-            tokens,
-        )[0, 1:-1, :].argmax(dim=1).cpu().numpy())
-        labels = [
-            label_fn(int(pred) + self.task.label_dictionary.nspecial)
-            for pred in preds
-        ]
-        return [(
-            token,
-            label,
-        ) for token, label in zip(self.tokenize(sentence).split(), labels)]
+        return results[0] if isinstance(question, str) else results
@@ -1,12 +1,17 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import torch
 from fairseq.models.roberta import RobertaHubInterface, RobertaModel
 
-from pororo.models.brainbert.utils import CustomChar, softmax
+from pororo.models.brainbert.utils import (
+    BatchedHubMixin,
+    CustomChar,
+    quantize_hub,
+    softmax,
+)
 from pororo.tasks.utils.download_utils import download_or_load
 
 
@@ -38,10 +43,19 @@ class CharBrainRobertaModel(RobertaModel):
     """
 
     @classmethod
-    def load_model(cls, model_name: str, lang: str, **kwargs):
+    def load_model(
+        cls,
+        model_name: str,
+        lang: str,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
+        **kwargs,
+    ):
         """
         Load pre-trained model as RobertaHubInterface.
         :param model_name: model name from available_models
+        :param quantize: `int8` to quantize linear layers dynamically for CPU inference
+        :param backend: `onnx` or `torchscript` to run heads through an exported graph on CPU
         :return: pre-trained model
         """
         from fairseq import hub_utils
@@ -54,14 +68,17 @@ class CharBrainRobertaModel(RobertaModel):
             **kwargs,
         )
 
-        return CharBrainRobertaHubInterface(
-            x["args"],
-            x["task"],
-            x["models"][0],
-        )
+        return quantize_hub(
+            CharBrainRobertaHubInterface(
+                x["args"],
+                x["task"],
+                x["models"][0],
+            ),
+            quantize,
+        ).use_backend(backend, ckpt_dir)
 
 
-class CharBrainRobertaHubInterface(RobertaHubInterface):
+class CharBrainRobertaHubInterface(BatchedHubMixin, RobertaHubInterface):
 
     def __init__(self, args, task, model):
         super().__init__(args, task, model)
@@ -145,12 +162,13 @@ class CharBrainRobertaHubInterface(RobertaHubInterface):
     @torch.no_grad()
     def predict_output(
         self,
-        sentence: str,
+        sentence: Union[str, List],
         *addl_sentences,
         add_special_tokens: bool = True,
         no_separator: bool = False,
         show_probs: bool = False,
-    ) -> Union[str, Dict]:
+        batch_size: int = 32,
+    ) -> Union[str, Dict, List]:
         """Predict output, either a classification label or regression target,
          using a fine-tuned sentence prediction model.
         :returns output
@@ -170,6 +188,15 @@ class CharBrainRobertaHubInterface(RobertaHubInterface):
             0.8374465107917786
 
         """
+        if isinstance(sentence, list):
+            return self.predict_output_batch(
+                sentence,
+                batch_size=batch_size,
+                show_probs=show_probs,
+                add_special_tokens=add_special_tokens,
+                no_separator=no_separator,
+            )
+
         tokens = self.encode(
             sentence,
             *addl_sentences,
@@ -199,71 +226,3 @@ class CharBrainRobertaHubInterface(RobertaHubInterface):
                 prediction = label_fn(prediction.argmax().item())  # str
 
         return prediction
-
-    @torch.no_grad()
-    def predict_tags(
-        self,
-        sentence: Union[List[str], str],
-        add_special_tokens: bool = True,
-        no_separator: bool = False,
-    ):
-        label_fn = lambda label: self.task.label_dictionary.string([label])
-
-        if isinstance(sentence, list):
-            lengths = [len(self.tokenize(sent).split()) for sent in sentence]
-            max_len = max(lengths)
-            res_sentence = []
-            for sent in sentence:
-                tokens = self.encode(
-                    sent,
-                    add_special_tokens=add_special_tokens,
-                    no_separator=no_separator,
-                )
-                to_pad = max_len - (len(tokens) - 2)
-                pad_tokens = [self.task.source_dictionary.index("<pad>")
-                             ] * to_pad
-                if pad_tokens:
-                    tokens = torch.cat([tokens, torch.tensor(pad_tokens)])
-                res_sentence.append(tokens)
-            li_sentence = torch.stack(res_sentence)
-
-            results = (self.predict(
-                "sequence_tagging_head",
-                li_sentence,
-            )[:, 1:-1, :].argmax(dim=-1).cpu().numpy())
-            # yapf: disable
-            labels = [
-                [
-                    label_fn(int(pred) + self.task.label_dictionary.nspecial)
-                    for pred in preds
-                ] for preds in results
-            ]
-
-            return [
-                [
-                    (token, label)
-                    for token, label in zip(self.tokenize(sent).split(), label)
-                ] for sent, label in zip(sentence, labels)
-            ]
-            # yapf: enable
-
-        tokens = self.encode(
-            sentence,
-            add_special_tokens=add_special_tokens,
-            no_separator=no_separator,
-        )
-
-        # Get first batch and ignore <s> & </s> tokens
-        preds = (self.predict(
-            "sequence_tagging_head",
-            tokens,
-        )[0, 1:-1, :].argmax(dim=1).cpu().numpy())
-        labels = [
-            label_fn(int(pred) + self.task.label_dictionary.nspecial)
-            for pred in preds
-        ]
-
-        return [
-            (token, label)
-            for token, label in zip(self.tokenize(sentence).split(), labels)
-        ]
@@ -1,24 +1,36 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
-from typing import Dict, Union
+from typing import Dict, List, Optional, Union
 
 import torch
 import torch.nn as nn
-from fairseq import utils
 from fairseq.models.roberta import RobertaModel
 from fairseq.models.roberta.hub_interface import RobertaHubInterface
 
-from pororo.models.brainbert.utils import softmax
+from pororo.models.brainbert.utils import (
+    BatchedHubMixin,
+    quantize_hub,
+    softmax,
+)
 from pororo.tasks.utils.download_utils import download_or_load
 
 
 class CustomRobertaModel(RobertaModel):
 
     @classmethod
-    def load_model(cls, model_name: str, lang: str, **kwargs):
+    def load_model(
+        cls,
+        model_name: str,
+        lang: str,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
+        **kwargs,
+    ):
         """
         Load pre-trained model as RobertaHubInterface.
         :param model_name: model name from available_models
+        :param quantize: `int8` to quantize linear layers dynamically for CPU inference
+        :param backend: `onnx` or `torchscript` to run heads through an exported graph on CPU
         :return: pre-trained model
         """
         from fairseq import hub_utils
@@ -31,10 +43,13 @@ class CustomRobertaModel(RobertaModel):
             load_checkpoint_heads=True,
             **kwargs,
         )
-        return CustomRobertaHubInterface(x["args"], x["task"], x["models"][0])
+        return quantize_hub(
+            CustomRobertaHubInterface(x["args"], x["task"], x["models"][0]),
+            quantize,
+        ).use_backend(backend, ckpt_dir)
 
 
-class CustomRobertaHubInterface(RobertaHubInterface):
+class CustomRobertaHubInterface(BatchedHubMixin, RobertaHubInterface):
 
     def __init__(self, args, task, model):
         args.bpe.gpt2_encoder_json = download_or_load("misc/encoder.json", "en")
@@ -45,11 +60,12 @@ class CustomRobertaHubInterface(RobertaHubInterface):
     @torch.no_grad()
     def predict_output(
         self,
-        sentence: str,
+        sentence: Union[str, List],
         *addl_sentences,
         no_separator: bool = False,
         show_probs: bool = False,
-    ) -> Union[str, Dict]:
+        batch_size: int = 32,
+    ) -> Union[str, Dict, List]:
         assert self.model.encoder.args.task == "sentence_prediction", (
             "predict_output() only works for sentence prediction tasks.\n"
             "Use predict() to obtain model outputs; "
@@ -58,6 +74,14 @@ class CustomRobertaHubInterface(RobertaHubInterface):
             "sentence_classification_head" in self.model.classification_heads
         ), "need pre-trained sentence_classification_head to make predictions"
 
+        if isinstance(sentence, list):
+            return self.predict_output_batch(
+                sentence,
+                batch_size=batch_size,
+                show_probs=show_probs,
+                no_separator=no_separator,
+            )
+
         tokens = self.encode(
             sentence,
             *addl_sentences,
@@ -85,76 +109,24 @@ class CustomRobertaHubInterface(RobertaHubInterface):
 
         return label_fn(prediction.argmax().item())  # str
 
-    def fill_mask(self, masked_input: str, topk: int = 5):
-        masked_token = "<mask>"
-        masked_input = masked_input.replace("__", masked_token)
+    def tokenize_span(self, text: str) -> str:
+        return self.bpe.encode(text)
 
-        assert (
-            masked_token in masked_input and
-            masked_input.count(masked_token) == 1
-        ), "Please add one {0} token for the input, eg: 'He is a {0} guy'".format(
-            masked_token)
-
-        text_spans = masked_input.split(masked_token)
-        text_spans_bpe = ((" {0} ".format(masked_token)).join([
-            self.bpe.encode(text_span.rstrip()) for text_span in text_spans
-        ]).strip())
-        tokens = self.task.source_dictionary.encode_line(
-            "<s> " + text_spans_bpe + " </s>",
-            append_eos=False,
-            add_if_not_exist=False,
-        )
+    def encode_masked(self, masked_input: str) -> torch.LongTensor:
+        return super().encode_masked(masked_input.replace("<mask>", "__"))
 
-        masked_index = torch.nonzero(
-            tokens == self.task.mask_idx,
-            as_tuple=False,
-        )
+    def decode_candidate(self, index: int) -> str:
+        predicted_token_bpe = self.task.source_dictionary[index]
+        if not predicted_token_bpe.isdigit():
+            return predicted_token_bpe  # special symbols are not GPT-2 BPE
 
-        if tokens.dim() == 1:
-            tokens = tokens.unsqueeze(0)
-
-        with utils.model_eval(self.model):
-            features, _ = self.model(
-                tokens.long().to(device=self.device),
-                features_only=False,
-                return_all_hiddens=False,
-            )
-
-        logits = features[0, masked_index, :].squeeze()
-        prob = logits.softmax(dim=0)
-        _, index = prob.topk(k=topk, dim=0)
-        topk_predicted_token_bpe = self.task.source_dictionary.string(index)
-
-        topk_filled_outputs = []
-        for index, predicted_token_bpe in enumerate(
-                topk_predicted_token_bpe.split(" ")):
-            predicted_token = self.bpe.decode(predicted_token_bpe)
-            # Quick hack to fix https://github.com/pytorch/fairseq/issues/1306
-            if predicted_token_bpe.startswith("\u2581"):
-                predicted_token = " " + predicted_token
-            if " {0}".format(masked_token) in masked_input:
-                topk_filled_outputs.append(predicted_token)
-            else:
-                topk_filled_outputs.append(predicted_token)
-        return topk_filled_outputs
-
-    @torch.no_grad()
-    def predict_tags(self, sentence: str, no_separator: bool = False):
-        label_fn = lambda label: self.task.label_dictionary.string([label])
+        predicted_token = self.bpe.decode(predicted_token_bpe)
+        # Quick hack to fix https://github.com/pytorch/fairseq/issues/1306
+        if predicted_token_bpe.startswith("\u2581"):
+            predicted_token = " " + predicted_token
+        return predicted_token
 
+    def encode_tags(self, sentence: str, no_separator: bool = False):
         tokens = self.encode(sentence, no_separator=no_separator)
-
-        # Get first batch and ignore <s> & </s> tokens
-        preds = (self.predict(
-            "sequence_tagging_head",
-            tokens,
-        )[0, 1:-1, :].argmax(dim=1).cpu().numpy())
-        labels = [
-            label_fn(int(pred) + self.task.label_dictionary.nspecial)
-            for pred in preds
-        ]
-
-        return [(
-            self.decode(token.unsqueeze(0)),
-            label,
-        ) for token, label in zip(tokens[1:-1], labels)]
+        words = [self.decode(token.unsqueeze(0)) for token in tokens[1:-1]]
+        return tokens, words
@@ -1,8 +1,11 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
+from typing import Optional
+
 import torch
 from fairseq.models.roberta import RobertaHubInterface, RobertaModel
 
+from pororo.models.brainbert.utils import BatchedHubMixin, quantize_hub
 from pororo.tasks.tokenization import PororoTokenizationFactory
 from pororo.tasks.utils.download_utils import download_or_load
 
@@ -18,10 +21,17 @@ class PosRobertaModel(RobertaModel):
     """
 
     @classmethod
-    def load_model(cls, model_name: str, lang: str, **kwargs):
+    def load_model(
+        cls,
+        model_name: str,
+        lang: str,
+        quantize: Optional[str] = None,
+        **kwargs,
+    ):
         """
         Load pre-trained model as RobertaHubInterface.
         :param model_name: model name from available_models
+        :param quantize: `int8` to quantize linear layers dynamically for CPU inference
         :return: pre-trained model
         """
         from fairseq import hub_utils
@@ -35,15 +45,18 @@ class PosRobertaModel(RobertaModel):
             load_checkpoint_heads=True,
             **kwargs,
         )
-        return PosRobertaHubInterface(
-            x["args"],
-            x["task"],
-            x["models"][0],
-            lang,
+        return quantize_hub(
+            PosRobertaHubInterface(
+                x["args"],
+                x["task"],
+                x["models"][0],
+                lang,
+            ),
+            quantize,
         )
 
 
-class PosRobertaHubInterface(RobertaHubInterface):
+class PosRobertaHubInterface(BatchedHubMixin, RobertaHubInterface):
 
     def __init__(self, args, task, model, lang):
         super().__init__(args, task, model)
@@ -58,45 +71,10 @@ class PosRobertaHubInterface(RobertaHubInterface):
         result = " ".join([token for token in self.bpe(sentence)])
         return f"<s> {result} </s>" if add_special_tokens else result
 
-    def fill_mask(self, masked_input: str, topk: int = 15):
-        mask = "__"
-        assert (mask in masked_input and masked_input.count(mask)
-                == 1), "Please add one {0} token for the input".format(mask)
-
-        text_spans = masked_input.split(mask)
-        text_spans_bpe = ((" {0} ".format("<mask>")).join([
-            " ".join([
-                token if token != " " else "▃"
-                for token in self.bpe(text_span.rstrip())
-            ])
-            for text_span in text_spans
-        ]).strip())
-
-        tokens = self.task.source_dictionary.encode_line(
-            "<s> " + text_spans_bpe + " </s>",
-            append_eos=False,
-            add_if_not_exist=False,
-        )
-
-        masked_index = torch.nonzero(
-            tokens == self.task.mask_idx,
-            as_tuple=False,
-        )
-
-        if tokens.dim() == 1:
-            tokens = tokens.unsqueeze(0)
-
-        with torch.no_grad():
-            features, _ = self.model(
-                tokens.long().to(device=self.device),
-                features_only=False,
-                return_all_hiddens=False,
-            )
-        logits = features[0, masked_index, :].squeeze()
-        prob = logits.softmax(dim=0)
-        _, index = prob.topk(k=topk, dim=0)
-        topk_predicted_token_bpe = self.task.source_dictionary.string(index)
-        return [bpe for bpe in topk_predicted_token_bpe.split()]
+    def tokenize_span(self, text: str) -> str:
+        return " ".join([
+            token if token != " " else "▃" for token in self.bpe(text)
+        ])
 
     def encode(
         self,
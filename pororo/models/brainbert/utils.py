@@ -1,10 +1,16 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
+import os
 import re
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
+import torch
+from fairseq.data.data_utils import collate_tokens
 from fairseq.data.encoders import register_bpe
 
+from pororo.tasks.utils.batching import bucket_by_length
+
 
 @register_bpe("custom_char")
 class CustomChar(object):
@@ -49,3 +55,588 @@ def softmax(a):
     sum_exp_a = np.sum(exp_a)
     y = exp_a / sum_exp_a
     return np.squeeze(y)
+
+
+def quantize_hub(hub, quantize: Optional[str] = None):
+    """
+    Apply dynamic quantization to the linear layers of a RoBERTa hub interface,
+    which keeps their weights in int8 and runs them with int8 kernels on CPU
+
+    Args:
+        hub (RobertaHubInterface): hub interface to be quantized in place
+        quantize (str): `int8`, or None to keep the fp32 model
+
+    Returns:
+        RobertaHubInterface: the given hub interface
+
+    """
+    if quantize is None:
+        return hub
+
+    assert quantize == "int8", f"Unknown quantize option {quantize}"
+    hub.quantize = quantize
+
+    # Fast path of fairseq attention reads `q_proj.weight` etc. directly,
+    # which quantized linear layers don't expose as a tensor
+    for module in hub.model.modules():
+        if hasattr(module, "enable_torch_version"):
+            module.enable_torch_version = False
+
+    hub.model.cpu().eval()
+    torch.quantization.quantize_dynamic(
+        hub.model,
+        {torch.nn.Linear},
+        dtype=torch.qint8,
+        inplace=True,
+    )
+    return hub
+
+
+# Runtime backend to the extension of its exported graph
+BACKENDS = {"onnx": "onnx", "torchscript": "pt"}
+
+
+class HeadGraph(torch.nn.Module):
+    """Encoder and one head of a fairseq RoBERTa model as a single graph"""
+
+    def __init__(self, model, head: str):
+        super().__init__()
+        self.model = model
+        self.head = head
+
+    def forward(self, tokens: torch.LongTensor) -> torch.Tensor:
+        logits, _ = self.model(
+            tokens,
+            features_only=True,
+            classification_head_name=self.head,
+        )
+        return logits
+
+
+def export_head(
+    model,
+    head: str,
+    backend: str,
+    path: str,
+    example: torch.LongTensor,
+):
+    """
+    Trace the encoder and `head` of `model` into a static graph with dynamic
+    batch and sequence axes, and save it to `path`
+
+    Args:
+        model (RobertaModel): fine-tuned model to be exported, left untouched
+        head (str): name of the classification head
+        backend (str): `onnx` or `torchscript`
+        path (str): path of the exported graph
+        example (torch.LongTensor): `B x T` padded tokens to be traced with
+
+    """
+    import copy
+
+    graph = HeadGraph(copy.deepcopy(model).cpu().eval(), head)
+    # Keep the padding mask branch of the encoder in the graph
+    encoder = getattr(graph.model, "encoder", None)
+    if hasattr(getattr(encoder, "sentence_encoder", None), "traceable"):
+        encoder.sentence_encoder.traceable = True
+
+    tmp_path = f"{path}.tmp"
+    with torch.no_grad():
+        if backend == "torchscript":
+            traced = torch.jit.trace(graph, example, check_trace=False)
+            torch.jit.save(traced, tmp_path)
+        else:
+            graph.model.prepare_for_onnx_export_()
+            axes = {0: "batch", 1: "length"}
+            # sentence heads have no length axis
+            logits_axes = axes if graph(example).dim() == 3 else {0: "batch"}
+            torch.onnx.export(
+                graph,
+                (example,),
+                tmp_path,
+                input_names=["tokens"],
+                output_names=["logits"],
+                dynamic_axes={"tokens": axes, "logits": logits_axes},
+                opset_version=12,
+            )
+    os.replace(tmp_path, path)
+
+
+class HeadRuntime(object):
+    """Run an exported head graph on CPU, returning logits as torch tensor"""
+
+    def __init__(self, backend: str, path: str):
+        self.backend = backend
+        if backend == "torchscript":
+            self.graph = torch.jit.load(path, map_location="cpu")
+        else:
+            try:
+                import onnxruntime
+            except ImportError:
+                raise ImportError(
+                    "Please install onnxruntime with: `pip install onnxruntime`"
+                )
+            self.graph = onnxruntime.InferenceSession(
+                path,
+                providers=["CPUExecutionProvider"],
+            )
+
+    def __call__(self, tokens: torch.LongTensor) -> torch.Tensor:
+        tokens = tokens.cpu()
+        if self.backend == "torchscript":
+            with torch.no_grad():
+                return self.graph(tokens)
+        logits = self.graph.run(["logits"], {"tokens": tokens.numpy()})[0]
+        return torch.from_numpy(logits)
+
+
+class BatchedHubMixin(object):
+    """
+    Batched inference helpers shared by the BrainBERT family hub interfaces.
+    Samples are sorted by length, padded only up to the longest sample of
+    each mini-batch and returned in the original input order.
+
+    Heads can also run through a graph exported with `use_backend`.
+
+    """
+
+    backend = None
+    quantize = None
+    id_map = None
+
+    def use_backend(self, backend: Optional[str], export_dir: str):
+        """
+        Run every classification head through a static graph, exported to
+        (or loaded from) `export_dir` next to the checkpoint
+
+        Args:
+            backend (str): `onnx` or `torchscript`, None to keep fairseq
+            export_dir (str): directory of the exported graphs
+
+        Returns:
+            the hub interface itself
+
+        """
+        if backend is None:
+            return self
+
+        assert backend in BACKENDS, \
+            f"Unknown backend {backend}, use one of {list(BACKENDS)}"
+
+        from pororo.tasks.utils.download_utils import file_lock
+
+        self.backend = backend
+        self._runtimes = dict()
+        for head in self.model.classification_heads.keys():
+            suffix = f".{self.quantize}" if self.quantize else ""
+            path = os.path.join(
+                export_dir,
+                f"{head}{suffix}.{BACKENDS[backend]}",
+            )
+            with file_lock(path):
+                if not os.path.exists(path):
+                    export_head(self.model, head, backend, path,
+                                self._example_tokens())
+            self._runtimes[head] = HeadRuntime(backend, path)
+        return self
+
+    def _example_tokens(self) -> torch.LongTensor:
+        """Returns padded `2 x 8` tokens to trace graphs with"""
+        dictionary = self.task.source_dictionary
+        tokens = torch.full((2, 8), dictionary.unk(), dtype=torch.long)
+        tokens[:, 0] = dictionary.bos()
+        tokens[0, -1] = dictionary.eos()
+        tokens[1, 4] = dictionary.eos()
+        tokens[1, 5:] = dictionary.pad()
+        return tokens
+
+    def predict(
+        self,
+        head: str,
+        tokens: torch.LongTensor,
+        return_logits: bool = False,
+    ):
+        if self.backend is None:
+            return super().predict(head, tokens, return_logits=return_logits)
+
+        if tokens.dim() == 1:
+            tokens = tokens.unsqueeze(0)
+        logits = self._runtimes[head](tokens).to(self.device)
+        if return_logits:
+            return logits
+        return torch.nn.functional.log_softmax(logits, dim=-1)
+
+    def build_id_map(self, vocab: Dict[str, int]) -> np.ndarray:
+        """
+        Map each id of the tokenizer vocabulary to the id of the same token in
+        fairseq dictionary, so that tokenizer ids can be encoded without
+        string round-trips (see `encode_ids`)
+
+        Args:
+            vocab (Dict[str, int]): tokenizer vocabulary
+
+        Returns:
+            np.ndarray: fairseq dictionary id of each tokenizer id
+
+        """
+        dictionary = self.task.source_dictionary
+        id_map = np.full(max(vocab.values()) + 1, dictionary.unk())
+        for token, index in vocab.items():
+            id_map[index] = dictionary.index(token)
+        return id_map
+
+    def token_ids(self, sentences: List[str]) -> List[List[int]]:
+        """Returns tokenizer ids of each sentence, used along with `id_map`"""
+        raise NotImplementedError
+
+    def encode_ids(
+        self,
+        inputs: List[Tuple[str, ...]],
+        add_special_tokens: bool = True,
+        no_separator: bool = False,
+    ) -> List[torch.LongTensor]:
+        """
+        Encode each tuple of sentences of `inputs` straight from the tokenizer
+        ids, which gives the same result as `encode`
+
+        Example (sentence pair): `<s> d e f </s> </s> 1 2 3 </s>`
+
+        """
+        dictionary = self.task.source_dictionary
+        bos, eos = [dictionary.bos()], [dictionary.eos()]
+
+        ids = iter(
+            self.token_ids([sent for sample in inputs for sent in sample]))
+        tokens = []
+        for sample in inputs:
+            pieces = [self.id_map[next(ids)]]
+            for _ in sample[1:]:
+                sent_ids = self.id_map[next(ids)]
+                # additional sentences are only added with special tokens
+                if add_special_tokens:
+                    pieces.extend([sent_ids, eos] if no_separator else
+                                  [eos, sent_ids, eos])
+            if add_special_tokens:
+                pieces = [bos] + pieces[:1] + [eos] + pieces[1:]
+            tokens.append(torch.from_numpy(np.concatenate(pieces)).long())
+        return tokens
+
+    def encode_batch(
+        self,
+        inputs: List[Union[str, Tuple[str, ...]]],
+        **kwargs,
+    ) -> List[torch.LongTensor]:
+        """Encode each sentence (or tuple of sentences) of `inputs`"""
+        if self.id_map is not None:
+            return self.encode_ids(
+                [(sample,) if isinstance(sample, str) else sample
+                 for sample in inputs],
+                **kwargs,
+            )
+        return [
+            self.encode(sample, **kwargs) if isinstance(sample, str) else
+            self.encode(*sample, **kwargs) for sample in inputs
+        ]
+
+    def collate(self, tokens: List[torch.LongTensor]) -> torch.LongTensor:
+        """Right-pad token sequences into a single `B x T` tensor"""
+        return collate_tokens(
+            tokens,
+            pad_idx=self.task.source_dictionary.pad(),
+        )
+
+    @torch.no_grad()
+    def predict_batch(
+        self,
+        head: str,
+        tokens: List[torch.LongTensor],
+        batch_size: Optional[int] = 32,
+        max_tokens: Optional[int] = None,
+        return_logits: bool = False,
+    ) -> torch.Tensor:
+        """
+        Run a sentence-level classification `head` over many encoded samples
+
+        Args:
+            head (str): name of the classification head
+            tokens (List[torch.LongTensor]): encoded samples
+            batch_size (int): maximum number of samples per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
+            return_logits (bool): whether to return logits instead of log-probabilities
+
+        Returns:
+            torch.Tensor: `N x C` outputs in the same order as `tokens`
+
+        """
+        outputs = None
+        lengths = [len(t) for t in tokens]
+        for batch in bucket_by_length(lengths, batch_size, max_tokens):
+            pred = self.predict(
+                head,
+                self.collate([tokens[i] for i in batch]),
+                return_logits=return_logits,
+            )
+            if outputs is None:
+                outputs = pred.new_empty(len(tokens), pred.size(-1))
+            outputs[batch] = pred
+        return outputs
+
+    @torch.no_grad()
+    def extract_features_batch(
+        self,
+        tokens: List[torch.LongTensor],
+        pooling: Optional[str] = None,
+        batch_size: Optional[int] = 32,
+        max_tokens: Optional[int] = None,
+        dtype: Optional[torch.dtype] = None,
+    ) -> Iterator[Tuple[List[int], Union[torch.Tensor, List[torch.Tensor]]]]:
+        """
+        Compute last layer features of many encoded samples, one mini-batch at a time
+
+        Args:
+            tokens (List[torch.LongTensor]): encoded samples
+            pooling (str): `mean`, `cls` or `max` to pool the features of each sample over its (non-pad) tokens
+            batch_size (int): maximum number of samples per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
+            dtype (torch.dtype): dtype the features are cast to before leaving the device
+
+        Yields:
+            Tuple[List[int], Union[torch.Tensor, List[torch.Tensor]]]: sample indices of the mini-batch and their features on cpu, `B x C` if pooled or `T x C` for each sample otherwise
+
+        """
+        assert pooling in [None, "mean", "cls", "max"], \
+            f"Unknown pooling {pooling}, use one of mean, cls or max"
+
+        lengths = [len(t) for t in tokens]
+        for batch in bucket_by_length(lengths, batch_size, max_tokens):
+            inputs = self.collate([tokens[i] for i in batch]).to(self.device)
+            features, _ = self.model(inputs, features_only=True)  # B x T x C
+            mask = inputs.ne(self.task.source_dictionary.pad()).unsqueeze(-1)
+
+            if pooling == "mean":
+                features = (features * mask).sum(dim=1) / mask.sum(dim=1)
+            elif pooling == "cls":
+                features = features[:, 0]
+            elif pooling == "max":
+                features = features.masked_fill(~mask, float("-inf"))
+                features = features.max(dim=1)[0]
+
+            if dtype is not None:
+                features = features.to(dtype)
+            features = features.cpu()
+
+            if pooling is None:
+                features = [f[:lengths[i]] for i, f in zip(batch, features)]
+            yield batch, features
+
+    def encode_tags(
+        self,
+        sentence: str,
+        **kwargs,
+    ) -> Tuple[torch.LongTensor, List[str]]:
+        """Encode `sentence` along with the subword each tag is predicted for"""
+        return self.encode(sentence, **kwargs), self.tokenize(sentence).split()
+
+    @torch.no_grad()
+    def predict_tags_batch(
+        self,
+        tokens: List[torch.LongTensor],
+        batch_size: Optional[int] = 32,
+        max_tokens: Optional[int] = None,
+    ) -> List[List[str]]:
+        """
+        Run `sequence_tagging_head` over many encoded samples
+
+        Args:
+            tokens (List[torch.LongTensor]): encoded samples
+            batch_size (int): maximum number of samples per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
+
+        Returns:
+            List[List[str]]: tags of each sample without <s> & </s>, in the same order as `tokens`
+
+        """
+        label_fn = lambda label: self.task.label_dictionary.string(
+            [label + self.task.label_dictionary.nspecial])
+
+        tags = [None] * len(tokens)
+        lengths = [len(t) for t in tokens]
+        for batch in bucket_by_length(lengths, batch_size, max_tokens):
+            preds = self.predict(
+                "sequence_tagging_head",
+                self.collate([tokens[i] for i in batch]),
+            ).argmax(dim=-1).tolist()
+            for i, pred in zip(batch, preds):
+                tags[i] = [label_fn(label) for label in pred[1:lengths[i] - 1]]
+        return tags
+
+    @torch.no_grad()
+    def predict_tags(
+        self,
+        sentence: Union[str, List[str]],
+        batch_size: Optional[int] = 32,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Union[List[Tuple[str, str]], List[List[Tuple[str, str]]]]:
+        """
+        Tag each subword of a sentence, or of a list of sentences in batches
+
+        Args:
+            sentence (Union[str, List[str]]): input sentence(s)
+            batch_size (int): maximum number of sentences per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
+
+        Returns:
+            Union[List[Tuple[str, str]], List[List[Tuple[str, str]]]]: (subword, tag) pairs of each sentence
+
+        """
+        if isinstance(sentence, str):
+            return self.predict_tags(
+                [sentence],
+                batch_size,
+                max_tokens,
+                **kwargs,
+            )[0]
+
+        encoded = [self.encode_tags(sent, **kwargs) for sent in sentence]
+        tags = self.predict_tags_batch(
+            [tokens for tokens, _ in encoded],
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+        )
+        return [
+            list(zip(words, labels))
+            for (_, words), labels in zip(encoded, tags)
+        ]
+
+    @torch.no_grad()
+    def predict_output_batch(
+        self,
+        inputs: List[Union[str, Tuple[str, ...]]],
+        batch_size: int = 32,
+        show_probs: bool = False,
+        **kwargs,
+    ) -> List[Union[str, float, Dict]]:
+        """
+        Batched version of `predict_output`
+
+        Args:
+            inputs (List[Union[str, Tuple[str, ...]]]): sentences or sentence pairs
+            batch_size (int): maximum number of samples per forward pass
+            show_probs (bool): whether to return label probabilities
+
+        Returns:
+            List[Union[str, float, Dict]]: outputs in the same order as `inputs`
+
+        """
+        assert (
+            "sentence_classification_head" in self.model.classification_heads
+        ), "need pre-trained sentence_classification_head to make predictions"
+
+        if len(inputs) == 0:
+            return []
+
+        logits = self.predict_batch(
+            "sentence_classification_head",
+            self.encode_batch(inputs, **kwargs),
+            batch_size=batch_size,
+            return_logits=True,
+        )
+
+        if self.model.encoder.args.regression_target:
+            return logits.view(-1).tolist()  # float
+
+        label_fn = lambda label: self.task.label_dictionary.string(
+            [label + self.task.label_dictionary.nspecial])
+
+        if show_probs:
+            return [{
+                label_fn(i): prob for i, prob in enumerate(probs)
+            } for probs in logits.float().softmax(dim=-1).tolist()]
+
+        labels = logits.argmax(dim=-1).tolist()
+        return [label_fn(label) for label in labels]  # str
+
+    def tokenize_span(self, text: str) -> str:
+        """Tokenize a span of masked input, i.e. the text between two `__`"""
+        return self.tokenize(text)
+
+    def encode_masked(self, masked_input: str) -> torch.LongTensor:
+        """Encode `masked_input`, each `__` of which is replaced with <mask>"""
+        text_spans = masked_input.split("__")
+        text_spans_bpe = ((" {0} ".format("<mask>")).join([
+            self.tokenize_span(text_span.rstrip()) for text_span in text_spans
+        ]).strip())
+        tokens = self.task.source_dictionary.encode_line(
+            "<s> " + text_spans_bpe + " </s>",
+            append_eos=False,
+            add_if_not_exist=False,
+        )
+        return tokens.long()
+
+    def decode_candidate(self, index: int) -> str:
+        """Returns the token a fill-mask candidate index stands for"""
+        return self.task.source_dictionary[index]
+
+    @torch.no_grad()
+    def fill_mask_batch(
+        self,
+        masked_inputs: List[str],
+        topk: int = 5,
+        batch_size: Optional[int] = 32,
+        max_tokens: Optional[int] = None,
+        exclude: Optional[List[int]] = None,
+    ) -> List[List[List[Tuple[int, float]]]]:
+        """
+        Predict candidates of every `__` token of many masked inputs
+
+        Args:
+            masked_inputs (List[str]): inputs which contain one or more __ tokens
+            topk (int): number of candidates of each __ token
+            batch_size (int): maximum number of inputs per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
+            exclude (List[int]): token indices never to be predicted
+
+        Returns:
+            List[List[List[Tuple[int, float]]]]: (token index, probability) candidates of each __ token of each input
+
+        """
+        tokens = [self.encode_masked(masked_input) for masked_input in masked_inputs]
+        assert all(t.eq(self.task.mask_idx).any() for t in tokens), \
+            "Please add at least one __ token for each input, eg: 'He is a __ guy'"
+
+        results = [None] * len(tokens)
+        lengths = [len(t) for t in tokens]
+        for batch in bucket_by_length(lengths, batch_size, max_tokens):
+            inputs = self.collate([tokens[i] for i in batch]).to(self.device)
+            masked_tokens = inputs.eq(self.task.mask_idx)
+
+            # LM head only runs over the masked positions, M x V
+            logits, _ = self.model(
+                inputs,
+                features_only=False,
+                return_all_hiddens=False,
+                masked_tokens=masked_tokens,
+            )
+            probs = logits.float().softmax(dim=-1)
+            if exclude:
+                probs[:, exclude] = -1
+            values, indices = probs.topk(k=topk, dim=-1)
+
+            candidates = [
+                list(zip(index, value))
+                for index, value in zip(indices.tolist(), values.tolist())
+            ]
+            offset = 0
+            for i, n_masks in zip(batch, masked_tokens.sum(dim=1).tolist()):
+                results[i] = candidates[offset:offset + n_masks]
+                offset += n_masks
+        return results
+
+    def fill_mask(self, masked_input: str, topk: int = 5) -> List[str]:
+        """Returns top-k candidates of the __ token of `masked_input`"""
+        assert masked_input.count("__") == 1, \
+            "Please add one __ token for the input, eg: 'He is a __ guy'"
+
+        candidates = self.fill_mask_batch([masked_input], topk=topk)[0][0]
+        return [self.decode_candidate(index) for index, _ in candidates]
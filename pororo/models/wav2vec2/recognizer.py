@@ -1,7 +1,6 @@
 # Copyright (c) Facebook, Inc., its affiliates and Kakao Brain. All Rights Reserved
 
 import datetime
-import math
 import unicodedata
 from typing import Tuple
 
@@ -17,6 +16,7 @@ from pororo.models.wav2vec2.submodules import (
     W2lViterbiDecoder,
 )
 from pororo.models.wav2vec2.utils import collate_fn, get_mask_from_lengths
+from pororo.tasks.utils.batching import BatchPlan, plan_batches
 
 
 class BrainWav2Vec2Recognizer(object):
@@ -147,12 +147,13 @@ class BrainWav2Vec2Recognizer(object):
             else:
                 speech_intervals = self._split_audio(signal, top_db)
 
-            batches, total_speech_sections, total_durations = self._create_batches(
+            plan, batches, speech_sections, durations = self._create_batches(
                 speech_intervals,
                 batch_size,
             )
 
-            for batch_idx, batch in enumerate(batches):
+            outputs = list()
+            for indices, batch in zip(plan, batches):
                 net_input, sample = dict(), dict()
 
                 net_input["padding_mask"] = get_mask_from_lengths(
@@ -162,22 +163,17 @@ class BrainWav2Vec2Recognizer(object):
                 net_input["source"] = batch["inputs"].to(self.device)
                 sample["net_input"] = net_input
 
-                # yapf: disable
-                if sample["net_input"]["source"].size(1) < self.MINIMUM_INPUT_LENGTH:
-                    continue
-                # yapf: enable
-
                 hypos = self.generator.generate(
                     self.model,
                     sample,
                     prefix_tokens=None,
                 )
 
-                for hypo_idx, hypo in enumerate(hypos):
+                for idx, hypo in zip(indices, hypos):
                     hypo_dict = dict()
                     hyp_pieces = self.target_dict.string(
                         hypo[0]["tokens"].int().cpu())
-                    speech_section = total_speech_sections[batch_idx][hypo_idx]
+                    speech_section = speech_sections[idx]
 
                     speech_start_time = str(
                         datetime.timedelta(
@@ -194,15 +190,19 @@ class BrainWav2Vec2Recognizer(object):
 
                     # yapf: disable
                     hypo_dict["speech_section"] = f"{speech_start_time} ~ {speech_end_time}"
-                    hypo_dict["length_ms"] = total_durations[batch_idx][hypo_idx] * 1000
+                    hypo_dict["length_ms"] = durations[idx] * 1000
                     hypo_dict["speech"] = self._text_postprocess(hyp_pieces)
                     # yapf: enable
 
-                    if hypo_dict["speech"]:
-                        result_dict["results"].append(hypo_dict)
+                    outputs.append(hypo_dict)
 
                 del hypos, net_input, sample
 
+            # Sections are reported in the order they are spoken
+            for hypo_dict in plan.restore(outputs):
+                if hypo_dict["speech"]:
+                    result_dict["results"].append(hypo_dict)
+
         else:
             net_input, sample, hypo_dict = dict(), dict(), dict()
 
@@ -242,46 +242,33 @@ class BrainWav2Vec2Recognizer(object):
         self,
         speech_intervals: list,
         batch_size: int = 1,
-    ) -> Tuple[list, list, list]:
-        batches = list()
-        total_speech_sections = list()
-        total_durations = list()
+    ) -> Tuple[BatchPlan, list, list, list]:
+        features = list()
+        speech_sections = list()
+        durations = list()
 
         cumulative_duration = 0
-        num_batches = math.ceil(len(speech_intervals) / batch_size)
-
-        for batch_idx in range(num_batches):
-            sample = list()
-            speech_sections = list()
-            durations = list()
-
-            for idx in range(batch_size):
-                speech_section = dict()
-                speech_intervals_idx = batch_idx * batch_size + idx
-
-                if len(speech_intervals) > speech_intervals_idx:
-                    feature, duration = self._parse_audio(
-                        speech_intervals[speech_intervals_idx])
-
-                    speech_section["start"] = cumulative_duration
-                    cumulative_duration += duration
-                    speech_section["end"] = cumulative_duration
-
-                    speech_sections.append(speech_section)
-                    sample.append(feature)
-                    durations.append(duration)
-                else:
-                    speech_section["start"] = cumulative_duration
-                    speech_section["end"] = cumulative_duration
-
-                    speech_sections.append(speech_section)
-                    sample.append(torch.zeros(10))
-                    durations.append(0)
-
-            batch = self.collate_fn(sample, batch_size)
-
-            batches.append(batch)
-            total_speech_sections.append(speech_sections)
-            total_durations.append(durations)
-
-        return batches, total_speech_sections, total_durations
+        for speech_interval in speech_intervals:
+            feature, duration = self._parse_audio(speech_interval)
+
+            speech_section = dict()
+            speech_section["start"] = cumulative_duration
+            cumulative_duration += duration
+            speech_section["end"] = cumulative_duration
+
+            # Sections too short to recognize are skipped on their own
+            # length, so the result does not depend on how they are batched
+            if len(feature) < self.MINIMUM_INPUT_LENGTH:
+                continue
+
+            features.append(feature)
+            speech_sections.append(speech_section)
+            durations.append(duration)
+
+        # Sections of similar length are batched together to minimize padding
+        plan = plan_batches([len(f) for f in features], batch_size=batch_size)
+        batches = [
+            self.collate_fn([features[idx] for idx in indices], len(indices))
+            for indices in plan
+        ]
+        return plan, batches, speech_sections, durations
@@ -6,147 +6,113 @@ Pororo task-specific factory class
 """
 
 import logging
-from typing import Optional
-from pororo.tasks.utils.base import PororoTaskBase
-
-import torch
-
-from pororo.tasks import (
-    PororoAgeSuitabilityFactory,
-    PororoAesFactory,
-    PororoAsrFactory,
-    PororoBlankFactory,
-    PororoCaptionFactory,
-    PororoCollocationFactory,
-    PororoConstFactory,
-    PororoDpFactory,
-    PororoGecFactory,
-    PororoP2gFactory,
-    PororoInflectionFactory,
-    PororoLemmatizationFactory,
-    PororoMrcFactory,
-    PororoNerFactory,
-    PororoNliFactory,
-    PororoOcrFactory,
-    PororoParaIdFactory,
-    PororoParaphraseFactory,
-    PororoG2pFactory,
-    PororoPosFactory,
-    PororoQuestionGenerationFactory,
-    PororoReviewFactory,
-    PororoSentenceFactory,
-    PororoSentimentFactory,
-    PororoSrlFactory,
-    PororoStsFactory,
-    PororoContextualFactory,
-    PororoSummarizationFactory,
-    PororoTokenizationFactory,
-    PororoTranslationFactory,
-    PororoWordFactory,
-    PororoWordTranslationFactory,
-    PororoZeroShotFactory,
-    PororoSpeechTranslationFactory,
-    PororoWsdFactory,
-    PororoTtsFactory,
+from typing import Dict, List, Optional, Tuple, Type
+import pororo.tasks
+from pororo.tasks.utils.base import (
+    PororoFactoryBase,
+    PororoTaskBase,
+    module_nbytes,
 )
 
+# Task name to factory class name, the factory module is only imported
+# when the task is first requested (see `pororo.tasks.__getattr__`)
 SUPPORTED_TASKS = {
-    "mrc": PororoMrcFactory,
-    "rc": PororoMrcFactory,
-    "qa": PororoMrcFactory,
-    "question_answering": PororoMrcFactory,
-    "machine_reading_comprehension": PororoMrcFactory,
-    "reading_comprehension": PororoMrcFactory,
-    "sentiment": PororoSentimentFactory,
-    "sentiment_analysis": PororoSentimentFactory,
-    "nli": PororoNliFactory,
-    "natural_language_inference": PororoNliFactory,
-    "inference": PororoNliFactory,
-    "fill": PororoBlankFactory,
-    "fill_in_blank": PororoBlankFactory,
-    "fib": PororoBlankFactory,
-    "para": PororoParaIdFactory,
-    "pi": PororoParaIdFactory,
-    "cse": PororoContextualFactory,
-    "contextual_subword_embedding": PororoContextualFactory,
-    "similarity": PororoStsFactory,
-    "sts": PororoStsFactory,
-    "semantic_textual_similarity": PororoStsFactory,
-    "sentence_similarity": PororoStsFactory,
-    "sentvec": PororoSentenceFactory,
-    "sentence_embedding": PororoSentenceFactory,
-    "sentence_vector": PororoSentenceFactory,
-    "se": PororoSentenceFactory,
-    "inflection": PororoInflectionFactory,
-    "morphological_inflection": PororoInflectionFactory,
-    "g2p": PororoG2pFactory,
-    "grapheme_to_phoneme": PororoG2pFactory,
-    "grapheme_to_phoneme_conversion": PororoG2pFactory,
-    "w2v": PororoWordFactory,
-    "wordvec": PororoWordFactory,
-    "word2vec": PororoWordFactory,
-    "word_vector": PororoWordFactory,
-    "word_embedding": PororoWordFactory,
-    "tokenize": PororoTokenizationFactory,
-    "tokenise": PororoTokenizationFactory,
-    "tokenization": PororoTokenizationFactory,
-    "tokenisation": PororoTokenizationFactory,
-    "tok": PororoTokenizationFactory,
-    "segmentation": PororoTokenizationFactory,
-    "seg": PororoTokenizationFactory,
-    "mt": PororoTranslationFactory,
-    "machine_translation": PororoTranslationFactory,
-    "translation": PororoTranslationFactory,
-    "pos": PororoPosFactory,
-    "tag": PororoPosFactory,
-    "pos_tagging": PororoPosFactory,
-    "tagging": PororoPosFactory,
-    "const": PororoConstFactory,
-    "constituency": PororoConstFactory,
-    "constituency_parsing": PororoConstFactory,
-    "cp": PororoConstFactory,
-    "pg": PororoParaphraseFactory,
-    "collocation": PororoCollocationFactory,
-    "collocate": PororoCollocationFactory,
-    "col": PororoCollocationFactory,
-    "word_translation": PororoWordTranslationFactory,
-    "wt": PororoWordTranslationFactory,
-    "summarization": PororoSummarizationFactory,
-    "summarisation": PororoSummarizationFactory,
-    "text_summarization": PororoSummarizationFactory,
-    "text_summarisation": PororoSummarizationFactory,
-    "summary": PororoSummarizationFactory,
-    "gec": PororoGecFactory,
-    "review": PororoReviewFactory,
-    "review_scoring": PororoReviewFactory,
-    "lemmatization": PororoLemmatizationFactory,
-    "lemmatisation": PororoLemmatizationFactory,
-    "lemma": PororoLemmatizationFactory,
-    "ner": PororoNerFactory,
-    "named_entity_recognition": PororoNerFactory,
-    "entity_recognition": PororoNerFactory,
-    "zero-topic": PororoZeroShotFactory,
-    "dp": PororoDpFactory,
-    "dep_parse": PororoDpFactory,
-    "caption": PororoCaptionFactory,
-    "captioning": PororoCaptionFactory,
-    "asr": PororoAsrFactory,
-    "speech_recognition": PororoAsrFactory,
-    "st": PororoSpeechTranslationFactory,
-    "speech_translation": PororoSpeechTranslationFactory,
-    "tts": PororoTtsFactory,
-    "text_to_speech": PororoTtsFactory,
-    "speech_synthesis": PororoTtsFactory,
-    "ocr": PororoOcrFactory,
-    "srl": PororoSrlFactory,
-    "semantic_role_labeling": PororoSrlFactory,
-    "p2g": PororoP2gFactory,
-    "aes": PororoAesFactory,
-    "essay": PororoAesFactory,
-    "qg": PororoQuestionGenerationFactory,
-    "question_generation": PororoQuestionGenerationFactory,
-    "age_suitability": PororoAgeSuitabilityFactory,
-    "wsd": PororoWsdFactory,
+    "mrc": "PororoMrcFactory",
+    "rc": "PororoMrcFactory",
+    "qa": "PororoMrcFactory",
+    "question_answering": "PororoMrcFactory",
+    "machine_reading_comprehension": "PororoMrcFactory",
+    "reading_comprehension": "PororoMrcFactory",
+    "sentiment": "PororoSentimentFactory",
+    "sentiment_analysis": "PororoSentimentFactory",
+    "nli": "PororoNliFactory",
+    "natural_language_inference": "PororoNliFactory",
+    "inference": "PororoNliFactory",
+    "fill": "PororoBlankFactory",
+    "fill_in_blank": "PororoBlankFactory",
+    "fib": "PororoBlankFactory",
+    "para": "PororoParaIdFactory",
+    "pi": "PororoParaIdFactory",
+    "cse": "PororoContextualFactory",
+    "contextual_subword_embedding": "PororoContextualFactory",
+    "similarity": "PororoStsFactory",
+    "sts": "PororoStsFactory",
+    "semantic_textual_similarity": "PororoStsFactory",
+    "sentence_similarity": "PororoStsFactory",
+    "sentvec": "PororoSentenceFactory",
+    "sentence_embedding": "PororoSentenceFactory",
+    "sentence_vector": "PororoSentenceFactory",
+    "se": "PororoSentenceFactory",
+    "inflection": "PororoInflectionFactory",
+    "morphological_inflection": "PororoInflectionFactory",
+    "g2p": "PororoG2pFactory",
+    "grapheme_to_phoneme": "PororoG2pFactory",
+    "grapheme_to_phoneme_conversion": "PororoG2pFactory",
+    "w2v": "PororoWordFactory",
+    "wordvec": "PororoWordFactory",
+    "word2vec": "PororoWordFactory",
+    "word_vector": "PororoWordFactory",
+    "word_embedding": "PororoWordFactory",
+    "tokenize": "PororoTokenizationFactory",
+    "tokenise": "PororoTokenizationFactory",
+    "tokenization": "PororoTokenizationFactory",
+    "tokenisation": "PororoTokenizationFactory",
+    "tok": "PororoTokenizationFactory",
+    "segmentation": "PororoTokenizationFactory",
+    "seg": "PororoTokenizationFactory",
+    "mt": "PororoTranslationFactory",
+    "machine_translation": "PororoTranslationFactory",
+    "translation": "PororoTranslationFactory",
+    "pos": "PororoPosFactory",
+    "tag": "PororoPosFactory",
+    "pos_tagging": "PororoPosFactory",
+    "tagging": "PororoPosFactory",
+    "const": "PororoConstFactory",
+    "constituency": "PororoConstFactory",
+    "constituency_parsing": "PororoConstFactory",
+    "cp": "PororoConstFactory",
+    "pg": "PororoParaphraseFactory",
+    "collocation": "PororoCollocationFactory",
+    "collocate": "PororoCollocationFactory",
+    "col": "PororoCollocationFactory",
+    "word_translation": "PororoWordTranslationFactory",
+    "wt": "PororoWordTranslationFactory",
+    "summarization": "PororoSummarizationFactory",
+    "summarisation": "PororoSummarizationFactory",
+    "text_summarization": "PororoSummarizationFactory",
+    "text_summarisation": "PororoSummarizationFactory",
+    "summary": "PororoSummarizationFactory",
+    "gec": "PororoGecFactory",
+    "review": "PororoReviewFactory",
+    "review_scoring": "PororoReviewFactory",
+    "lemmatization": "PororoLemmatizationFactory",
+    "lemmatisation": "PororoLemmatizationFactory",
+    "lemma": "PororoLemmatizationFactory",
+    "ner": "PororoNerFactory",
+    "named_entity_recognition": "PororoNerFactory",
+    "entity_recognition": "PororoNerFactory",
+    "zero-topic": "PororoZeroShotFactory",
+    "dp": "PororoDpFactory",
+    "dep_parse": "PororoDpFactory",
+    "caption": "PororoCaptionFactory",
+    "captioning": "PororoCaptionFactory",
+    "asr": "PororoAsrFactory",
+    "speech_recognition": "PororoAsrFactory",
+    "st": "PororoSpeechTranslationFactory",
+    "speech_translation": "PororoSpeechTranslationFactory",
+    "tts": "PororoTtsFactory",
+    "text_to_speech": "PororoTtsFactory",
+    "speech_synthesis": "PororoTtsFactory",
+    "ocr": "PororoOcrFactory",
+    "srl": "PororoSrlFactory",
+    "semantic_role_labeling": "PororoSrlFactory",
+    "p2g": "PororoP2gFactory",
+    "aes": "PororoAesFactory",
+    "essay": "PororoAesFactory",
+    "qg": "PororoQuestionGenerationFactory",
+    "question_generation": "PororoQuestionGenerationFactory",
+    "age_suitability": "PororoAgeSuitabilityFactory",
+    "wsd": "PororoWsdFactory",
 }
 
 LANG_ALIASES = {
@@ -165,6 +131,9 @@ LANG_ALIASES = {
     "jje": "je",
 }
 
+QUANTIZE_OPTIONS = ["int8"]
+BACKEND_OPTIONS = ["onnx", "torchscript"]
+
 logging.getLogger("transformers").setLevel(logging.WARN)
 logging.getLogger("fairseq").setLevel(logging.WARN)
 logging.getLogger("sentence_transformers").setLevel(logging.WARN)
@@ -173,6 +142,65 @@ logging.getLogger("pydub").setLevel(logging.WARN)
 logging.getLogger("librosa").setLevel(logging.WARN)
 
 
+def get_factory(task: str) -> Type[PororoFactoryBase]:
+    """
+    Returns factory class of the user-input task, importing its module if needed
+
+    Args:
+        task (str): user-input task name
+
+    Returns:
+        Type[PororoFactoryBase]: task-specific factory class
+
+    """
+    return getattr(pororo.tasks, SUPPORTED_TASKS[task])
+
+
+def resolve_assets(
+    tasks: List[Tuple[str, str, Optional[str]]],
+) -> List[Tuple[str, str]]:
+    """
+    Returns every asset the given task modules and the ones they build on fetch
+
+    Args:
+        tasks (List[Tuple[str, str, Optional[str]]]): (task, lang, model) triples, model may be None for the default one
+
+    Returns:
+        List[Tuple[str, str]]: (asset name, lang) pairs to be passed to `download_or_load`
+
+    """
+    assets, seen = list(), set()
+    pending = list(tasks)
+
+    while pending:
+        task, lang, model = pending.pop(0)
+        if task not in SUPPORTED_TASKS:
+            raise KeyError("Unknown task {}, available tasks are {}".format(
+                task,
+                list(SUPPORTED_TASKS.keys()),
+            ))
+
+        lang = lang.lower()
+        lang = LANG_ALIASES[lang] if lang in LANG_ALIASES else lang
+
+        factory = get_factory(task)(task, lang, model)
+        key = (
+            SUPPORTED_TASKS[task],
+            factory.config.lang,
+            factory.config.n_model,
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+
+        for asset in factory.get_assets():
+            if asset not in assets:
+                assets.append(asset)
+        pending.extend(factory.get_dependencies())
+
+    return assets
+
+
 class Pororo:
     r"""
     This is a generic class that will return one of the task-specific model classes of the library
@@ -185,8 +213,27 @@ class Pororo:
         task: str,
         lang: str = "en",
         model: Optional[str] = None,
+        cache: bool = False,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
         **kwargs,
     ) -> PororoTaskBase:
+        """
+        Args:
+            task (str): task name
+            lang (str): language
+            model (str): model name, default model of `lang` if not given
+            cache (bool): whether to return the module already loaded for the same (task, lang, model) in this process, and keep this one loaded for later calls
+            quantize (str): `int8` to apply dynamic quantization to the linear layers of BERT-family backbones, runs on CPU
+            backend (str): `onnx` or `torchscript` to run the classification and tagging heads of BERT-family models through graphs exported next to their checkpoints, runs on CPU
+
+        Returns:
+            PororoTaskBase: task-specific module
+
+        Raises:
+            ValueError: if the selected model does not support `quantize` or `backend`
+
+        """
         if task not in SUPPORTED_TASKS:
             raise KeyError("Unknown task {}, available tasks are {}".format(
                 task,
@@ -196,19 +243,74 @@ class Pororo:
         lang = lang.lower()
         lang = LANG_ALIASES[lang] if lang in LANG_ALIASES else lang
 
+        import torch
+
         # Get device information from torch API
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
+        if quantize is not None:
+            assert quantize in QUANTIZE_OPTIONS, \
+                f"Unknown quantize option {quantize}, available options are {QUANTIZE_OPTIONS}"
+        if backend is not None:
+            assert backend in BACKEND_OPTIONS, \
+                f"Unknown backend {backend}, available backends are {BACKEND_OPTIONS}"
+            assert not (quantize and backend == "onnx"), \
+                "Quantized models can only be exported with torchscript backend"
+
         # Instantiate task-specific pipeline module, if possible
-        task_module = SUPPORTED_TASKS[task](
+        factory = get_factory(task)(
             task,
             lang,
             model,
             **kwargs,
-        ).load(device)
+        )
+        factory.set_options(quantize, backend)
+
+        # Dynamically quantized int8 kernels and exported graphs run on CPU
+        if quantize is not None or backend is not None:
+            device = torch.device("cpu")
+
+        # Reuse (or register) process-wide instance of pipeline module
+        if cache:
+            return get_factory(task).load_shared(
+                task,
+                lang,
+                model,
+                device,
+                keep_alive=True,
+                quantize=quantize,
+                backend=backend,
+                **kwargs,
+            )
+
+        task_module = factory.load(device)
 
         return task_module
 
+    @staticmethod
+    def clear_cache():
+        """Release task-specific modules loaded with `cache=True`"""
+        PororoFactoryBase.clear_resident()
+
+    @staticmethod
+    def memory_usage() -> Dict[str, int]:
+        """
+        Returns memory used by each shared task-specific module, i.e. the ones
+        loaded with `cache=True` and the components of composite tasks
+
+        Returns:
+            Dict[str, int]: module name to its size in bytes, with the deduplicated `total`
+
+        """
+        modules = PororoFactoryBase.shared_pipelines()
+        usage = {name: module_nbytes(module) for name, module in modules.items()}
+
+        # Components shared by several modules are only counted once
+        seen = set()
+        usage["total"] = sum(
+            module_nbytes(module, seen) for module in modules.values())
+        return usage
+
     @staticmethod
     def available_tasks() -> str:
         """
@@ -240,7 +342,7 @@ class Pororo:
                 "Unknown task {} ! Please check available models via `available_tasks()`"
                 .format(task))
 
-        langs = SUPPORTED_TASKS[task].get_available_models()
+        langs = get_factory(task).get_available_models()
         output = f"Available models for {task} are "
         for lang in langs:
             output += f"([lang]: {lang}, [model]: {', '.join(langs[lang])}), "
@@ -5,9 +5,10 @@ __init__.py for import child .py files
     isort:skip_file
 """
 
+import importlib
+
 # Utility classes & functions
 import pororo.tasks.utils
-from pororo.tasks.utils.download_utils import download_or_load
 from pororo.tasks.utils.base import (
     PororoBiencoderBase,
     PororoFactoryBase,
@@ -16,40 +17,57 @@ from pororo.tasks.utils.base import (
     PororoTaskGenerationBase,
 )
 
-# Factory classes
-from pororo.tasks.age_suitability import PororoAgeSuitabilityFactory
-from pororo.tasks.automated_essay_scoring import PororoAesFactory
-from pororo.tasks.automatic_speech_recognition import PororoAsrFactory
-from pororo.tasks.collocation import PororoCollocationFactory
-from pororo.tasks.constituency_parsing import PororoConstFactory
-from pororo.tasks.dependency_parsing import PororoDpFactory
-from pororo.tasks.fill_in_the_blank import PororoBlankFactory
-from pororo.tasks.grammatical_error_correction import PororoGecFactory
-from pororo.tasks.grapheme_conversion import PororoP2gFactory
-from pororo.tasks.image_captioning import PororoCaptionFactory
-from pororo.tasks.morph_inflection import PororoInflectionFactory
-from pororo.tasks.lemmatization import PororoLemmatizationFactory
-from pororo.tasks.named_entity_recognition import PororoNerFactory
-from pororo.tasks.natural_language_inference import PororoNliFactory
-from pororo.tasks.optical_character_recognition import PororoOcrFactory
-from pororo.tasks.paraphrase_generation import PororoParaphraseFactory
-from pororo.tasks.paraphrase_identification import PororoParaIdFactory
-from pororo.tasks.phoneme_conversion import PororoG2pFactory
-from pororo.tasks.pos_tagging import PororoPosFactory
-from pororo.tasks.question_generation import PororoQuestionGenerationFactory
-from pororo.tasks.machine_reading_comprehension import PororoMrcFactory
-from pororo.tasks.semantic_role_labeling import PororoSrlFactory
-from pororo.tasks.semantic_textual_similarity import PororoStsFactory
-from pororo.tasks.sentence_embedding import PororoSentenceFactory
-from pororo.tasks.sentiment_analysis import PororoSentimentFactory
-from pororo.tasks.contextualized_embedding import PororoContextualFactory
-from pororo.tasks.text_summarization import PororoSummarizationFactory
-from pororo.tasks.tokenization import PororoTokenizationFactory
-from pororo.tasks.machine_translation import PororoTranslationFactory
-from pororo.tasks.word_embedding import PororoWordFactory
-from pororo.tasks.word_translation import PororoWordTranslationFactory
-from pororo.tasks.zero_shot_classification import PororoZeroShotFactory
-from pororo.tasks.review_scoring import PororoReviewFactory
-from pororo.tasks.speech_translation import PororoSpeechTranslationFactory
-from pororo.tasks.word_sense_disambiguation import PororoWsdFactory
-from pororo.tasks.speech_synthesis import PororoTtsFactory
+# Factory classes (and their heavy dependencies) are imported lazily,
+# from the module listed here, the first time they are accessed
+_LAZY_IMPORTS = {
+    "download_or_load": "pororo.tasks.utils.download_utils",
+    "PororoAgeSuitabilityFactory": "pororo.tasks.age_suitability",
+    "PororoAesFactory": "pororo.tasks.automated_essay_scoring",
+    "PororoAsrFactory": "pororo.tasks.automatic_speech_recognition",
+    "PororoCollocationFactory": "pororo.tasks.collocation",
+    "PororoConstFactory": "pororo.tasks.constituency_parsing",
+    "PororoDpFactory": "pororo.tasks.dependency_parsing",
+    "PororoBlankFactory": "pororo.tasks.fill_in_the_blank",
+    "PororoGecFactory": "pororo.tasks.grammatical_error_correction",
+    "PororoP2gFactory": "pororo.tasks.grapheme_conversion",
+    "PororoCaptionFactory": "pororo.tasks.image_captioning",
+    "PororoInflectionFactory": "pororo.tasks.morph_inflection",
+    "PororoLemmatizationFactory": "pororo.tasks.lemmatization",
+    "PororoNerFactory": "pororo.tasks.named_entity_recognition",
+    "PororoNliFactory": "pororo.tasks.natural_language_inference",
+    "PororoOcrFactory": "pororo.tasks.optical_character_recognition",
+    "PororoParaphraseFactory": "pororo.tasks.paraphrase_generation",
+    "PororoParaIdFactory": "pororo.tasks.paraphrase_identification",
+    "PororoG2pFactory": "pororo.tasks.phoneme_conversion",
+    "PororoPosFactory": "pororo.tasks.pos_tagging",
+    "PororoQuestionGenerationFactory": "pororo.tasks.question_generation",
+    "PororoMrcFactory": "pororo.tasks.machine_reading_comprehension",
+    "PororoSrlFactory": "pororo.tasks.semantic_role_labeling",
+    "PororoStsFactory": "pororo.tasks.semantic_textual_similarity",
+    "PororoSentenceFactory": "pororo.tasks.sentence_embedding",
+    "PororoSentimentFactory": "pororo.tasks.sentiment_analysis",
+    "PororoContextualFactory": "pororo.tasks.contextualized_embedding",
+    "PororoSummarizationFactory": "pororo.tasks.text_summarization",
+    "PororoTokenizationFactory": "pororo.tasks.tokenization",
+    "PororoTranslationFactory": "pororo.tasks.machine_translation",
+    "PororoWordFactory": "pororo.tasks.word_embedding",
+    "PororoWordTranslationFactory": "pororo.tasks.word_translation",
+    "PororoZeroShotFactory": "pororo.tasks.zero_shot_classification",
+    "PororoReviewFactory": "pororo.tasks.review_scoring",
+    "PororoSpeechTranslationFactory": "pororo.tasks.speech_translation",
+    "PororoWsdFactory": "pororo.tasks.word_sense_disambiguation",
+    "PororoTtsFactory": "pororo.tasks.speech_synthesis",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    attr = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -75,6 +75,9 @@ class PororoAgeSuitabilityFactory(PororoFactoryBase):
             "en": ["roberta.base.en.movie"],
         }
 
+    def get_assets(self):
+        return [(f"bert/{self.config.n_model}", self.config.lang)]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
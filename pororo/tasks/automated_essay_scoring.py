@@ -3,6 +3,7 @@
 from typing import Optional
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoAesFactory(PororoFactoryBase):
@@ -22,6 +23,9 @@ class PororoAesFactory(PororoFactoryBase):
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -35,6 +39,9 @@ class PororoAesFactory(PororoFactoryBase):
             "en": ["roberta.base.en.aes"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device):
         """
         Load user-selected task-specific model
@@ -52,6 +59,8 @@ class PororoAesFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             return PororoBertAes(model, self.config)
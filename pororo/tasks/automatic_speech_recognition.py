@@ -86,6 +86,13 @@ class PororoAsrFactory(PororoFactoryBase):
             "zh": ["wav2vec.zh"],
         }
 
+    def get_assets(self):
+        return [
+            (f"misc/{self.config.n_model}.pt", self.config.lang),
+            (f"misc/{self.config.lang}.ltr.txt", self.config.lang),
+            ("misc/vad.pt", "multi"),
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
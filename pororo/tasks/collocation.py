@@ -77,6 +77,14 @@ class PororoCollocationFactory(PororoFactoryBase):
             "zh": ["collocate.zh"],
         }
 
+    def get_assets(self):
+        if "collocate" in self.config.n_model:
+            return [(
+                f"misc/collocate.{self.config.lang}.zip",
+                self.config.lang,
+            )]
+        return []
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -92,6 +92,13 @@ class PororoConstFactory(PororoFactoryBase):
             "zh": ["transformer.base.zh.const"],
         }
 
+    def get_assets(self):
+        return [(f"transformer/{self.config.n_model}", self.config.lang)]
+
+    def get_dependencies(self):
+        taggers = {"ko": "mecab-ko", "en": "nltk", "zh": "jieba"}
+        return [("pos", self.config.lang, taggers[self.config.lang])]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -122,27 +129,30 @@ class PororoConstFactory(PororoFactoryBase):
             ).eval().to(device))
 
             if self.config.lang == "ko":
-                tagger = PororoPosFactory(
+                tagger = PororoPosFactory.load_shared(
                     task="pos",
                     model="mecab-ko",
                     lang=self.config.lang,
-                ).load(device)
+                    device=device,
+                )
                 return PororoTransConstKo(model, tagger, self.config)
 
             if self.config.lang == "en":
-                tagger = PororoPosFactory(
+                tagger = PororoPosFactory.load_shared(
                     task="pos",
                     model="nltk",
                     lang=self.config.lang,
-                ).load(device)
+                    device=device,
+                )
                 return PororoTransConstEn(model, tagger, self.config)
 
             if self.config.lang == "zh":
-                tagger = PororoPosFactory(
+                tagger = PororoPosFactory.load_shared(
                     task="pos",
                     model="jieba",
                     lang=self.config.lang,
-                ).load(device)
+                    device=device,
+                )
                 return PororoTransConstZh(model, tagger, self.config)
 
 
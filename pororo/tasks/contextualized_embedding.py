@@ -1,8 +1,13 @@
 """Contextualized Embedding related modeling class"""
 
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import torch
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoContextualFactory(PororoFactoryBase):
@@ -30,10 +35,13 @@ class PororoContextualFactory(PororoFactoryBase):
         - metric: N/A
 
     Args:
-        sent (str): input sentence to be contextualized embedded
+        sent (Union[str, List[str]]): input sentence or list of sentences to be contextualized embedded
+        pooling (str): `mean`, `cls` or `max` to pool the subword embeddings of each sentence, none by default
+        dtype (str): `float32`, `float16` or `bfloat16` (returned as its uint16 bits)
+        batch_size (int): maximum number of sentences per forward pass
 
     Returns:
-        np.array: sentence embedding with subword units
+        np.array: sentence embedding with subword units (or pooled), a list of them for list input (an `N x C` array if pooled)
 
     Examples:
         >>> cse = Pororo(task="cse", lang="ko")
@@ -53,9 +61,13 @@ class PororoContextualFactory(PororoFactoryBase):
                 -0.36008322,  0.24684878], ...,
             [-0.7470922 , -0.30342472, -0.64015895, ..., -0.17556943,
                 0.10660946, -0.17191087]], dtype=float32)
+        >>> cse(["하늘을 나는 새", "나는 동물을 좋아하는 사람이야"], pooling="mean", dtype="float16").shape
+        (2, 768)
 
     """
 
+    supports_quantize = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -72,6 +84,9 @@ class PororoContextualFactory(PororoFactoryBase):
             "ja": ["jaberta.base.ja"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -89,6 +104,8 @@ class PororoContextualFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertContextualized(model, self.config, device)
 
@@ -98,6 +115,8 @@ class PororoContextualFactory(PororoFactoryBase):
             model = BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertContextualized(model, self.config, device)
 
@@ -107,6 +126,8 @@ class PororoContextualFactory(PororoFactoryBase):
             model = JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertContextualized(model, self.config, device)
 
@@ -116,6 +137,8 @@ class PororoContextualFactory(PororoFactoryBase):
             model = ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertContextualized(model, self.config, device)
 
@@ -127,20 +150,128 @@ class PororoBertContextualized(PororoSimpleBase):
         self._model = model
         self._device = device
 
-    def predict(self, sent: str, **kwargs):
+    def _extract(
+        self,
+        sents: List[str],
+        pooling: Optional[str],
+        dtype: str,
+        batch_size: int,
+    ):
+        """Yield sentence indices and numpy features of each mini-batch"""
+        assert dtype in ["float32", "float16", "bfloat16"], \
+            f"Unknown dtype {dtype}, use one of float32, float16 or bfloat16"
+
+        tokens = [self._model.encode(sent) for sent in sents]
+        for batch, features in self._model.extract_features_batch(
+                tokens,
+                pooling=pooling,
+                batch_size=batch_size,
+                dtype=getattr(torch, dtype),
+        ):
+            if pooling is None:
+                yield batch, [self._to_numpy(f) for f in features]
+            else:
+                yield batch, self._to_numpy(features)
+
+    @staticmethod
+    def _to_numpy(features) -> np.ndarray:
+        # numpy has no bfloat16, so its bits are kept as uint16
+        if features.dtype == torch.bfloat16:
+            return features.view(torch.int16).numpy().view(np.uint16)
+        return features.numpy()
+
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        pooling: Optional[str] = None,
+        dtype: str = "float32",
+        batch_size: int = 32,
+        **kwargs,
+    ) -> Union[np.ndarray, List[np.ndarray]]:
         """
         Conduct contextualized embedding
 
         Args:
-            sent (str): input sentence to be contextualized embedded
+            sent (Union[str, List[str]]): input sentence or list of sentences to be contextualized embedded
+            pooling (str): `mean`, `cls` or `max` to pool the subword embeddings of each sentence, none by default
+            dtype (str): `float32`, `float16` or `bfloat16` (returned as its uint16 bits)
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            np.array: sentence embedding with subword units
+            Union[np.ndarray, List[np.ndarray]]: sentence embedding with subword units (or pooled), a list of them for list input (an `N x C` array if pooled)
+
+        """
+        sents = [sent] if isinstance(sent, str) else sent
+
+        outputs = [None] * len(sents)
+        for batch, features in self._extract(sents, pooling, dtype,
+                                             batch_size):
+            for i, feature in zip(batch, features):
+                outputs[i] = feature
+
+        if isinstance(sent, str):
+            return outputs[0]
+        if pooling is not None and outputs:
+            return np.stack(outputs)
+        return outputs
+
+    def stream(
+        self,
+        sents: Iterable[str],
+        path: str,
+        total: int,
+        pooling: str = "mean",
+        dtype: str = "float32",
+        batch_size: int = 32,
+        chunk_size: int = 4096,
+    ) -> Iterator[int]:
+        """
+        Embed a large corpus into a preallocated memory-mapped `.npy` array,
+        reading `sents` lazily `chunk_size` sentences at a time
+
+        Args:
+            sents (Iterable[str]): input sentences, e.g. an open file
+            path (str): path of the `.npy` file to be written
+            total (int): number of sentences, i.e. rows of the array
+            pooling (str): `mean`, `cls` or `max`
+            dtype (str): `float32`, `float16` or `bfloat16` (stored as its uint16 bits)
+            batch_size (int): maximum number of sentences per forward pass
+            chunk_size (int): number of sentences sorted by length together
+
+        Yields:
+            int: number of sentences written so far
+
+        Examples:
+            >>> cse = Pororo(task="cse", lang="ko")
+            >>> with open("corpus.txt") as f:
+            ...     for n in cse.stream(f, "corpus.npy", total=1000000, dtype="float16"):
+            ...         print(n)
+            >>> np.load("corpus.npy", mmap_mode="r").shape
+            (1000000, 768)
 
         """
-        indices = self._model.encode(sent).to(self._device)
-        features, _ = self._model.model(
-            indices.unsqueeze(0),
-            features_only=True,
-        )
-        return features.squeeze(0).detach().cpu().numpy()
+        assert pooling is not None, "pooling is needed to write fixed size rows"
+
+        sents = iter(sents)
+        array, offset = None, 0
+        while True:
+            chunk = [sent.strip() for sent in islice(sents, chunk_size)]
+            if not chunk:
+                break
+            if offset + len(chunk) > total:
+                raise ValueError(f"More than {total} sentences are given")
+
+            for batch, features in self._extract(chunk, pooling, dtype,
+                                                 batch_size):
+                if array is None:
+                    array = np.lib.format.open_memmap(
+                        path,
+                        mode="w+",
+                        dtype=features.dtype,
+                        shape=(total, features.shape[-1]),
+                    )
+                array[[offset + i for i in batch]] = features
+
+            offset += len(chunk)
+            array.flush()
+            yield offset
@@ -3,6 +3,7 @@
 from typing import List, Optional, Tuple
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoDpFactory(PororoFactoryBase):
@@ -40,6 +41,12 @@ class PororoDpFactory(PororoFactoryBase):
     def get_available_models():
         return {"ko": ["posbert.base.ko.dp"]}
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
+    def get_dependencies(self):
+        return [("pos", self.config.lang, "mecab-ko")]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -61,11 +68,12 @@ class PororoDpFactory(PororoFactoryBase):
                 self.config.lang,
             ).eval().to(device))
 
-            tagger = PororoPosFactory(
+            tagger = PororoPosFactory.load_shared(
                 task="pos",
                 model="mecab-ko",
                 lang=self.config.lang,
-            ).load(device)
+                device=device,
+            )
 
             return PororoSegmentBertDP(model, tagger, self.config)
 
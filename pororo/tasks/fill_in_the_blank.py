@@ -1,13 +1,14 @@
 """Fill-in-the-blank related modeling class"""
 
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoBlankFactory(PororoFactoryBase):
     """
-    Conduct fill-in-the-blank with one __ token
+    Conduct fill-in-the-blank with __ tokens
 
     English (`roberta.base.en`)
 
@@ -30,10 +31,13 @@ class PororoBlankFactory(PororoFactoryBase):
         - metric: N/A
 
     Args:
-        sent(str): input sentence which contains one __ token
+        sent (Union[str, List[str]]): input sentence which contains __ tokens, or list of them
+        topk (int): number of candidates of each __ token
+        show_probs (bool): whether to return the probability of each candidate
+        batch_size (int): maximum number of sentences per forward pass
 
     Returns:
-        List[str]: token candidates could be fitted into __ token
+        List[str]: token candidates could be fitted into __ token, a list of them for each __ token if several are given. For list input, each sentence always gets one candidate list per __ token
 
     Examples:
         >>> fib = Pororo(task="fib", lang="en")
@@ -48,9 +52,15 @@ class PororoBlankFactory(PororoFactoryBase):
         >>> fib = Pororo(task="fib", lang="zh")
         >>> fib("三__男子在街上做同样的舞蹈。")
         ['个', '名', '位', '女', '组']
+        >>> fib = Pororo(task="fib", lang="en")
+        >>> fib(["David Beckham is a famous __ player.", "__ is the capital of __."], topk=3, show_probs=True)
+        [[[('football', 0.62), ('soccer', 0.21), ('basketball', 0.04)]],
+         [[('London', 0.21), ('Paris', 0.12), ('Berlin', 0.05)], [('England', 0.35), ('France', 0.18), ('Germany', 0.07)]]]
 
     """
 
+    supports_quantize = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -67,6 +77,9 @@ class PororoBlankFactory(PororoFactoryBase):
             "zh": ["zhberta.base.zh"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -84,6 +97,8 @@ class PororoBlankFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertBlank(model, self.config)
 
@@ -99,6 +114,7 @@ class PororoBlankFactory(PororoFactoryBase):
             model = (PosRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
             ).eval().to(device))
             return PororoBertBlank(model, self.config)
 
@@ -108,6 +124,8 @@ class PororoBlankFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertBlank(model, self.config)
 
@@ -117,6 +135,8 @@ class PororoBlankFactory(PororoFactoryBase):
             model = (ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertBlank(model, self.config)
 
@@ -142,21 +162,60 @@ class PororoBertBlank(PororoSimpleBase):
             "'",
             '"',
         ]
-
-    def predict(self, sent: str, **kwargs) -> List[str]:
+        self._special_idx = None
+        self._topk = 15 if "posbert" in config.n_model else 5
+
+    def _special_indices(self) -> List[int]:
+        """Returns indices of the tokens never to be filled in"""
+        if self._special_idx is None:
+            dictionary = self._model.task.source_dictionary
+            self._special_idx = [self._model.task.mask_idx] + [
+                index for index in range(len(dictionary))
+                if self._model.decode_candidate(index).strip() in
+                self._specials
+            ]
+        return self._special_idx
+
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        topk: Optional[int] = None,
+        show_probs: bool = False,
+        batch_size: int = 32,
+        **kwargs,
+    ):
         """
-        Conduct fill-in-the-blank with one __ token
+        Conduct fill-in-the-blank with __ tokens
 
         Args:
-            sent(str): input sentence which contains one __ token
+            sent (Union[str, List[str]]): input sentence which contains __ tokens, or list of them
+            topk (int): number of candidates of each __ token
+            show_probs (bool): whether to return the probability of each candidate
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            List[str]: token candidates could be fitted into __ token
+            List[str]: token candidates could be fitted into __ token, a list of them for each __ token if several are given. For list input, each sentence always gets one candidate list per __ token
 
         """
-
-        return [
-            token.strip()
-            for token in self._model.fill_mask(sent)
-            if token not in self._specials
-        ]
+        sents = [sent] if isinstance(sent, str) else sent
+
+        def _decode(index: int, prob: float):
+            token = self._model.decode_candidate(index).strip()
+            return (token, prob) if show_probs else token
+
+        results = []
+        for masks in self._model.fill_mask_batch(
+                sents,
+                topk=topk or self._topk,
+                batch_size=batch_size,
+                exclude=self._special_indices(),
+        ):
+            masks = [[_decode(*candidate)
+                      for candidate in candidates]
+                     for candidates in masks]
+            results.append(masks)
+
+        if isinstance(sent, str):
+            # A single blank of a single sentence is returned flat
+            return results[0][0] if len(results[0]) == 1 else results[0]
+        return results
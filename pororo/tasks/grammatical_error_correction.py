@@ -1,6 +1,7 @@
 """Grammatical Error Correction related modeling class"""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 
 from pororo.tasks.utils.base import (
@@ -8,7 +9,8 @@ from pororo.tasks.utils.base import (
     PororoGenerationBase,
     PororoSimpleBase,
 )
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.batching import plan_batches, translate_batch
+from pororo.tasks.utils.download_utils import bert_assets, download_or_load
 
 
 class PororoGecFactory(PororoFactoryBase):
@@ -32,7 +34,7 @@ class PororoGecFactory(PororoFactoryBase):
         - metric: F1 (89.51)
 
     Args:
-        text (str): input sentence to fix grammatical error
+        text (Union[str, List[str]]): input sentence, or list of sentences corrected in batches
         beam (int): size of beam search
         temperature (float): temperature for sampling
         top_k (int): variable for top k sampling
@@ -57,6 +59,8 @@ class PororoGecFactory(PororoFactoryBase):
         '카카오브레인에서는 무슨 일을 하나요?'
         >>> spacing("아버지가방에들어간다.")
         '아버지가 방에 들어간다.'
+        >>> spacing(["카 카오브 레인에서는 무슨 일을 하 나 요?", "아버지가방에들어간다."])
+        ['카카오브레인에서는 무슨 일을 하나요?', '아버지가 방에 들어간다.']
 
 
     Notes:
@@ -65,6 +69,15 @@ class PororoGecFactory(PororoFactoryBase):
 
     """
 
+    @property
+    def supports_quantize(self):
+        # Only the Korean spacing model is BERT-based
+        return "charbert" in self.config.n_model
+
+    @property
+    def supports_backend(self):
+        return "charbert" in self.config.n_model
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -82,6 +95,18 @@ class PororoGecFactory(PororoFactoryBase):
             "ko": ["charbert.base.ko.spacing"],
         }
 
+    def get_assets(self):
+        if "charbert" in self.config.n_model:
+            return bert_assets(self.config.n_model, self.config.lang)
+        return [(f"transformer/{self.config.n_model}", self.config.lang)]
+
+    def get_dependencies(self):
+        # `PororoTransformerGec` loads the char-level corrector on first use
+        if ("transformer" in self.config.n_model and
+                "char" not in self.config.n_model):
+            return [("gec", "en", "transformer.base.en.char_gec")]
+        return []
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -100,6 +125,8 @@ class PororoGecFactory(PororoFactoryBase):
             model = (CharBrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             print(
                 "As of now, this beta model tries to correct spacing errors in Korean text."
@@ -211,39 +238,48 @@ class PororoTransformerGecChar(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 5,
         temperature: float = 1.0,
         top_k: int = -1,
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
-    ):
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Union[str, List[str]]:
         """
         Conduct grammar error correction
 
         Args:
-            text (str): input sentence
+            text (Union[str, List[str]]): input sentence, or list of sentences to be corrected in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source characters per beam search
 
         Returns:
-            str: grammartically corrected sentence
+            Union[str, List[str]]: grammartically corrected sentence(s)
 
         """
+        sents = [text] if isinstance(text, str) else text
+        preprocessed = [self._preprocess(sent) for sent in sents]
+
         sampling = False
 
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        text, unks = self._preprocess(text)
-
-        output = self._model.translate(
-            text,
+        outputs = translate_batch(
+            self._model,
+            [sent for sent, _ in preprocessed],
+            batch_size=batch_size,
+            max_tokens=max_tokens,
             beam=beam,
             sampling=sampling,
             temperature=temperature,
@@ -254,9 +290,11 @@ class PororoTransformerGecChar(PororoGenerationBase):
             no_repeat_ngram_size=no_repeat_ngram_size,
             lenpen=len_penalty,
         )
-        output = self._postprocess(output, unks)
-
-        return output
+        outputs = [
+            self._postprocess(output, unks)
+            for output, (_, unks) in zip(outputs, preprocessed)
+        ]
+        return outputs[0] if isinstance(text, str) else outputs
 
 
 class PororoTransformerGec(PororoGenerationBase):
@@ -389,25 +427,31 @@ class PororoTransformerGec(PororoGenerationBase):
         output = self._despace_contracts(output)
         return output
 
-    def _correct_spell(self, text: str):
+    def _correct_spell(self, text: Union[str, List[str]], **kwargs):
         """
         Conduct error correction for spell
 
         Args:
-            text (str): input sentence
+            text (Union[str, List[str]]): input sentence(s)
+            **kwargs: batching options of the char-level corrector, e.g. `batch_size`
 
         Returns:
             result of spell error correction
 
         """
         if self._corrector is None:
-            self._corrector = PororoGecFactory(
+            self._corrector = PororoGecFactory.load_shared(
                 task="gec",
                 lang="en",
                 model="transformer.base.en.char_gec",
+                device=self._device,
             )
-            self._corrector = self._corrector.load(self._device)
-        return self._grammar_postprocess(self._corrector(text))
+        if isinstance(text, str):
+            return self._grammar_postprocess(self._corrector(text, **kwargs))
+        return [
+            self._grammar_postprocess(output)
+            for output in self._corrector(text, **kwargs)
+        ]
 
     def _grammar_postprocess(self, text: str):
         """
@@ -437,29 +481,33 @@ class PororoTransformerGec(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 5,
         temperature: float = 1.0,
         top_k: int = -1,
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
         **kwargs,
-    ):
+    ) -> Union[str, List[str]]:
         """
         Conduct grammar error correction
 
         Args:
-            text (str): input sentence
+            text (Union[str, List[str]]): input sentence, or list of sentences to be corrected in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
-            str: grammartically corrected sentence
+            Union[str, List[str]]: grammartically corrected sentence(s)
 
         Examples:
             >>> gec = Pororo(task="gec", model="transformer.base.en.gec", lang="en")
@@ -470,30 +518,62 @@ class PororoTransformerGec(PororoGenerationBase):
 
         """
         correct_spell = kwargs.get("correct_spell", False)
+        sents = [text] if isinstance(text, str) else text
 
         sampling = False
 
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        if correct_spell:
-            text = self._correct_spell(text)
+        def correct_grammar(batch: List[str]) -> List[str]:
+            outputs = translate_batch(
+                self._model,
+                [self._preprocess(sent) for sent in batch],
+                batch_size=batch_size,
+                max_tokens=max_tokens,
+                beam=beam,
+                sampling=sampling,
+                temperature=temperature,
+                sampling_topk=top_k,
+                sampling_topp=top_p,
+                max_len_a=1,
+                max_len_b=50,
+                no_repeat_ngram_size=no_repeat_ngram_size,
+                lenpen=len_penalty,
+            )
+            outputs = [self._postprocess(output) for output in outputs]
+            if correct_spell:
+                outputs = [self._grammar_postprocess(o) for o in outputs]
+            return outputs
+
+        if not correct_spell or not sents:
+            outputs = correct_grammar(sents)
+            return outputs[0] if isinstance(text, str) else outputs
+
+        def correct_spell_batch(batch: List[int]) -> List[str]:
+            return self._correct_spell(
+                [sents[i] for i in batch],
+                batch_size=batch_size,
+            )
 
-        text = self._preprocess(text)
-        output = self._model.translate(
-            text,
-            beam=beam,
-            sampling=sampling,
-            temperature=temperature,
-            sampling_topk=top_k,
-            sampling_topp=top_p,
-            max_len_a=1,
-            max_len_b=50,
-            no_repeat_ngram_size=no_repeat_ngram_size,
-            lenpen=len_penalty,
-        )
-        output = self._postprocess(output)
-        return self._grammar_postprocess(output) if correct_spell else output
+        # Both passes run over the same mini-batches of similar length sentences.
+        # The spell pass of the next mini-batch runs in the background while
+        # the grammar pass of the current one is decoded
+        plan = plan_batches([len(sent) for sent in sents], batch_size or 32)
+        outputs = list()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(correct_spell_batch, plan.batches[0])
+            for k in range(len(plan)):
+                spelled = pending.result()
+                if k + 1 < len(plan):
+                    pending = executor.submit(
+                        correct_spell_batch,
+                        plan.batches[k + 1],
+                    )
+                outputs.extend(correct_grammar(spelled))
+
+        outputs = plan.restore(outputs)
+        return outputs[0] if isinstance(text, str) else outputs
 
 
 class PororoBertSpacing(PororoSimpleBase):
@@ -527,24 +607,35 @@ class PororoBertSpacing(PororoSimpleBase):
 
         return result.replace("▁", " ").strip()
 
-    def predict(self, text: str, **kwargs) -> Union[List[str], str]:
+    def predict(
+        self,
+        text: Union[str, List[str]],
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Union[List[str], str]:
         """
         Conduct spacing correction
 
         Args:
-            text: (str) sentence to be spacing error corrected
+            text: (Union[str, List[str]]) sentence, or list of sentences to be spacing error corrected in batches
+            batch_size (int): maximum number of sentences per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
 
         Returns:
-            str: spacing error corrected sentence
+            Union[List[str], str]: spacing error corrected sentence(s)
 
         """
-        if isinstance(text, str):
-            text = [text]
+        sents = [text] if isinstance(text, str) else text
 
-        result = self._model.predict_tags(text)
+        result = self._model.predict_tags(
+            sents,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+        )
 
         li_result = []
         for r in result:
             li_result.append(self._postprocess(r))
 
-        return li_result if len(li_result) > 1 else li_result[0]
+        return li_result[0] if isinstance(text, str) else li_result
@@ -1,12 +1,13 @@
 """Phoneme to Grapheme related modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Union
 
 from pororo.tasks.utils.base import (
     PororoFactoryBase,
     PororoGenerationBase,
     PororoSimpleBase,
 )
+from pororo.tasks.utils.batching import translate_batch
 from pororo.tasks.utils.download_utils import download_or_load
 
 
@@ -48,6 +49,17 @@ class PororoP2gFactory(PororoFactoryBase):
             "ja": ["p2g.ja"],
         }
 
+    def get_assets(self):
+        if self.config.n_model == "p2g.zh":
+            return [
+                (f"misc/pinyin2idx.{self.config.lang}.pkl", self.config.lang),
+                (f"misc/char2idx.{self.config.lang}.pkl", self.config.lang),
+                (f"misc/{self.config.n_model}.pt", self.config.lang),
+            ]
+        if self.config.n_model == "p2g.ja":
+            return [("transformer/transformer.base.ja.p2g", self.config.lang)]
+        return []
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -153,40 +165,48 @@ class PororoP2GJa(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 5,
         temperature: float = 1.0,
         top_k: int = -1,
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
         **kwargs,
-    ) -> str:
+    ) -> Union[str, List[str]]:
         """
         Conduct paraphrase generation using Transformer Seq2Seq
 
         Args:
-            text (str): input sentence
+            text (Union[str, List[str]]): input sentence, or list of sentences to be converted in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source characters per beam search
 
         Returns:
-            str: generated paraphrase
+            Union[str, List[str]]: generated paraphrase(s)
 
         """
+        sents = [text] if isinstance(text, str) else text
+        sents = [self._preprocess(sent) for sent in sents]
+
         sampling = False
 
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        text = self._preprocess(text)
-
-        output = self._model.translate(
-            text,
+        outputs = translate_batch(
+            self._model,
+            sents,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
             beam=beam,
             sampling=sampling,
             temperature=temperature,
@@ -195,5 +215,5 @@ class PororoP2GJa(PororoGenerationBase):
             no_repeat_ngram_size=no_repeat_ngram_size,
             lenpen=len_penalty,
         )
-        output = self._postprocess(output)
-        return output
+        outputs = [self._postprocess(output) for output in outputs]
+        return outputs[0] if isinstance(text, str) else outputs
@@ -41,6 +41,14 @@ class PororoCaptionFactory(PororoFactoryBase):
             "ja": ["transformer.base.en.caption"],
         }
 
+    def get_assets(self):
+        return [(f"transformer/{self.config.n_model}", "en")]
+
+    def get_dependencies(self):
+        if self.config.lang != "en":
+            return [("mt", "multi", "transformer.large.multi.mtpg")]
+        return []
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -89,12 +97,12 @@ class PororoCaptionFactory(PororoFactoryBase):
                 ], "Unsupported language code is selected!"
                 from pororo.tasks import PororoTranslationFactory
 
-                translator = PororoTranslationFactory(
+                translator = PororoTranslationFactory.load_shared(
                     task="mt",
                     lang="multi",
                     model="transformer.large.multi.mtpg",
+                    device=device,
                 )
-                translator = translator.load(device)
 
             return PororoCaptionBrainCaption(
                 detr,
@@ -1,8 +1,9 @@
 """Reading Comprehension related modeling class"""
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from pororo.tasks.utils.base import PororoBiencoderBase, PororoFactoryBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoMrcFactory(PororoFactoryBase):
@@ -31,9 +32,15 @@ class PororoMrcFactory(PororoFactoryBase):
         >>> # when mecab doesn't work well for postprocess, you can set `postprocess` option as `False`
         >>> mrc("카카오브레인이 공개한 라이브러리 이름은?", "카카오브레인은 자연어 처리와 음성 관련 태스크를 쉽게 수행할 수 있도록 도와 주는 라이브러리 pororo를 공개하였습니다.", postprocess=False)
         ('pororo', (30, 34))
+        >>> # several (query, context) pairs can be given at once, and contexts longer than the model input are read in overlapping windows
+        >>> mrc([("카카오브레인이 공개한 라이브러리 이름은?", "카카오브레인은 자연어 처리와 음성 관련 태스크를 쉽게 수행할 수 있도록 도와 주는 라이브러리 pororo를 공개하였습니다.")], postprocess=False)
+        [('pororo', (30, 34))]
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -45,6 +52,9 @@ class PororoMrcFactory(PororoFactoryBase):
     def get_available_models():
         return {"ko": ["brainbert.base.ko.korquad"]}
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -69,6 +79,8 @@ class PororoMrcFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             tagger = mecab_ctypes.MeCab()
@@ -86,31 +98,38 @@ class PororoBertMrc(PororoBiencoderBase):
 
     def predict(
         self,
-        query: str,
-        context: str,
+        query: Union[str, List[Tuple[str, str]]],
+        context: Optional[str] = None,
         **kwargs,
-    ) -> Tuple[str, Tuple[int, int]]:
+    ) -> Union[Tuple[str, Tuple[int, int]], List[Tuple[str, Tuple[int, int]]]]:
         """
         Conduct machine reading comprehension with query and its corresponding context
 
         Args:
-            query: (str) query string used as query
+            query: (Union[str, List[Tuple[str, str]]]) query string used as query, or list of (query, context) pairs
             context: (str) context string used as context
             postprocess: (bool) whether to apply mecab based postprocess
+            doc_stride: (int) context tokens between the starts of two windows when the context is longer than the model input
+            batch_size: (int) maximum number of windows per forward pass
 
         Returns:
-            Tuple[str, Tuple[int, int]]: predicted answer span and its indices
+            Tuple[str, Tuple[int, int]]: predicted answer span and its indices, or a list of them for list input
 
         """
         postprocess = kwargs.get("postprocess", True)
 
-        pair_result = self._model.predict_span(query, context)
-        span = self._callback(
-            self._tagger,
-            pair_result[0],
-        ) if postprocess else pair_result[0]
+        pair_results = self._model.predict_span(
+            query if isinstance(query, list) else [(query, context)],
+            doc_stride=kwargs.get("doc_stride", 128),
+            batch_size=kwargs.get("batch_size", 32),
+        )
 
-        return (
-            span,
+        results = [(
+            self._callback(
+                self._tagger,
+                pair_result[0],
+            ) if postprocess else pair_result[0],
             pair_result[1],
-        )
+        ) for pair_result in pair_results]
+
+        return results if isinstance(query, list) else results[0]
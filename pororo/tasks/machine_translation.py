@@ -1,9 +1,18 @@
 """Machine-translation related modeling class"""
 
-from typing import Optional
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoGenerationBase
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.batching import translate_batch
+from pororo.tasks.utils.download_utils import download_or_load, get_save_dir
 
 
 class PororoTranslationFactory(PororoFactoryBase):
@@ -87,16 +96,27 @@ class PororoTranslationFactory(PororoFactoryBase):
         - note: This result is about out of domain settings, TED Talk data wasn't used during model training.
 
     Args:
-        text (str): input text to be translated
+        text (Union[str, List[str]]): input text, or list of documents to be translated in batches
         beam (int): beam search size
         temperature (float): temperature scale
         top_k (int): top-K sampling vocabulary size
         top_p (float): top-p sampling ratio
         no_repeat_ngram_size (int): no repeat ngram size
         len_penalty (float): length penalty ratio
+        batch_size (int): maximum number of sentences per beam search
+        max_tokens (int): maximum number of (padded) source tokens per beam search
+
+    Note:
+        With `translation_memory=True` (or the path of a SQLite file), beam search
+        translations are remembered across calls and processes, keyed by model,
+        languages, normalized sentence and decoding options. Sampling is never cached.
+        `mt.memory_stats()` reports hits, misses and latencies.
 
     Returns:
-        str: machine translated sentence
+        Union[str, List[str]]: machine translated text(s)
+
+    Long documents can also be translated with `mt.translate_stream(text, src, tgt)`,
+    which yields each translated sentence as soon as its mini-batch is decoded.
 
     Examples:
         >>> mt = Pororo(task="translation", lang="multi")
@@ -115,10 +135,14 @@ class PororoTranslationFactory(PororoFactoryBase):
         lang: str,
         model: Optional[str],
         tgt: str = None,
+        translation_memory: Union[bool, str] = False,
+        translation_memory_size: int = 1000000,
     ):
         super().__init__(task, lang, model)
         self._src = self.config.lang
         self._tgt = tgt
+        self._memory_path = translation_memory
+        self._memory_size = translation_memory_size
 
     @staticmethod
     def get_available_langs():
@@ -133,6 +157,16 @@ class PororoTranslationFactory(PororoFactoryBase):
             ],
         }
 
+    def get_assets(self):
+        return [(f"transformer/{self.config.n_model}", self.config.lang)]
+
+    def get_dependencies(self):
+        # Sentence tokenizers are loaded per source language on first use
+        return [
+            ("tokenization", lang, f"sent_{lang}")
+            for lang in ["en", "ko", "ja", "zh"]
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -146,11 +180,17 @@ class PororoTranslationFactory(PororoFactoryBase):
         """
         from pororo.tasks import PororoTokenizationFactory
 
-        sent_tokenizer = (lambda text, lang: PororoTokenizationFactory(
-            task="tokenization",
-            lang=lang,
-            model=f"sent_{lang}",
-        ).load(device).predict(text))
+        sent_tokenizers = dict()
+
+        def sent_tokenizer(text: str, lang: str):
+            if lang not in sent_tokenizers:
+                sent_tokenizers[lang] = PororoTokenizationFactory.load_shared(
+                    task="tokenization",
+                    lang=lang,
+                    model=f"sent_{lang}",
+                    device=device,
+                )
+            return sent_tokenizers[lang].predict(text)
 
         if "multi" in self.config.n_model:
             from fairseq.models.transformer import TransformerModel
@@ -182,23 +222,180 @@ class PororoTranslationFactory(PororoFactoryBase):
             else:
                 langtok_style = "basic"
 
+            memory = None
+            if self._memory_path:
+                memory = TranslationMemory(
+                    self._memory_path if isinstance(self._memory_path, str)
+                    else os.path.join(get_save_dir(), "translation_memory.db"),
+                    max_entries=self._memory_size,
+                )
+
             return PororoTransformerTransMulti(
                 model,
                 self.config,
                 tokenizer,
                 sent_tokenizer,
                 langtok_style,
+                memory,
+            )
+
+
+class TranslationMemory(object):
+    """
+    Translations of previously seen sentences, kept in an in-memory LRU in
+    front of a SQLite store that outlives the process
+
+    Args:
+        path (str): SQLite file path
+        max_entries (int): maximum number of translations kept on disk, least recently used ones are evicted first
+        capacity (int): maximum number of translations kept in memory
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1000000,
+        capacity: int = 10000,
+    ):
+        import sqlite3
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS memory "
+                         "(key TEXT PRIMARY KEY, output TEXT, used REAL)")
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS memory_used ON memory (used)")
+        self._db.commit()
+
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.capacity = capacity
+
+        self.memory_hits, self.disk_hits, self.misses = 0, 0, 0
+        self.lookup_time, self.translate_time = 0.0, 0.0
+
+    @staticmethod
+    def key(*fields) -> str:
+        """Hash of the fields a translation depends on"""
+        fields = json.dumps(fields, ensure_ascii=False)
+        return hashlib.sha1(fields.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, output: str):
+        self._lru[key] = output
+        self._lru.move_to_end(key)
+        if len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """Returns the remembered translation of each key, None if unseen"""
+        start = time.perf_counter()
+        outputs, used = list(), list()
+
+        with self._lock:
+            for key in keys:
+                output = self._lru.get(key)
+                if output is not None:
+                    self._lru.move_to_end(key)
+                    self.memory_hits += 1
+                    outputs.append(output)
+                    continue
+
+                row = self._db.execute(
+                    "SELECT output FROM memory WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    outputs.append(None)
+                    continue
+
+                self._remember(key, row[0])
+                self.disk_hits += 1
+                outputs.append(row[0])
+                used.append((time.time(), key))
+
+            if used:
+                self._db.executemany(
+                    "UPDATE memory SET used = ? WHERE key = ?",
+                    used,
+                )
+                self._db.commit()
+            self.lookup_time += time.perf_counter() - start
+        return outputs
+
+    def put_many(self, items: List[Tuple[str, str]], elapsed: float = 0.0):
+        """
+        Remember new translations
+
+        Args:
+            items (List[Tuple[str, str]]): (key, translation) pairs
+            elapsed (float): seconds spent translating them, for `stats`
+
+        """
+        now = time.time()
+        with self._lock:
+            for key, output in items:
+                self._remember(key, output)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO memory VALUES (?, ?, ?)",
+                [(key, output, now) for key, output in items],
             )
 
+            # Evict least recently used translations over the size limit
+            size = self._db.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+            if size > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM memory WHERE key IN "
+                    "(SELECT key FROM memory ORDER BY used LIMIT ?)",
+                    (size - self.max_entries,),
+                )
+            self._db.commit()
+            self.translate_time += elapsed
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns hit and latency counters since the memory was opened
+
+        Returns:
+            Dict[str, float]: hits, misses, hit rate, mean lookup time per sentence and mean translation time per missed sentence (ms)
+
+        """
+        hits = self.memory_hits + self.disk_hits
+        lookups = max(hits + self.misses, 1)
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups,
+            "lookup_ms": self.lookup_time * 1000 / lookups,
+            "translate_ms": self.translate_time * 1000 / max(self.misses, 1),
+        }
+
 
 class PororoTransformerTransMulti(PororoGenerationBase):
 
-    def __init__(self, model, config, tokenizer, sent_tokenizer, langtok_style):
+    def __init__(
+        self,
+        model,
+        config,
+        tokenizer,
+        sent_tokenizer,
+        langtok_style,
+        memory: Optional[TranslationMemory] = None,
+    ):
         super().__init__(config)
         self._model = model
         self._tokenizer = tokenizer
         self._sent_tokenizer = sent_tokenizer
         self._langtok_style = langtok_style
+        self._memory = memory
+
+    def memory_stats(self) -> Dict[str, float]:
+        """Returns translation memory counters, empty without translation memory"""
+        return self._memory.stats() if self._memory is not None else {}
 
     def _langtok(self, lang: str, langtok_style: str):
         """
@@ -254,7 +451,7 @@ class PororoTransformerTransMulti(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         src: str,
         tgt: str,
         beam: int = 5,
@@ -263,49 +460,90 @@ class PororoTransformerTransMulti(PororoGenerationBase):
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
         **kwargs,
-    ) -> str:
+    ) -> Union[str, List[str]]:
         """
         Conduct machine translation
 
         Args:
-            text (str): input text to be translated
+            text (Union[str, List[str]]): input sentence, or list of sentences to be translated in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
-            str: machine translated sentence
+            Union[str, List[str]]: machine translated sentence(s)
 
         """
-        text = self._preprocess(text, src, tgt)
+        # Remembered and freshly translated sentences share the same model input
+        sents = [
+            self._normalize(sent)
+            for sent in ([text] if isinstance(text, str) else text)
+        ]
 
         sampling = False
 
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        output = self._model.translate(
-            text,
-            beam=beam,
-            sampling=sampling,
-            temperature=temperature,
-            sampling_topk=top_k,
-            sampling_topp=top_p,
-            max_len_a=1,
-            max_len_b=50,
-            no_repeat_ngram_size=no_repeat_ngram_size,
-            lenpen=len_penalty,
-        )
-        output = self._postprocess(output)
-        return output
+        # Sampled translations vary between calls, so they are never remembered
+        use_memory = self._memory is not None and not sampling
+        outputs = [None] * len(sents)
+        if use_memory:
+            keys = [
+                self._memory.key(
+                    self.config.n_model,
+                    src,
+                    tgt,
+                    sent,
+                    beam,
+                    temperature,
+                    no_repeat_ngram_size,
+                    len_penalty,
+                ) for sent in sents
+            ]
+            outputs = self._memory.get_many(keys)
+
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing:
+            start = time.perf_counter()
+            translated = translate_batch(
+                self._model,
+                [self._preprocess(sents[i], src, tgt) for i in missing],
+                batch_size=batch_size,
+                max_tokens=max_tokens,
+                beam=beam,
+                sampling=sampling,
+                temperature=temperature,
+                sampling_topk=top_k,
+                sampling_topp=top_p,
+                max_len_a=1,
+                max_len_b=50,
+                no_repeat_ngram_size=no_repeat_ngram_size,
+                lenpen=len_penalty,
+            )
+            translated = [self._postprocess(output) for output in translated]
+
+            if use_memory:
+                self._memory.put_many(
+                    [(keys[i], output) for i, output in zip(missing, translated)],
+                    elapsed=time.perf_counter() - start,
+                )
+            for i, output in zip(missing, translated):
+                outputs[i] = output
+
+        return outputs[0] if isinstance(text, str) else outputs
 
     def __call__(
         self,
-        text: str,
+        text: Union[str, List[str]],
         src: str,
         tgt: str,
         beam: int = 5,
@@ -314,8 +552,10 @@ class PororoTransformerTransMulti(PororoGenerationBase):
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        **kwargs,
     ):
-        assert isinstance(text, str), "Input text should be string type"
+        assert isinstance(text, str) or isinstance(
+            text, list), "Input text should be string or list of string type"
 
         assert src in [
             "ko",
@@ -331,9 +571,13 @@ class PororoTransformerTransMulti(PororoGenerationBase):
             "en",
         ], "Target language must be one of CJKE !"
 
-        return " ".join([
+        docs = [text] if isinstance(text, str) else text
+
+        # Sentences of every document are translated in batches at once
+        sents = [self._sent_tokenizer(doc, src) for doc in docs]
+        outputs = iter(
             self.predict(
-                t,
+                [sent for doc in sents for sent in doc],
                 src,
                 tgt,
                 beam,
@@ -342,5 +586,92 @@ class PororoTransformerTransMulti(PororoGenerationBase):
                 top_p,
                 no_repeat_ngram_size,
                 len_penalty,
-            ) for t in self._sent_tokenizer(text, src)
-        ])
+                **kwargs,
+            ))
+        results = [" ".join(next(outputs) for _ in doc) for doc in sents]
+        return results[0] if isinstance(text, str) else results
+
+    def translate_stream(
+        self,
+        text: Union[str, Iterable[str]],
+        src: str,
+        tgt: str,
+        batch_size: int = 8,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Translate a long document sentence by sentence, yielding each
+        translation as soon as its mini-batch is decoded
+
+        Args:
+            text (Union[str, Iterable[str]]): input document, or iterable of sentences (e.g. speech sections) consumed lazily
+            src (str): source language
+            tgt (str): target language
+            batch_size (int): number of sentences decoded together, the first translation comes after one mini-batch
+            prefetch (bool): whether to decode the next mini-batch in the background while the current one is consumed
+            **kwargs: decoding options of `predict`, e.g. `beam`
+
+        Yields:
+            str: translation of each sentence, in order
+
+        """
+        sents = iter(
+            self._sent_tokenizer(text, src) if isinstance(text, str) else text)
+        batches = iter(lambda: list(islice(sents, batch_size)), [])
+
+        def translate(batch: List[str]) -> List[str]:
+            return self.predict(batch, src, tgt, batch_size=batch_size, **kwargs)
+
+        if not prefetch:
+            for batch in batches:
+                yield from translate(batch)
+            return
+
+        # At most one mini-batch is decoded ahead of the one being consumed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for batch in batches:
+                future = executor.submit(translate, batch)
+                if pending is not None:
+                    yield from pending.result()
+                pending = future
+            if pending is not None:
+                yield from pending.result()
+
+    def translate_documents_stream(
+        self,
+        docs: List[str],
+        src: str,
+        tgt: str,
+        batch_size: int = 8,
+        prefetch: bool = True,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Translate documents sentence by sentence as `__call__` does, yielding
+        each document's translation as soon as its last sentence is decoded
+
+        Args:
+            docs (List[str]): input documents (e.g. speech sections)
+            src (str): source language
+            tgt (str): target language
+            batch_size (int): number of sentences decoded together, across document boundaries
+            prefetch (bool): whether to decode the next mini-batch in the background while the current one is consumed
+            **kwargs: decoding options of `predict`, e.g. `beam`
+
+        Yields:
+            str: translation of each document, in order
+
+        """
+        sents = [self._sent_tokenizer(doc, src) for doc in docs]
+        outputs = self.translate_stream(
+            (sent for doc in sents for sent in doc),
+            src,
+            tgt,
+            batch_size=batch_size,
+            prefetch=prefetch,
+            **kwargs,
+        )
+        for doc in sents:
+            yield " ".join(next(outputs) for _ in doc)
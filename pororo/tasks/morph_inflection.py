@@ -60,6 +60,14 @@ class PororoInflectionFactory(PororoFactoryBase):
             "ja": ["japaradigm"],
         }
 
+    def get_assets(self):
+        if self.config.n_model in ["enparadigm", "japaradigm"]:
+            return [(
+                f"misc/inflection.{self.config.lang}.pickle",
+                self.config.lang,
+            )]
+        return []
+
     def load(self, device: int):
         """
         Load user-selected task-specific model
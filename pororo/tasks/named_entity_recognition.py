@@ -2,10 +2,10 @@
 
 import re
 from collections import defaultdict
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.download_utils import bert_assets, download_or_load
 
 
 class PororoNerFactory(PororoFactoryBase):
@@ -58,6 +58,9 @@ class PororoNerFactory(PororoFactoryBase):
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -74,6 +77,25 @@ class PororoNerFactory(PororoFactoryBase):
             "ja": ["jaberta.base.ja.ner"],
         }
 
+    def get_assets(self):
+        assets = bert_assets(self.config.n_model, self.config.lang)
+        if "charbert" in self.config.n_model:
+            assets += [
+                (f"misc/wiki.{self.config.lang}.items", self.config.lang),
+                # Fetched on first call with `apply_wsd=True`
+                ("misc/wsd.cls.txt", self.config.lang),
+                ("misc/re.templates.txt", self.config.lang),
+            ]
+        return assets
+
+    def get_dependencies(self):
+        if "charbert" in self.config.n_model:
+            return [
+                ("tokenization", self.config.lang, "sent_ko"),
+                ("wsd", "ko", "transformer.large.ko.wsd"),
+            ]
+        return []
+
     def load(self, device):
         """
         Load user-selected task-specific model
@@ -91,6 +113,8 @@ class PororoNerFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNerEn(model, self.config)
 
@@ -101,13 +125,16 @@ class PororoNerFactory(PororoFactoryBase):
             model = (CharBrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
-            sent_tokenizer = PororoTokenizationFactory(
+            sent_tokenizer = PororoTokenizationFactory.load_shared(
                 task="tokenization",
                 model="sent_ko",
                 lang=self.config.lang,
-            ).load(device)
+                device=device,
+            )
 
             f_wsd_dict = open(
                 download_or_load(
@@ -135,6 +162,8 @@ class PororoNerFactory(PororoFactoryBase):
             model = (ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNerZh(model, self.config)
 
@@ -144,6 +173,8 @@ class PororoNerFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNerJa(model, self.config)
 
@@ -198,18 +229,27 @@ class PororoBertNerEn(PororoSimpleBase):
             result.append((word, _remove_tail(tag)))
         return [pair for pair in result if pair[0] != ""]
 
-    def predict(self, sent: str, **kwargs):
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        batch_size: int = 32,
+        **kwargs,
+    ):
         """
         Conduct named entity recognition with english RoBERTa
 
         Args:
-            sent: (str) sentence to be sequence labeled
+            sent: (Union[str, List[str]]) sentence or list of sentences to be sequence labeled
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            List[Tuple[str, str]]: token and its predicted tag tuple list
+            List[Tuple[str, str]]: token and its predicted tag tuple list, or a list of them for list input
 
         """
-        return self._postprocess(self._model.predict_tags(sent))
+        tags = self._model.predict_tags(sent, batch_size=batch_size)
+        if isinstance(sent, str):
+            return self._postprocess(tags)
+        return [self._postprocess(tag) for tag in tags]
 
 
 class PororoBertCharNer(PororoSimpleBase):
@@ -286,24 +326,25 @@ class PororoBertCharNer(PororoSimpleBase):
                 result.append(pair)
         return result
 
-    def _apply_wsd(self, tags: List[Tuple[str, str]]):
+    def _apply_wsd(self, tags: List[List[Tuple[str, str]]]):
         """
         Apply Word Sense Disambiguation to get detail tag info
 
         Args:
-            tags (List[Tuple[str, str]]): inference word-tag pair result
+            tags (List[List[Tuple[str, str]]]): inference word-tag pair result of each sentence
 
         Returns:
-            List[Tuple[str, str]]: wsd-applied result
+            List[List[Tuple[str, str]]]: wsd-applied result of each sentence
 
         """
         if self._wsd is None:
             from pororo.tasks import PororoWsdFactory
-            self._wsd = PororoWsdFactory(
+            self._wsd = PororoWsdFactory.load_shared(
                 task="wsd",
                 lang="ko",
                 model="transformer.large.ko.wsd",
-            ).load(self._device)
+                device=self._device,
+            )
 
         if self._cls2cat is None:
             self._cls2cat = dict()
@@ -338,6 +379,34 @@ class PororoBertCharNer(PororoSimpleBase):
                 elif ner_category == "TERM":
                     self._term2cat[expression] = category
 
+        marked = [self._mark_quantities(sent_tags) for sent_tags in tags]
+        wsd_results = self._wsd([text for text, _ in marked]) if marked else []
+
+        for sent_tags, (_, target_token_ids), wsd_result in zip(
+                tags,
+                marked,
+                wsd_results,
+        ):
+            categories = self._quantity_categories(wsd_result)
+            assert len(target_token_ids) == len(categories)
+
+            for target_token_id, cat in zip(target_token_ids, categories):
+                sent_tags[target_token_id] = (sent_tags[target_token_id][0],
+                                              cat)
+
+        return tags
+
+    def _mark_quantities(self, tags: List[Tuple[str, str]]):
+        """
+        Apply template match and surround the remaining quantities with markers
+
+        Args:
+            tags (List[Tuple[str, str]]): inference word-tag pair result
+
+        Returns:
+            Tuple[str, List[int]]: wsd input text and the indices of the marked tokens
+
+        """
         input_text_with_markers = str()
         target_token_ids = []
 
@@ -363,7 +432,19 @@ class PororoBertCharNer(PororoSimpleBase):
             else:
                 input_text_with_markers += surface
 
-        wsd_results = self._wsd(input_text_with_markers)
+        return input_text_with_markers, target_token_ids
+
+    def _quantity_categories(self, wsd_results):
+        """
+        Find the category of each marked quantity from wsd result
+
+        Args:
+            wsd_results (List[detail]): wsd result of the marked sentence
+
+        Returns:
+            List[str]: category of each marked quantity
+
+        """
         action = False
         has_category = False
         categories = []
@@ -390,12 +471,7 @@ class PororoBertCharNer(PororoSimpleBase):
                     has_category = True
                     action = False
 
-        assert len(target_token_ids) == len(categories)
-
-        for target_token_id, cat in zip(target_token_ids, categories):
-            tags[target_token_id] = (tags[target_token_id][0], cat)
-
-        return tags
+        return categories
 
     def _postprocess(self, tags: List[Tuple[str, str]]):
         """
@@ -449,41 +525,63 @@ class PororoBertCharNer(PororoSimpleBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
+        batch_size: int = 32,
         **kwargs,
     ):
         """
         Conduct named entity recognition with character BERT
 
         Args:
-            text: (str) sentence to be sequence labeled
+            text: (Union[str, List[str]]) document or list of documents to be sequence labeled
+            batch_size (int): maximum number of sentences per forward pass
             apply_wsd: (bool) whether to apply wsd to get more specific label information
             ignore_labels: (list) labels to be ignored
 
         Returns:
-            List[Tuple[str, str]]: token and its predicted tag tuple list
+            List[Tuple[str, str]]: token and its predicted tag tuple list, or a list of them for list input
 
         """
         apply_wsd = kwargs.get("apply_wsd", False)
         ignore_labels = kwargs.get("ignore_labels", [])
 
-        texts = text.strip().split("\n")
-        result = []
-        for text in texts:
-            for sent in self._sent_tokenizer(text.strip()):
-                res = self._model.predict_tags(sent)
-                res = [
-                    pair for pair in self._postprocess(res)
-                    if pair[1] not in ignore_labels
-                ]
-                res = [(
-                    pair[0],
-                    self._tag[pair[1]],
-                ) if pair[1] in self._tag else pair for pair in res]
-                res = res if not apply_wsd else self._apply_wsd(res)
-                result.extend(self.apply_dict(res))
+        docs = [text] if isinstance(text, str) else text
+
+        # Tag the sentences of every document at once
+        sents, n_sents = list(), list()
+        for doc in docs:
+            n_sent = 0
+            for line in doc.strip().split("\n"):
+                for sent in self._sent_tokenizer(line.strip()):
+                    sents.append(sent)
+                    n_sent += 1
+            n_sents.append(n_sent)
+
+        tags = self._model.predict_tags(sents, batch_size=batch_size)
+
+        res = list()
+        for tag in tags:
+            tag = [
+                pair for pair in self._postprocess(tag)
+                if pair[1] not in ignore_labels
+            ]
+            res.append([(
+                pair[0],
+                self._tag[pair[1]],
+            ) if pair[1] in self._tag else pair for pair in tag])
+        res = res if not apply_wsd else self._apply_wsd(res)
+        res = [self.apply_dict(tag) for tag in res]
+
+        results, offset = list(), 0
+        for n_sent in n_sents:
+            result = []
+            for tag in res[offset:offset + n_sent]:
+                result.extend(tag)
                 result.extend([(" ", "O")])
-        return result[:-1]
+            results.append(result[:-1])
+            offset += n_sent
+
+        return results[0] if isinstance(text, str) else results
 
 
 class PororoBertNerZh(PororoSimpleBase):
@@ -530,19 +628,27 @@ class PororoBertNerZh(PororoSimpleBase):
         result.append((word, _remove_tail(tag)))
         return result
 
-    def predict(self, sent: str, **kwargs):
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        batch_size: int = 32,
+        **kwargs,
+    ):
         """
         Conduct named entity recognition with Chinese RoBERTa
 
         Args:
-            sent: (str) sentence to be sequence labeled
+            sent: (Union[str, List[str]]) sentence or list of sentences to be sequence labeled
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            List[Tuple[str, str]]: token and its predicted tag tuple list
+            List[Tuple[str, str]]: token and its predicted tag tuple list, or a list of them for list input
 
         """
-        tags = self._model.predict_tags(sent)
-        return self._postprocess(tags)
+        tags = self._model.predict_tags(sent, batch_size=batch_size)
+        if isinstance(sent, str):
+            return self._postprocess(tags)
+        return [self._postprocess(tag) for tag in tags]
 
 
 class PororoBertNerJa(PororoSimpleBase):
@@ -589,15 +695,24 @@ class PororoBertNerJa(PororoSimpleBase):
         result.append((word.replace("##", ""), _remove_tail(tag)))
         return result
 
-    def predict(self, sent: str, **kwargs):
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        batch_size: int = 32,
+        **kwargs,
+    ):
         """
         Conduct named entity recognition with Japanese RoBERTa
 
         Args:
-            sent: (str) sentence to be sequence labeled
+            sent: (Union[str, List[str]]) sentence or list of sentences to be sequence labeled
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            List[Tuple[str, str]]: token and its predicted tag tuple list
+            List[Tuple[str, str]]: token and its predicted tag tuple list, or a list of them for list input
 
         """
-        return self._postprocess(self._model.predict_tags(sent))
+        tags = self._model.predict_tags(sent, batch_size=batch_size)
+        if isinstance(sent, str):
+            return self._postprocess(tags)
+        return [self._postprocess(tag) for tag in tags]
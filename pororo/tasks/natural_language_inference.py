@@ -1,8 +1,9 @@
 """Natural Language Inference related modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 from pororo.tasks.utils.base import PororoBiencoderBase, PororoFactoryBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoNliFactory(PororoFactoryBase):
@@ -46,6 +47,9 @@ class PororoNliFactory(PororoFactoryBase):
         'Entailment'
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -62,6 +66,9 @@ class PororoNliFactory(PororoFactoryBase):
             "zh": ["zhberta.base.zh.nli"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device):
         """
         Load user-selected task-specific model
@@ -79,6 +86,8 @@ class PororoNliFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNli(model, self.config)
 
@@ -88,6 +97,8 @@ class PororoNliFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNli(model, self.config)
 
@@ -97,6 +108,8 @@ class PororoNliFactory(PororoFactoryBase):
             model = (ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNli(model, self.config)
 
@@ -106,6 +119,8 @@ class PororoNliFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertNli(model, self.config)
 
@@ -118,19 +133,25 @@ class PororoBertNli(PororoBiencoderBase):
 
     def predict(
         self,
-        sent_a: str,
-        sent_b: str,
+        sent_a: Union[str, List[Tuple[str, str]]],
+        sent_b: Optional[str] = None,
         **kwargs,
-    ):
+    ) -> Union[str, List[str]]:
         """
         Conduct Natural Language Inference
 
         Args:
-            sent_a: (str) first sentence to be encoded
+            sent_a: (Union[str, List[Tuple[str, str]]]) first sentence to be encoded or list of sentence pairs
             sent_b: (str) second sentence to be encoded
+            batch_size: (int) maximum number of pairs per forward pass
 
         Returns:
-            str: predicted NLI label - Neutral, Entailment, or Contradiction
+            Union[str, List[str]]: predicted NLI label - Neutral, Entailment, or Contradiction
 
         """
+        if isinstance(sent_a, list):
+            batch_size = kwargs.get("batch_size", 32)
+            labels = self._model.predict_output(sent_a, batch_size=batch_size)
+            return [label.capitalize() for label in labels]
+
         return self._model.predict_output(sent_a, sent_b).capitalize()
@@ -64,6 +64,13 @@ class PororoOcrFactory(PororoFactoryBase):
             "ko": ["brainocr"],
         }
 
+    def get_assets(self):
+        return [
+            (f"misc/{self.detect_model}.pt", self.config.lang),
+            (f"misc/{self.config.n_model}.pt", self.config.lang),
+            (f"misc/{self.ocr_opt}.txt", self.config.lang),
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -1,8 +1,9 @@
 """Paraphrase Generation modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoGenerationBase
+from pororo.tasks.utils.batching import translate_batch
 from pororo.tasks.utils.download_utils import download_or_load
 
 
@@ -49,16 +50,18 @@ class PororoParaphraseFactory(PororoFactoryBase):
             +----------+------------+
 
     Args:
-        text (str): input sentence to be paraphrase generated
+        text (Union[str, List[str]]): input sentence, or list of sentences to be paraphrase generated in batches
         beam (int): beam search size
         temperature (float): temperature scale
         top_k (int): top-K sampling vocabulary size
         top_p (float): top-p sampling ratio
         no_repeat_ngram_size (int): no repeat ngram size
         len_penalty (float): length penalty ratio
+        batch_size (int): maximum number of sentences per beam search
+        max_tokens (int): maximum number of (padded) source tokens per beam search
 
     Returns:
-        str: generated paraphrase
+        Union[str, List[str]]: generated paraphrase(s)
 
     Examples:
         >>> pg = Pororo(task="pg", lang="ko")
@@ -111,6 +114,11 @@ class PororoParaphraseFactory(PororoFactoryBase):
             ],
         }
 
+    def get_assets(self):
+        if "multi" in self.config.n_model:
+            return [(f"transformer/{self.config.n_model}", "multi")]
+        return [(f"transformer/{self.config.n_model}", self.config.lang)]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -230,40 +238,48 @@ class PororoTransformerTransMulti(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 5,
         temperature: float = 1.0,
         top_k: int = -1,
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
         **kwargs,
-    ) -> str:
+    ) -> Union[str, List[str]]:
         """
         Conduct machine translation
 
         Args:
-            text (str): input sentence to be paraphrase generated
+            text (Union[str, List[str]]): input sentence, or list of sentences to be paraphrase generated in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
-            str: machine translated sentence
+            Union[str, List[str]]: machine translated sentence(s)
 
         """
-        text = self._preprocess(text)
+        sents = [text] if isinstance(text, str) else text
+        sents = [self._preprocess(sent) for sent in sents]
 
         sampling = False
 
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        output = self._model.translate(
-            text,
+        outputs = translate_batch(
+            self._model,
+            sents,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
             beam=beam,
             sampling=sampling,
             temperature=temperature,
@@ -274,8 +290,8 @@ class PororoTransformerTransMulti(PororoGenerationBase):
             no_repeat_ngram_size=no_repeat_ngram_size,
             lenpen=len_penalty,
         )
-        output = self._postprocess(output)
-        return output
+        outputs = [self._postprocess(output) for output in outputs]
+        return outputs[0] if isinstance(text, str) else outputs
 
 
 class PororoTransformerParaphrase(PororoGenerationBase):
@@ -327,29 +343,33 @@ class PororoTransformerParaphrase(PororoGenerationBase):
 
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 1,
         temperature: float = 1.0,
         top_k: int = -1,
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 32,
+        max_tokens: Optional[int] = None,
         **kwargs,
     ):
         """
         Conduct paraphrase generation using Transformer Seq2Seq
 
         Args:
-            text (str): input sentence to be paraphrase generated
+            text (Union[str, List[str]]): input sentence, or list of sentences to be paraphrase generated in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of sentences per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
-            str: generated paraphrase
+            Union[str, List[str]]: generated paraphrase(s)
 
         """
         sampling = False
@@ -357,13 +377,17 @@ class PororoTransformerParaphrase(PororoGenerationBase):
         if top_k != -1 or top_p != -1:
             sampling = True
 
+        sents = [text] if isinstance(text, str) else text
         if self._tokenizer is not None:
-            text = self._preprocess(text)
+            sents = [self._preprocess(sent) for sent in sents]
         else:
-            text = self._zh_preprocess(text)
+            sents = [self._zh_preprocess(sent) for sent in sents]
 
-        output = self._model.translate(
-            text,
+        outputs = translate_batch(
+            self._model,
+            sents,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
             beam=beam,
             sampling=sampling,
             temperature=temperature,
@@ -374,5 +398,5 @@ class PororoTransformerParaphrase(PororoGenerationBase):
             no_repeat_ngram_size=no_repeat_ngram_size,
             lenpen=len_penalty,
         )
-        output = self._postprocess(output)
-        return output
+        outputs = [self._postprocess(output) for output in outputs]
+        return outputs[0] if isinstance(text, str) else outputs
@@ -1,8 +1,9 @@
 """Paraphrase Identification related modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 from pororo.tasks.utils.base import PororoBiencoderBase, PororoFactoryBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoParaIdFactory(PororoFactoryBase):
@@ -30,6 +31,9 @@ class PororoParaIdFactory(PororoFactoryBase):
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -41,6 +45,9 @@ class PororoParaIdFactory(PororoFactoryBase):
     def get_available_models():
         return {"ko": ["brainbert.base.ko.paws"]}
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -58,6 +65,8 @@ class PororoParaIdFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertParaId(model, self.config)
 
@@ -72,16 +81,27 @@ class PororoBertParaId(PororoBiencoderBase):
             "1": "Paraphrase",
         }
 
-    def predict(self, sent_a: str, sent_b: str, **kwargs):
+    def predict(
+        self,
+        sent_a: Union[str, List[Tuple[str, str]]],
+        sent_b: Optional[str] = None,
+        **kwargs,
+    ):
         """
         Conduct paraphrase identification
 
         Args:
-            sent_a (str): first sentence to be encoded
+            sent_a (Union[str, List[Tuple[str, str]]]): first sentence to be encoded or list of sentence pairs
             sent_b (str): second sentence to be encoded
+            batch_size (int): maximum number of pairs per forward pass
 
         Returns:
-            str: paraphrase identified result - `Not Paraphrase` or `Paraphrase`
+            Union[str, List[str]]: paraphrase identified result - `Not Paraphrase` or `Paraphrase`
 
         """
+        if isinstance(sent_a, list):
+            batch_size = kwargs.get("batch_size", 32)
+            labels = self._model.predict_output(sent_a, batch_size=batch_size)
+            return [self._label_fn[label] for label in labels]
+
         return self._label_fn[self._model.predict_output(sent_a, sent_b)]
@@ -8,7 +8,7 @@ from typing import List, Optional, Union
 from whoosh.qparser import QueryParser
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoGenerationBase
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.download_utils import VEC_MAP, download_or_load
 
 
 class PororoQuestionGenerationFactory(PororoFactoryBase):
@@ -93,6 +93,20 @@ class PororoQuestionGenerationFactory(PororoFactoryBase):
             "ko": ["kobart.base.ko.qg"],
         }
 
+    def get_assets(self):
+        return [
+            (f"misc/{VEC_MAP[self.config.lang]}", self.config.lang),
+            (f"misc/{self.config.lang}_indexdir.zip", self.config.lang),
+            (f"bart/{self.config.n_model}", self.config.lang),
+        ]
+
+    def get_dependencies(self):
+        return [(
+            "tokenization",
+            self.config.lang,
+            f"sent_{self.config.lang}",
+        )]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -111,15 +125,8 @@ class PororoQuestionGenerationFactory(PororoFactoryBase):
             from pororo.models.wikipedia2vec import Wikipedia2Vec
             from pororo.tasks import PororoTokenizationFactory
 
-            vec_map = {
-                "ko": "kowiki_20200720_100d.pkl",
-                "en": "enwiki_20180420_100d.pkl",
-                "ja": "jawiki_20180420_100d.pkl",
-                "zh": "zhwiki_20180420_100d.pkl",
-            }
-
             f_wikipedia2vec = download_or_load(
-                f"misc/{vec_map[self.config.lang]}",
+                f"misc/{VEC_MAP[self.config.lang]}",
                 self.config.lang,
             )
 
@@ -143,11 +150,12 @@ class PororoQuestionGenerationFactory(PororoFactoryBase):
                 model_path=model_path,
             )
 
-            sent_tok = (lambda text: PororoTokenizationFactory(
+            sent_tok = PororoTokenizationFactory.load_shared(
                 task="tokenization",
                 lang=self.config.lang,
                 model=f"sent_{self.config.lang}",
-            ).load(device).predict(text))
+                device=device,
+            ).predict
 
             return PororoKoBartQuestionGeneration(
                 model,
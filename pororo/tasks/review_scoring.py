@@ -1,8 +1,9 @@
 """Review Scoring related modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoReviewFactory(PororoFactoryBase):
@@ -53,6 +54,9 @@ class PororoReviewFactory(PororoFactoryBase):
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -69,6 +73,9 @@ class PororoReviewFactory(PororoFactoryBase):
             "zh": ["zhberta.base.zh.review"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -86,6 +93,8 @@ class PororoReviewFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             return PororoBertReviewScore(model, self.config)
@@ -96,6 +105,8 @@ class PororoReviewFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             return PororoBertReviewScore(model, self.config)
@@ -106,6 +117,8 @@ class PororoReviewFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             return PororoBertReviewScore(model, self.config)
@@ -116,6 +129,8 @@ class PororoReviewFactory(PororoFactoryBase):
             model = (ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
 
             return PororoBertReviewScore(model, self.config)
@@ -127,16 +142,26 @@ class PororoBertReviewScore(PororoSimpleBase):
         super().__init__(config)
         self._model = model
 
-    def predict(self, sent: str, **kwargs) -> float:
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        **kwargs,
+    ) -> Union[float, List[float]]:
         """
         Conduct review rating scaled from 1.0 to 5.0
 
         Args:
-            sent: (str) sentence to be rated
+            sent: (Union[str, List[str]]) sentence or sentences to be rated
+            batch_size: (int) maximum number of sentences per forward pass
 
         Returns:
-            float: rating score scaled from 1.0 to 5.0
+            Union[float, List[float]]: rating score scaled from 1.0 to 5.0
 
         """
+        if isinstance(sent, list):
+            batch_size = kwargs.get("batch_size", 32)
+            scores = self._model.predict_output(sent, batch_size=batch_size)
+            return [round(score * 5, 2) for score in scores]
+
         score = self._model.predict_output(sent) * 5
         return round(score, 2)
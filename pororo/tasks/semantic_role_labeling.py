@@ -4,6 +4,7 @@ from copy import deepcopy
 from typing import List, Optional
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoSrlFactory(PororoFactoryBase):
@@ -42,6 +43,12 @@ class PororoSrlFactory(PororoFactoryBase):
     def get_available_models():
         return {"ko": ["charbert.base.ko.srl"]}
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
+    def get_dependencies(self):
+        return [("pos", self.config.lang, "mecab-ko")]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -62,11 +69,12 @@ class PororoSrlFactory(PororoFactoryBase):
                 self.config.lang,
             ).eval().to(device)
 
-            tagger = PororoPosFactory(
+            tagger = PororoPosFactory.load_shared(
                 task="pos",
                 model="mecab-ko",
                 lang=self.config.lang,
-            ).load(device)
+                device=device,
+            )
 
             return PororoBertSRL(model, tagger, self.config)
 
@@ -1,11 +1,11 @@
 """Semantic Textual Similarity related modeling class"""
 
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
 from scipy import spatial
 
 from pororo.tasks.utils.base import PororoBiencoderBase, PororoFactoryBase
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.download_utils import bert_assets, download_or_load
 
 
 class PororoStsFactory(PororoFactoryBase):
@@ -53,6 +53,15 @@ class PororoStsFactory(PororoFactoryBase):
 
     """
 
+    @property
+    def supports_quantize(self):
+        # Sentence-BERT models are loaded through sentence-transformers
+        return "sbert" not in self.config.n_model
+
+    @property
+    def supports_backend(self):
+        return "sbert" not in self.config.n_model
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -72,6 +81,11 @@ class PororoStsFactory(PororoFactoryBase):
             "zh": ["zhberta.base.zh.sts", "zhsbert.base.zh.nli.sts"],
         }
 
+    def get_assets(self):
+        if "sbert" in self.config.n_model:
+            return [(f"sbert/{self.config.n_model}", self.config.lang)]
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -89,6 +103,8 @@ class PororoStsFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSts(model, self.config)
 
@@ -98,6 +114,8 @@ class PororoStsFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSts(model, self.config)
 
@@ -107,6 +125,8 @@ class PororoStsFactory(PororoFactoryBase):
             model = (ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSts(model, self.config)
 
@@ -126,6 +146,8 @@ class PororoStsFactory(PororoFactoryBase):
             model = (CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSts(model, self.config)
 
@@ -136,18 +158,29 @@ class PororoBertSts(PororoBiencoderBase):
         super().__init__(config)
         self._model = model
 
-    def predict(self, sent_a: str, sent_b: str):
+    def predict(
+        self,
+        sent_a: Union[str, List[Tuple[str, str]]],
+        sent_b: Optional[str] = None,
+        **kwargs,
+    ) -> Union[float, List[float]]:
         """
         Conduct semantic textual similarity task with BERT
 
         Args:
-            sent_a (str): first sentence to be encoded
+            sent_a (Union[str, List[Tuple[str, str]]]): first sentence to be encoded or list of sentence pairs
             sent_b (str): second sentence to be encoded
+            batch_size (int): maximum number of pairs per forward pass
 
         Returns:
-            float: similarity score
+            Union[float, List[float]]: similarity score
 
         """
+        if isinstance(sent_a, list):
+            batch_size = kwargs.get("batch_size", 32)
+            sims = self._model.predict_output(sent_a, batch_size=batch_size)
+            return [float("{:.3f}".format(sim)) for sim in sims]
+
         sim = self._model.predict_output(sent_a, sent_b)
         return float("{:.3f}".format(sim))
 
@@ -158,18 +191,36 @@ class PororoSBertSts(PororoBiencoderBase):
         super().__init__(config)
         self._model = model
 
-    def predict(self, sent_a: str, sent_b: str, **kwargs) -> float:
+    def predict(
+        self,
+        sent_a: Union[str, List[Tuple[str, str]]],
+        sent_b: Optional[str] = None,
+        **kwargs,
+    ) -> Union[float, List[float]]:
         """
         Conduct semantic textual similariry task with S-BERT
 
         Args:
-            sent_a (str): first sentence to be encoded
+            sent_a (Union[str, List[Tuple[str, str]]]): first sentence to be encoded or list of sentence pairs
             sent_b (str): second sentence to be encoded
+            batch_size (int): maximum number of sentences per forward pass
 
         Returns:
-            float: similarity score
+            Union[float, List[float]]: similarity score
 
         """
+        if isinstance(sent_a, list):
+            batch_size = kwargs.get("batch_size", 32)
+            encoded = self._model.encode(
+                [a for a, _ in sent_a] + [b for _, b in sent_a],
+                batch_size=batch_size,
+            )
+            vecs_a, vecs_b = encoded[:len(sent_a)], encoded[len(sent_a):]
+            return [
+                float("{:.3f}".format(1 - spatial.distance.cosine(a, b)))
+                for a, b in zip(vecs_a, vecs_b)
+            ]
+
         encoded = self._model.encode([sent_a, sent_b])
         vec_a, vec_b = encoded[0], encoded[-1]
         sim = 1 - spatial.distance.cosine(vec_a, vec_b)
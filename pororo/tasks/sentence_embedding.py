@@ -62,6 +62,11 @@ class PororoSentenceFactory(PororoFactoryBase):
             "zh": ["zhsbert.base.zh.nli.sts"],
         }
 
+    def get_assets(self):
+        if self.config.lang != "en":
+            return [(f"sbert/{self.config.n_model}", self.config.lang)]
+        return []
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -1,8 +1,9 @@
 """Sentiment Analysis related modeling class"""
 
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoSentimentFactory(PororoFactoryBase):
@@ -44,9 +45,14 @@ class PororoSentimentFactory(PororoFactoryBase):
         'Negative'
         >>> sa("이걸 산 내가 레전드", show_probs=True)
         {'negative': 0.7525266408920288, 'positive': 0.2474733293056488}
+        >>> sa(["꽤 맘에 들었어요. 겉에서 봤을땐 허름?했는데 맛도 있고, 괜찮아요", "이걸 산 내가 레전드"], batch_size=64)
+        ['Positive', 'Negative']
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -64,6 +70,9 @@ class PororoSentimentFactory(PororoFactoryBase):
             "ja": ["jaberta.base.ja.sentiment"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -81,6 +90,8 @@ class PororoSentimentFactory(PororoFactoryBase):
             model = (BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSentiment(model, self.config)
 
@@ -90,6 +101,8 @@ class PororoSentimentFactory(PororoFactoryBase):
             model = (JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device))
             return PororoBertSentiment(model, self.config)
 
@@ -106,21 +119,38 @@ class PororoBertSentiment(PororoSimpleBase):
             "positive": "positive",
         }
 
-    def predict(self, sent: str, **kwargs) -> str:
+    def predict(
+        self,
+        sent: Union[str, List[str]],
+        **kwargs,
+    ) -> Union[str, Dict, List]:
         """
         Conduct sentiment analysis
 
         Args:
-            sent: (str) sentence to be sentiment analyzed
+            sent: (Union[str, List[str]]) sentence or sentences to be sentiment analyzed
             show_probs: (bool) whether to show probability score
+            batch_size: (int) maximum number of sentences per forward pass
 
         Returns:
-            str: predicted sentence label - `negative` or `positive`
+            Union[str, Dict, List]: predicted sentence label - `negative` or `positive`
 
         """
         show_probs = kwargs.get("show_probs", False)
 
+        if isinstance(sent, list):
+            batch_size = kwargs.get("batch_size", 32)
+            res = self._model.predict_output(
+                sent,
+                show_probs=show_probs,
+                batch_size=batch_size,
+            )
+            return [self._postprocess(r, show_probs) for r in res]
+
         res = self._model.predict_output(sent, show_probs=show_probs)
+        return self._postprocess(res, show_probs)
+
+    def _postprocess(self, res: Union[str, Dict], show_probs: bool):
         if show_probs:
             probs = {self._label_fn[r]: res[r] for r in res}
             return probs
@@ -71,6 +71,20 @@ class PororoTtsFactory(PororoFactoryBase):
             "multi": ["tacotron"],
         }
 
+    def get_assets(self):
+        return [(f"misc/{name}", self.config.lang) for name in [
+            "tacotron2",
+            "hifigan_en",
+            "hifigan_ko",
+            "hifigan_en_config.json",
+            "hifigan_ko_config.json",
+            "wavernn.pyt",
+        ]]
+
+    def get_dependencies(self):
+        # G2P modules are loaded on first Japanese or Chinese input
+        return [("g2p", "ja", "g2p.ja"), ("g2p", "zh", "g2p.zh")]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -170,19 +184,21 @@ class PororoTTS(PororoSimpleBase):
 
     def _load_g2p_ja(self):
         """Load g2p module for Japanese"""
-        self.g2p_ja = PororoG2pFactory(
+        self.g2p_ja = PororoG2pFactory.load_shared(
             task="g2p",
             model="g2p.ja",
             lang="ja",
-        ).load(self.device)
+            device=self.device,
+        )
 
     def _load_g2p_zh(self):
         """Load g2p module for Chinese"""
-        self.g2p_zh = PororoG2pFactory(
+        self.g2p_zh = PororoG2pFactory.load_shared(
             task="g2p",
             model="g2p.zh",
             lang="zh",
-        ).load(self.device)
+            device=self.device,
+        )
 
     def _preprocess(
         self,
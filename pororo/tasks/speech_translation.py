@@ -1,7 +1,7 @@
 """Speech Translation related modeling class"""
 
 from collections import defaultdict
-from typing import Optional
+from typing import Iterator, Optional
 
 from pororo.tasks import PororoFactoryBase, PororoSimpleBase
 
@@ -61,6 +61,12 @@ class PororoSpeechTranslationFactory(PororoFactoryBase):
             "zh": ["wav2vec|transformer.large.multi.mtpg"],
         }
 
+    def get_dependencies(self):
+        return [
+            ("asr", self.config.lang, f"wav2vec.{self.config.lang}"),
+            ("mt", "multi", "transformer.large.multi.mtpg"),
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -79,17 +85,19 @@ class PororoSpeechTranslationFactory(PororoFactoryBase):
             )
         from pororo.tasks import PororoAsrFactory, PororoTranslationFactory
 
-        asr = PororoAsrFactory(
+        asr = PororoAsrFactory.load_shared(
             task="asr",
             lang=self.config.lang,
             model=f"wav2vec.{self.config.lang}",
-        ).load(device)
+            device=device,
+        )
 
-        mt = PororoTranslationFactory(
+        mt = PororoTranslationFactory.load_shared(
             task="mt",
             lang="multi",
             model="transformer.large.multi.mtpg",
-        ).load(device)
+            device=device,
+        )
 
         return PororoSpeechTranslation(asr, mt, self.config)
 
@@ -131,19 +139,58 @@ class PororoSpeechTranslation(PororoSimpleBase):
             batch_size=batch_size,
         )
 
-        result_dict = defaultdict(list)
-        for asr_output in asr_outputs["results"]:
-            mt_output = self.mt(
-                asr_output["speech"].lower(),
-                src=self.src_lang,
-                tgt=tgt,
-            )
+        # Every recognized speech section is translated in batches at once
+        mt_outputs = self.mt(
+            [asr_output["speech"].lower() for asr_output in asr_outputs["results"]],
+            src=self.src_lang,
+            tgt=tgt,
+        )
 
+        result_dict = defaultdict(list)
+        for asr_output, mt_output in zip(asr_outputs["results"], mt_outputs):
             result_dict["asr_outputs"].append(asr_output)
             result_dict["mt_outputs"].append(mt_output)
 
         return dict(result_dict)
 
+    def stream(
+        self,
+        audio_path: str,
+        tgt: str,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """
+        Conduct speech translation on given audio, yielding each speech section as soon as it is translated
+
+        Speech recognition still runs over the whole audio before the first
+        section is yielded, only the translations are streamed.
+
+        Args:
+            audio_path (str): audio path for asr
+            tgt (str): target language
+
+        Yields:
+            dict: speech recognition output and translation output of each speech section
+
+        """
+        asr_outputs = self.asr(
+            audio_path,
+            top_db=kwargs.get("top_db", 48),
+            vad=kwargs.get("vad", False),
+            batch_size=kwargs.get("batch_size", 1),
+        )["results"]
+
+        mt_outputs = self.mt.translate_documents_stream(
+            [asr_output["speech"].lower() for asr_output in asr_outputs],
+            src=self.src_lang,
+            tgt=tgt,
+        )
+        for asr_output, mt_output in zip(asr_outputs, mt_outputs):
+            yield {
+                "asr_output": asr_output,
+                "mt_output": mt_output,
+            }
+
     def __call__(
         self,
         audio_path: str,
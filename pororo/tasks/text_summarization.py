@@ -1,6 +1,6 @@
 """Text Summarization related modeling class"""
 
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import torch
 from fairseq import hub_utils
@@ -13,6 +13,15 @@ from pororo.tasks.utils.base import (
     PororoGenerationBase,
     PororoSimpleBase,
 )
+from pororo.tasks.utils.batching import plan_batches
+from pororo.tasks.utils.download_utils import bert_assets
+
+# Model name each summary style stands for
+SUMMARY_ALIASES = {
+    "abstractive": "kobart.base.ko.summary",
+    "bullet": "kobart.base.ko.bullet",
+    "extractive": "brainbert.base.ko.summary",
+}
 
 
 class PororoSummarizationFactory(PororoFactoryBase):
@@ -118,6 +127,28 @@ class PororoSummarizationFactory(PororoFactoryBase):
             ],
         }
 
+    def get_assets(self):
+        n_model = SUMMARY_ALIASES.get(self.config.n_model, self.config.n_model)
+        if "kobart" in n_model:
+            assets = [(f"bart/{n_model}", self.config.lang)]
+            if "bullet" in n_model:
+                assets += bert_assets(
+                    "brainbert.base.ko.summary",
+                    self.config.lang,
+                )
+            return assets
+        return bert_assets(n_model, self.config.lang)
+
+    def get_dependencies(self):
+        n_model = SUMMARY_ALIASES.get(self.config.n_model, self.config.n_model)
+        if "kobart" in n_model and "bullet" not in n_model:
+            return []
+        return [(
+            "tokenization",
+            self.config.lang,
+            f"sent_{self.config.lang}",
+        )]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -131,14 +162,10 @@ class PororoSummarizationFactory(PororoFactoryBase):
         """
         from pororo.tasks.tokenization import PororoTokenizationFactory
 
-        if self.config.n_model == "abstractive":
-            self.config.n_model = "kobart.base.ko.summary"
-
-        if self.config.n_model == "bullet":
-            self.config.n_model = "kobart.base.ko.bullet"
-
-        if self.config.n_model == "extractive":
-            self.config.n_model = "brainbert.base.ko.summary"
+        self.config.n_model = SUMMARY_ALIASES.get(
+            self.config.n_model,
+            self.config.n_model,
+        )
 
         if "kobart" in self.config.n_model:
             from pororo.models.bart.KoBART import KoBartModel
@@ -153,11 +180,12 @@ class PororoSummarizationFactory(PororoFactoryBase):
             )
 
             if "bullet" in self.config.n_model:
-                sent_tokenizer = (lambda text: PororoTokenizationFactory(
+                sent_tokenizer = PororoTokenizationFactory.load_shared(
                     task="tokenization",
                     lang=self.config.lang,
                     model=f"sent_{self.config.lang}",
-                ).load(device).predict(text))
+                    device=device,
+                ).predict
 
                 ext_model_name = "brainbert.base.ko.summary"
                 ext_summary = PororoRobertaSummary(
@@ -176,11 +204,12 @@ class PororoSummarizationFactory(PororoFactoryBase):
             return PororoKoBartSummary(model=model, config=self.config)
 
         if "brainbert" in self.config.n_model:
-            sent_tokenizer = (lambda text: PororoTokenizationFactory(
+            sent_tokenizer = PororoTokenizationFactory.load_shared(
                 task="tokenization",
                 lang=self.config.lang,
                 model=f"sent_{self.config.lang}",
-            ).load(device).predict(text))
+                device=device,
+            ).predict
 
             return PororoRobertaSummary(
                 sent_tokenizer,
@@ -206,22 +235,27 @@ class PororoKoBartSummary(PororoGenerationBase):
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 16,
+        max_tokens: Optional[int] = 4096,
         **kwargs,
     ):
         """
         Conduct abstractive summarization
 
         Args:
-            text (Union[str, List[str]]): input text to be extracted
+            text (Union[str, List[str]]): input text, or list of texts to be summarized in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of texts per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
             (str) summarized text
+            or the list of those if `text` is a list
 
         """
         sampling = False
@@ -240,6 +274,8 @@ class PororoKoBartSummary(PororoGenerationBase):
             max_len_b=50,
             no_repeat_ngram_size=no_repeat_ngram_size,
             length_penalty=len_penalty,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
         )
 
         return output
@@ -263,6 +299,7 @@ class PororoKoBartSummary(PororoGenerationBase):
             top_p,
             no_repeat_ngram_size,
             len_penalty,
+            **kwargs,
         )
 
 
@@ -302,21 +339,26 @@ class PororoKoBartBulletSummary(PororoGenerationBase):
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        batch_size: int = 16,
+        max_tokens: Optional[int] = 4096,
     ):
         """
         Conduct bullet-point summarization
 
         Args:
-            text (Union[str, List[str]]): input text to be extracted
+            text (Union[str, List[str]]): input text, or list of texts to be summarized in batches
             beam (int): beam search size
             temperature (float): temperature scale
             top_k (int): top-K sampling vocabulary size
             top_p (float): top-p sampling ratio
             no_repeat_ngram_size (int): no repeat ngram size
             len_penalty (float): length penalty ratio
+            batch_size (int): maximum number of texts per beam search
+            max_tokens (int): maximum number of (padded) source tokens per beam search
 
         Returns:
-            (str) summarized text
+            (List[str]) summarized bullet points
+            or the list of those if `text` is a list
 
         """
         sampling = False
@@ -324,10 +366,7 @@ class PororoKoBartBulletSummary(PororoGenerationBase):
         if top_k != -1 or top_p != -1:
             sampling = True
 
-        if isinstance(text, str):
-            texts = self._ext_summary(text)
-        else:
-            texts = [self._ext_summary(i) for i in text]
+        texts = self._ext_summary(text)
 
         output = self._model.translate(
             texts,
@@ -349,6 +388,8 @@ class PororoKoBartBulletSummary(PororoGenerationBase):
                 [self._model.tokenizer.convert_tokens_to_ids("】")],
                 [self._model.tokenizer.convert_tokens_to_ids("【")],
             ],
+            batch_size=batch_size,
+            max_tokens=max_tokens,
         )
 
         return self._postprocess(output) if isinstance(
@@ -365,6 +406,7 @@ class PororoKoBartBulletSummary(PororoGenerationBase):
         top_p: float = -1,
         no_repeat_ngram_size: int = 4,
         len_penalty: float = 1.0,
+        **kwargs,
     ):
 
         return self.predict(
@@ -375,6 +417,7 @@ class PororoKoBartBulletSummary(PororoGenerationBase):
             top_p,
             no_repeat_ngram_size,
             len_penalty,
+            **kwargs,
         )
 
 
@@ -430,23 +473,53 @@ class PororoRobertaSummary(PororoSimpleBase):
         )
 
     @torch.no_grad()
-    def predict(self, text: str, return_list: bool = False):
+    def predict(
+        self,
+        text: Union[str, List[str]],
+        return_list: bool = False,
+        batch_size: int = 8,
+        max_tokens: Optional[int] = None,
+    ):
         """
         Conduct extractive summarization
 
         Args:
-            text (str): input text
+            text (Union[str, List[str]]): input text, or list of texts
             return_list (bool): whether to return as list
+            batch_size (int): maximum number of texts per forward pass
+            max_tokens (int): maximum number of (padded) tokens per forward pass
 
         Returns:
             (str) summarized text
             (List[str]) list of text if return_list is True
+            or the list of those if `text` is a list
 
         """
-        encoded = self._tokenizer.encode_batch(text, max_length=512)
-        input_ids = encoded["input_ids"].to(self._device)
-        segment_ids = encoded["segment_ids"].to(self._device)
-        sentences = encoded["sentences"][0]  # list of str
+        texts = [text] if isinstance(text, str) else text
+        encoded = [
+            self._tokenizer.encode_line(t, max_length=512) for t in texts
+        ]
+
+        # Texts of similar length are summarized together
+        plan = plan_batches(
+            [len(token_ids) for token_ids, _, _ in encoded],
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+        )
+        outputs = list()
+        for batch in plan:
+            outputs.extend(self._summarize([encoded[i] for i in batch]))
+        outputs = plan.restore(outputs)
+
+        if not return_list:
+            outputs = [" ".join(output) for output in outputs]
+        return outputs[0] if isinstance(text, str) else outputs
+
+    def _summarize(self, encoded: List[Tuple]) -> List[List[str]]:
+        """Pick the 3 most salient sentences of each encoded text"""
+        padded = self._tokenizer.pad_batch(encoded)
+        input_ids = padded["input_ids"].to(self._device)
+        segment_ids = padded["segment_ids"].to(self._device)
         cls_ids, mask_cls = self._make_class_ids(input_ids)
 
         output = self._model(
@@ -461,18 +534,22 @@ class PororoRobertaSummary(PororoSimpleBase):
         sentence_vector = bert_representation[batch_arange, cls_ids]
         sentence_vector *= mask_cls[:, :, None].float().to(self._device)
 
-        final_logits = self._classifier(sentence_vector).squeeze()
+        final_logits = self._classifier(sentence_vector).squeeze(-1)
         final_logits = torch.sigmoid(final_logits)
         final_logits = final_logits.clone() * mask_cls.float()
 
-        prediction = final_logits.argsort(descending=True)
-        prediction = sorted(prediction[:, :3][0].tolist())
-        prediction = [sentences[i] for i in prediction]
+        predictions = final_logits.argsort(dim=-1, descending=True)
 
-        if not return_list:
-            prediction = " ".join(prediction)
-
-        return prediction
+        summaries = list()
+        for prediction, mask, sentences in zip(
+                predictions.tolist(),
+                mask_cls.tolist(),
+                padded["sentences"],
+        ):
+            # Padded [CLS] positions never make it into the summary
+            prediction = sorted([i for i in prediction if mask[i]][:3])
+            summaries.append([sentences[i] for i in prediction])
+        return summaries
 
     def _make_class_ids(self, input_ids: torch.Tensor):
         """
@@ -495,15 +572,21 @@ class PororoRobertaSummary(PororoSimpleBase):
                     cls_id.append(i)
             cls_ids.append(cls_id)
 
+        # Texts of a mini-batch may hold different numbers of sentences
+        max_cls = max(len(cls_id) for cls_id in cls_ids)
+        cls_ids = [cls_id + [-1] * (max_cls - len(cls_id)) for cls_id in cls_ids]
+
         padded_cls = torch.tensor(cls_ids).long().to(self._device)
         mask_cls = ~(padded_cls == -1).to(self._device)
         return padded_cls, mask_cls
 
-    def __call__(self, text: Union[str, List[str]], return_list: bool = False):
-        if isinstance(text, str):
-            return self.predict(text, return_list)
-        elif isinstance(text, list):
-            return [self.predict(t, return_list) for t in text]
+    def __call__(
+        self,
+        text: Union[str, List[str]],
+        return_list: bool = False,
+        **kwargs,
+    ):
+        return self.predict(text, return_list, **kwargs)
 
 
 class BertSumTokenizer(object):
@@ -515,12 +598,13 @@ class BertSumTokenizer(object):
         self._bos_index = dictionary.bos_index
         self._sent_tokenizer = sent_tokenizer
 
-    def encode_line(self, text):
+    def encode_line(self, text, max_length: Optional[int] = None):
         """
         encode sentence to token ids and segment ids
 
         Args:
             text (str or List[str]): input article
+            max_length (int): max token length (for truncation)
 
         Returns:
             token ids, segment ids, splitted sentences
@@ -553,8 +637,8 @@ class BertSumTokenizer(object):
             token_ids.append(sent_token_ids)
             segment_ids.append(sent_segment_ids)
 
-        token_ids = torch.cat(token_ids, dim=0)
-        segment_ids = torch.cat(segment_ids, dim=0)
+        token_ids = torch.cat(token_ids, dim=0)[:max_length]
+        segment_ids = torch.cat(segment_ids, dim=0)[:max_length]
         return token_ids, segment_ids, sentences
 
     def encode_batch(self, texts, max_length):
@@ -569,25 +653,27 @@ class BertSumTokenizer(object):
             dict: token ids, segment ids, splitted sentences
 
         """
-        result_tokenization = []
-        result_segmentation = []
-        result_split_sentences = []
-        max_len = 0
-
         if isinstance(texts, str):
             texts = [texts]
 
-        for text in texts:
-            token_ids, segment_ids, sentences = self.encode_line(text)
-            token_ids = token_ids[:max_length]
-            segment_ids = segment_ids[:max_length]
+        return self.pad_batch(
+            [self.encode_line(text, max_length) for text in texts])
 
-            result_tokenization.append(token_ids)
-            result_segmentation.append(segment_ids)
-            result_split_sentences.append(sentences)
+    def pad_batch(self, encoded):
+        """
+        pad `encode_line` outputs to the longest of them
+
+        Args:
+            encoded (List[tuple]): token ids, segment ids and splitted sentences of each article
 
-            if len(token_ids) > max_len:
-                max_len = len(token_ids)
+        Returns:
+            dict: token ids, segment ids, splitted sentences
+
+        """
+        result_tokenization = [token_ids for token_ids, _, _ in encoded]
+        result_segmentation = [segment_ids for _, segment_ids, _ in encoded]
+        result_split_sentences = [sentences for _, _, sentences in encoded]
+        max_len = max(len(token_ids) for token_ids in result_tokenization)
 
         padded_tokens, padded_segments = [], []
         for token_ids, segment_ids in zip(
@@ -89,6 +89,24 @@ class PororoTokenizationFactory(PororoFactoryBase):
             ],
         }
 
+    def get_assets(self):
+        if self.config.n_model == "roberta":
+            return [
+                ("misc/encoder.json", self.config.lang),
+                ("misc/vocab.bpe", self.config.lang),
+            ]
+        if "sent" in self.config.n_model or self.config.n_model in [
+                "mecab_ko",
+                "char",
+                "jamo",
+                "word",
+                "moses",
+                "jieba",
+                "mecab",
+        ]:
+            return []
+        return [(f"tokenizers/{self.config.n_model}.zip", self.config.lang)]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
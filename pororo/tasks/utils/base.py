@@ -1,8 +1,11 @@
 import re
+import threading
+import types
 import unicodedata
+import weakref
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import List, Mapping, Optional, Union
+from typing import List, Mapping, Optional, Tuple, Union
 
 
 @dataclass
@@ -10,6 +13,8 @@ class TaskConfig:
     task: str
     lang: str
     n_model: str
+    quantize: Optional[str] = None
+    backend: Optional[str] = None
 
 
 class PororoTaskBase:
@@ -52,6 +57,18 @@ class PororoTaskBase:
 class PororoFactoryBase(object):
     r"""This is a factory base class that construct task-specific module"""
 
+    # Task modules built by factories, shared as long as something still
+    # references them. `_resident_pipelines` keeps the ones loaded with
+    # `keep_alive=True` referenced for the lifetime of the process.
+    _shared_pipelines = weakref.WeakValueDictionary()
+    _resident_pipelines = dict()
+    _shared_lock = threading.RLock()
+
+    # Whether the selected model honours `quantize` (BERT-family backbones)
+    # and `backend` (heads run through `hub.predict`)
+    supports_quantize = False
+    supports_backend = False
+
     def __init__(
         self,
         task: str,
@@ -100,11 +117,189 @@ class PororoFactoryBase(object):
     def get_default_model(self, lang: str) -> str:
         return self._available_models[lang][0]
 
+    def get_assets(self) -> List[Tuple[str, str]]:
+        """
+        Returns every file the selected model fetches through `download_or_load`,
+        including the ones only fetched lazily on first use
+
+        Returns:
+            List[Tuple[str, str]]: (asset name, lang) pairs
+
+        """
+        return []
+
+    def get_dependencies(self) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Returns task modules the selected model builds on (e.g. through `load_shared`)
+
+        Returns:
+            List[Tuple[str, str, Optional[str]]]: (task, lang, model) triples
+
+        """
+        return []
+
+    def set_options(
+        self,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
+    ):
+        """
+        Record the `quantize` and `backend` options `load()` builds the model with
+
+        Args:
+            quantize (str): `int8` to load BERT-family backbones with dynamically quantized linear layers
+            backend (str): `onnx` or `torchscript` to run the heads of BERT-family models through exported graphs
+
+        Raises:
+            ValueError: if the selected model does not support an option
+
+        """
+        for name, value, supported in [
+            ("quantize", quantize, self.supports_quantize),
+            ("backend", backend, self.supports_backend),
+        ]:
+            if value is not None and not supported:
+                raise ValueError(
+                    f"`{name}` is not supported by {self.config.task} "
+                    f"({self.config.lang}, {self.config.n_model})")
+
+        self.config.quantize = quantize
+        self.config.backend = backend
+
     @classmethod
     def load(cls) -> PororoTaskBase:
         raise NotImplementedError(
             "Model load function is not implemented properly!")
 
+    @classmethod
+    def load_shared(
+        cls,
+        task: str,
+        lang: str,
+        model: Optional[str],
+        device: str,
+        keep_alive: bool = False,
+        quantize: Optional[str] = None,
+        backend: Optional[str] = None,
+        **kwargs,
+    ) -> PororoTaskBase:
+        """
+        Load task-specific module, reusing the one already built for the
+        same (task, lang, model) by another task module or `Pororo` call
+
+        Args:
+            task (str): task name
+            lang (str): language
+            model (str): model name
+            device (str): device information
+            keep_alive (bool): whether to keep the module loaded even after every user released it
+            quantize (str): `int8` to load BERT-family backbones with dynamically quantized linear layers
+            backend (str): `onnx` or `torchscript` to run the heads of BERT-family models through exported graphs
+
+        Returns:
+            PororoTaskBase: shared task-specific module
+
+        """
+        factory = cls(task, lang, model, **kwargs)
+        factory.set_options(quantize, backend)
+        key = (
+            cls.__name__,
+            factory.config.lang,
+            factory.config.n_model,
+            str(device),
+            quantize,
+            backend,
+            tuple(sorted(kwargs.items())),
+        )
+
+        with cls._shared_lock:
+            module = cls._shared_pipelines.get(key)
+            if module is None:
+                module = factory.load(device)
+                cls._shared_pipelines[key] = module
+            if keep_alive:
+                cls._resident_pipelines[key] = module
+            return module
+
+    @classmethod
+    def shared_pipelines(cls) -> Mapping[str, PororoTaskBase]:
+        """
+        Returns every task module currently shared between users
+
+        Returns:
+            Mapping[str, PororoTaskBase]: `task:lang:model:device` to task module
+
+        """
+        with cls._shared_lock:
+            return {
+                f"{module.config.task}:{key[1]}:{key[2]}:{key[3]}": module
+                for key, module in cls._shared_pipelines.items()
+            }
+
+    @classmethod
+    def clear_resident(cls):
+        """Release the modules loaded with `keep_alive=True`"""
+        with cls._shared_lock:
+            cls._resident_pipelines.clear()
+
+
+def module_nbytes(module, _seen: Optional[set] = None) -> int:
+    """
+    Measure the memory used by the parameters, buffers and numpy arrays
+    reachable from `module` (a task module, or a dict/list of them)
+
+    Args:
+        module: object to be measured
+        _seen (set): ids of the objects already measured, shared between calls to avoid counting twice
+
+    Returns:
+        int: size in bytes
+
+    """
+    import numpy as np
+    import torch
+
+    seen = set() if _seen is None else _seen
+
+    def _nbytes(obj) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+
+        if isinstance(obj, torch.nn.Module):
+            nbytes = 0
+            for t in list(obj.parameters()) + list(obj.buffers()):
+                if id(t) not in seen:
+                    seen.add(id(t))
+                    nbytes += t.numel() * t.element_size()
+            return nbytes
+        if isinstance(obj, torch.Tensor):
+            return obj.numel() * obj.element_size()
+        if isinstance(obj, np.ndarray):
+            return obj.nbytes
+        if isinstance(obj, dict):
+            return sum(_nbytes(v) for v in obj.values())
+        if isinstance(obj, (list, tuple, set)):
+            return sum(_nbytes(v) for v in obj)
+        if isinstance(obj, types.MethodType):
+            return _nbytes(obj.__self__)
+        if isinstance(obj, types.FunctionType):
+            # e.g. helper pipelines captured by a closure
+            nbytes = 0
+            for cell in obj.__closure__ or ():
+                try:
+                    nbytes += _nbytes(cell.cell_contents)
+                except ValueError:  # empty cell
+                    continue
+            return nbytes
+        if isinstance(obj, (type, types.ModuleType)):
+            return 0
+        if hasattr(obj, "__dict__"):
+            return sum(_nbytes(v) for v in vars(obj).values())
+        return 0
+
+    return _nbytes(module)
+
 
 class PororoSimpleBase(PororoTaskBase):
     r"""Simple task base wrapper class"""
@@ -118,15 +313,31 @@ class PororoBiencoderBase(PororoTaskBase):
 
     def __call__(
         self,
-        sent_a: str,
-        sent_b: Union[str, List[str]],
+        sent_a: Union[str, List[str], List[Tuple[str, str]]],
+        sent_b: Optional[Union[str, List[str]]] = None,
         **kwargs,
     ):
-        assert isinstance(sent_a, str), "sent_a should be string type"
+        # For batched inference over a list of sentence pairs
+        if isinstance(sent_a, list) and sent_b is None:
+            assert all(
+                isinstance(pair, (tuple, list)) and len(pair) == 2
+                for pair in sent_a
+            ), "sent_a should be list of (sentence, sentence) pairs"
+
+            pairs = [(self._normalize(a), self._normalize(b))
+                     for a, b in sent_a]
+            return self.predict(pairs, **kwargs)
+
+        assert isinstance(sent_a, str) or isinstance(
+            sent_a, list), "sent_a should be string or list of string type"
         assert isinstance(sent_b, str) or isinstance(
             sent_b, list), "sent_b should be string or list of string type"
 
-        sent_a = self._normalize(sent_a)
+        # For "Zero-shot Classification" of several sentences at once
+        if isinstance(sent_a, list):
+            sent_a = [self._normalize(t) for t in sent_a]
+        else:
+            sent_a = self._normalize(sent_a)
 
         # For "Find Similar Sentence" task
         if isinstance(sent_b, list):
@@ -142,7 +353,7 @@ class PororoGenerationBase(PororoTaskBase):
 
     def __call__(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int = 5,
         temperature: float = 1.0,
         top_k: int = -1,
@@ -151,7 +362,9 @@ class PororoGenerationBase(PororoTaskBase):
         len_penalty: float = 1.0,
         **kwargs,
     ):
-        assert isinstance(text, str), "Input text should be string type"
+        # Lists are generated in batches by the modules that support them
+        assert isinstance(text, str) or isinstance(
+            text, list), "Input text should be string or list of string type"
 
         return self.predict(
             text,
@@ -168,9 +381,13 @@ class PororoGenerationBase(PororoTaskBase):
 class PororoTaskGenerationBase(PororoTaskBase):
     r"""Generation task wrapper class using only beam search"""
 
-    def __call__(self, text: str, beam: int = 1, **kwargs):
-        assert isinstance(text, str), "Input text should be string type"
+    def __call__(self, text: Union[str, List[str]], beam: int = 1, **kwargs):
+        assert isinstance(text, str) or isinstance(
+            text, list), "Input text should be string or list of string type"
 
-        text = self._normalize(text)
+        if isinstance(text, list):
+            text = [self._normalize(t) for t in text]
+        else:
+            text = self._normalize(text)
 
         return self.predict(text, beam=beam, **kwargs)
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class BatchPlan:
+    """
+    Mini-batches of sample indices planned by `plan_batches`
+
+    Attributes:
+        batches (List[List[int]]): original sample indices of each mini-batch
+        lengths (List[int]): length of each sample
+
+    """
+
+    batches: List[List[int]]
+    lengths: List[int]
+
+    def __iter__(self):
+        return iter(self.batches)
+
+    def __len__(self):
+        return len(self.batches)
+
+    @property
+    def order(self) -> List[int]:
+        """Original sample indices in the order the mini-batches visit them"""
+        return [idx for batch in self.batches for idx in batch]
+
+    @property
+    def inverse(self) -> List[int]:
+        """Position of each original sample in `order`"""
+        inverse = [0] * len(self.lengths)
+        for position, idx in enumerate(self.order):
+            inverse[idx] = position
+        return inverse
+
+    def restore(self, outputs: List) -> List:
+        """
+        Put per-sample outputs gathered mini-batch after mini-batch back
+        into the original sample order
+
+        Args:
+            outputs (List): one output per sample, in the order of `order`
+
+        Returns:
+            List: outputs in the original sample order
+
+        """
+        assert len(outputs) == len(self.lengths), \
+            "outputs should hold one element per sample"
+        return [outputs[position] for position in self.inverse]
+
+    def padding(self) -> int:
+        """Number of padding positions the mini-batches add in total"""
+        return sum(
+            max(self.lengths[i] for i in batch) * len(batch) -
+            sum(self.lengths[i] for i in batch) for batch in self.batches)
+
+
+def bucket_by_length(
+    lengths: List[int],
+    batch_size: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> List[List[int]]:
+    """
+    Group sample indices into mini-batches of similar length
+
+    Args:
+        lengths (List[int]): token length of each sample
+        batch_size (int): maximum number of samples per mini-batch
+        max_tokens (int): maximum number of (padded) tokens per mini-batch
+
+    Returns:
+        List[List[int]]: original sample indices of each mini-batch
+
+    """
+    assert (batch_size or max_tokens), "batch_size or max_tokens should be set"
+
+    batches, batch = [], []
+    # Samples are visited from the shortest, so the current one is the longest
+    for idx in sorted(range(len(lengths)), key=lambda i: lengths[i]):
+        full = batch_size is not None and len(batch) == batch_size
+        over = (max_tokens is not None and
+                lengths[idx] * (len(batch) + 1) > max_tokens)
+        if batch and (full or over):
+            batches.append(batch)
+            batch = []
+        batch.append(idx)
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def plan_batches(
+    lengths: List[int],
+    batch_size: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+) -> BatchPlan:
+    """
+    Plan mini-batches of similar length samples, which keeps padding to
+    a minimum, along with the permutation that restores the original order
+
+    Args:
+        lengths (List[int]): length of each sample (tokens, frames, pixels...)
+        batch_size (int): maximum number of samples per mini-batch
+        max_tokens (int): maximum number of (padded) positions per mini-batch
+
+    Returns:
+        BatchPlan: planned mini-batches
+
+    Examples:
+        >>> plan = plan_batches([5, 1, 4, 2], batch_size=2)
+        >>> plan.batches
+        [[1, 3], [2, 0]]
+        >>> plan.restore(["b", "d", "c", "a"])
+        ['a', 'b', 'c', 'd']
+
+    """
+    return BatchPlan(
+        batches=bucket_by_length(lengths, batch_size, max_tokens),
+        lengths=list(lengths),
+    )
+
+
+def translate_batch(
+    model,
+    sentences: List[str],
+    batch_size: Optional[int] = 32,
+    max_tokens: Optional[int] = None,
+    **kwargs,
+) -> List[str]:
+    """
+    Translate many sentences with a fairseq hub interface, running one beam
+    search per mini-batch of similar length sentences
+
+    Args:
+        model (GeneratorHubInterface): fairseq hub interface, e.g. `TransformerModel`
+        sentences (List[str]): preprocessed source sentences
+        batch_size (int): maximum number of sentences per beam search
+        max_tokens (int): maximum number of (padded) source tokens per beam search
+        **kwargs: generation options of `model.translate`, e.g. `beam` or `lenpen`
+
+    Returns:
+        List[str]: best hypothesis of each sentence, in the same order as `sentences`
+
+    """
+    tokens = [model.encode(sentence) for sentence in sentences]
+    plan = plan_batches([len(t) for t in tokens], batch_size, max_tokens)
+
+    outputs = list()
+    for batch in plan:
+        hypos = model.generate([tokens[i] for i in batch], **kwargs)
+        outputs.extend(model.decode(hypo[0]["tokens"]) for hypo in hypos)
+    return plan.restore(outputs)
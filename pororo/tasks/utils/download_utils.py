@@ -1,14 +1,19 @@
 """Module download related function from. Tenth"""
 
+import hashlib
+import json
 import logging
 import os
 import platform
-import sys
+import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Tuple, Union
-
-import wget
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 from pororo.tasks.utils.config import CONFIGS
 
@@ -17,6 +22,36 @@ DEFAULT_PREFIX = {
     "dict": "https://twg.kakaocdn.net/pororo/{lang}/dicts",
 }
 
+# Manifest of expected sha256 digests, keyed by `{lang}/{key}s/{n_model}`
+CHECKSUM_MANIFEST = "checksums.json"
+
+# Hugging Face models the JaBERTa/ZhBERTa WordPiece vocabularies come from
+WORDPIECE_VOCABS = {
+    "ja": "cl-tohoku/bert-base-japanese-whole-word-masking",
+    "zh": "bert-base-chinese",
+}
+
+# Pre-trained wikipedia2vec embedding of each language
+VEC_MAP = {
+    "ko": "kowiki_20200720_100d.pkl",
+    "en": "enwiki_20180420_100d.pkl",
+    "ja": "jawiki_20180420_100d.pkl",
+    "zh": "zhwiki_20180420_100d.pkl",
+}
+
+# Files at least this large are fetched as parallel byte ranges
+PARALLEL_MIN_SIZE = 256 * 1024 * 1024
+PARALLEL_CHUNK_SIZE = 64 * 1024 * 1024
+PARALLEL_WORKERS = 4
+
+BUFFER_SIZE = 1024 * 1024
+TIMEOUT = 60
+
+
+def is_offline() -> bool:
+    """Whether `PORORO_OFFLINE` forbids any network access"""
+    return os.environ.get("PORORO_OFFLINE", "").lower() in ("1", "true", "yes")
+
 
 @dataclass
 class TransformerInfo:
@@ -42,13 +77,14 @@ def get_save_dir(save_dir: str = None) -> str:
     Get default save directory
 
     Args:
-        savd_dir(str): User-defined save directory
+        savd_dir(str): User-defined save directory, `PORORO_HOME` if not given
 
     Returns:
         str: Set save directory
 
     """
     # If user wants to manually define save directory
+    save_dir = save_dir or os.environ.get("PORORO_HOME")
     if save_dir:
         os.makedirs(save_dir, exist_ok=True)
         return save_dir
@@ -84,6 +120,226 @@ def get_download_url(n_model: str, key: str, lang: str) -> str:
     return f"{default_prefix}/{n_model}"
 
 
+@contextmanager
+def file_lock(path: str):
+    """
+    Hold an exclusive cross-process lock on `path` using a sibling `.lock` file
+
+    Args:
+        path (str): path of the file or directory to guard
+
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", "a+") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def load_checksums(root_dir: str = None) -> Dict[str, str]:
+    """
+    Load expected sha256 digests from checksum manifests
+
+    Manifests are read from `PORORO_CHECKSUMS` and from `checksums.json`
+    inside the save directory. Files without an entry are only checked
+    against the size reported by the server.
+
+    Args:
+        root_dir (str, optional): save directory holding a manifest
+
+    Returns:
+        Dict[str, str]: sha256 digest keyed by `{lang}/{key}s/{n_model}`
+
+    """
+    paths = [os.environ.get("PORORO_CHECKSUMS")]
+    if root_dir:
+        paths.append(os.path.join(root_dir, CHECKSUM_MANIFEST))
+
+    checksums = dict()
+    for path in paths:
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                checksums.update(json.load(f))
+    return checksums
+
+
+def sha256sum(path: str) -> str:
+    """
+    Compute sha256 hex digest of a file
+
+    Args:
+        path (str): file path
+
+    Returns:
+        str: hex digest
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(BUFFER_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _probe(url: str) -> Tuple[Optional[int], bool]:
+    """Return remote content length and whether byte ranges are served"""
+    try:
+        with urlopen(Request(url, method="HEAD"), timeout=TIMEOUT) as response:
+            length = response.headers.get("Content-Length")
+            ranged = response.headers.get("Accept-Ranges", "") == "bytes"
+            return (int(length) if length else None), ranged
+    except HTTPError:
+        return None, False
+
+
+def _fetch_range(url: str, path: str, start: int = 0, end: int = None):
+    """Fetch bytes `[start, end]` of `url` into `path`, resuming from its size"""
+    done = os.path.getsize(path) if os.path.exists(path) else 0
+    if end is not None and start + done > end:
+        return
+
+    headers = dict()
+    if start + done > 0 or end is not None:
+        headers["Range"] = f"bytes={start + done}-{'' if end is None else end}"
+
+    try:
+        response = urlopen(Request(url, headers=headers), timeout=TIMEOUT)
+    except HTTPError as e:
+        # Partial file already holds the whole resource
+        if e.code == 416 and done > 0:
+            return
+        raise
+
+    with response:
+        if response.status == 206:
+            mode = "ab"
+        elif start == 0 and end is None:
+            # Server ignored the range, so start over
+            mode = "wb"
+        else:
+            raise IOError(f"{url} does not support range requests")
+
+        with open(path, mode) as f:
+            shutil.copyfileobj(response, f, BUFFER_SIZE)
+
+
+def _fetch_chunks(url: str, part_path: str, size: int):
+    """Fetch `url` as parallel byte ranges, then join them into `part_path`"""
+    ranges = [(start, min(start + PARALLEL_CHUNK_SIZE, size) - 1)
+              for start in range(0, size, PARALLEL_CHUNK_SIZE)]
+    chunk_paths = [f"{part_path}.{i}" for i in range(len(ranges))]
+
+    with ThreadPoolExecutor(PARALLEL_WORKERS) as executor:
+        futures = [
+            executor.submit(_fetch_range, url, chunk_path, start, end)
+            for chunk_path, (start, end) in zip(chunk_paths, ranges)
+        ]
+        for future in futures:
+            future.result()
+
+    with open(part_path, "wb") as f:
+        for chunk_path in chunk_paths:
+            with open(chunk_path, "rb") as chunk:
+                shutil.copyfileobj(chunk, f, BUFFER_SIZE)
+    for chunk_path in chunk_paths:
+        os.remove(chunk_path)
+
+
+def fetch(url: str, path: str, checksum: str = None) -> None:
+    """
+    Download `url` to `path` atomically
+
+    Data is written to `<path>.part` first, which is resumed with HTTP range
+    requests if a previous download was interrupted. Large files are fetched
+    as parallel byte ranges when the server allows it. The file is only
+    renamed into place once its size (and checksum, if given) are verified,
+    so `path` either does not exist or is complete.
+
+    Args:
+        url (str): download url
+        path (str): destination path
+        checksum (str, optional): expected sha256 hex digest
+
+    """
+    part_path = f"{path}.part"
+    size, ranged = _probe(url)
+
+    if (ranged and size is not None and size >= PARALLEL_MIN_SIZE and
+            not os.path.exists(part_path)):
+        _fetch_chunks(url, part_path, size)
+    else:
+        _fetch_range(url, part_path)
+
+    actual = os.path.getsize(part_path)
+    if size is not None and actual != size:
+        if actual > size:
+            os.remove(part_path)
+        raise IOError(
+            f"Incomplete download of {url}: got {actual} of {size} bytes")
+
+    if checksum and sha256sum(part_path) != checksum.lower():
+        os.remove(part_path)
+        raise IOError(f"Checksum mismatch for {url}")
+
+    with open(part_path, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(part_path, path)
+
+
+def _move_into(src: str, dst: str) -> None:
+    """Move `src` to `dst`, merging into `dst` if both are directories"""
+    if os.path.isdir(src) and os.path.isdir(dst):
+        for name in os.listdir(src):
+            _move_into(os.path.join(src, name), os.path.join(dst, name))
+    else:
+        os.replace(src, dst)
+
+
+def extract_zip(zip_path: str, type_dir: str) -> None:
+    """
+    Extract zip file into `type_dir` through a temporary directory
+
+    Entries are only renamed into `type_dir` once the whole archive has been
+    extracted, so an interrupted extraction never leaves a partial model.
+
+    Args:
+        zip_path (str): zip file path
+        type_dir (str): directory to extract into
+
+    """
+    tmp_dir = tempfile.mkdtemp(prefix=".extract-", dir=type_dir)
+    try:
+        with zipfile.ZipFile(zip_path) as zip_file:
+            zip_file.extractall(tmp_dir)
+        for name in os.listdir(tmp_dir):
+            _move_into(
+                os.path.join(tmp_dir, name),
+                os.path.join(type_dir, name),
+            )
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 def download_or_load_bert(info: DownloadInfo) -> str:
     """
     Download fine-tuned BrainBert & BrainSBert model and dict
@@ -98,19 +354,20 @@ def download_or_load_bert(info: DownloadInfo) -> str:
     model_path = os.path.join(info.root_dir, info.n_model)
 
     if not os.path.exists(model_path):
-        info.n_model += ".zip"
-        zip_path = os.path.join(info.root_dir, info.n_model)
-
-        type_dir = download_from_url(
-            info.n_model,
-            zip_path,
-            key="model",
-            lang=info.lang,
-        )
-
-        zip_file = zipfile.ZipFile(zip_path)
-        zip_file.extractall(type_dir)
-        zip_file.close()
+        with file_lock(model_path):
+            # Another process may have extracted the model while we waited
+            if not os.path.exists(model_path):
+                info.n_model += ".zip"
+                zip_path = os.path.join(info.root_dir, info.n_model)
+
+                type_dir = download_from_url(
+                    info.n_model,
+                    zip_path,
+                    key="model",
+                    lang=info.lang,
+                    root_dir=info.root_dir,
+                )
+                extract_zip(zip_path, type_dir)
 
     return model_path
 
@@ -144,6 +401,7 @@ def download_or_load_transformer(info: DownloadInfo) -> TransformerInfo:
             model_path,
             key="model",
             lang=info.lang,
+            root_dir=info.root_dir,
         )
 
     dict_type_dir = str()
@@ -160,6 +418,7 @@ def download_or_load_transformer(info: DownloadInfo) -> TransformerInfo:
                 src_dict_path,
                 key="dict",
                 lang=info.lang,
+                root_dir=info.root_dir,
             )
 
     if tgt_dict_in:
@@ -171,6 +430,7 @@ def download_or_load_transformer(info: DownloadInfo) -> TransformerInfo:
                 tgt_dict_path,
                 key="dict",
                 lang=info.lang,
+                root_dir=info.root_dir,
             )
 
     # Download or load corresponding tokenizer
@@ -179,11 +439,13 @@ def download_or_load_transformer(info: DownloadInfo) -> TransformerInfo:
         src_tok_path = download_or_load(
             f"tokenizers/{src_tok}.zip",
             lang=info.lang,
+            custom_save_dir=info.root_dir,
         )
     if tgt_tok:
         tgt_tok_path = download_or_load(
             f"tokenizers/{tgt_tok}.zip",
             lang=info.lang,
+            custom_save_dir=info.root_dir,
         )
 
     return TransformerInfo(
@@ -215,22 +477,86 @@ def download_or_load_misc(info: DownloadInfo) -> str:
 
     # Generate target model path using root directory
     model_path = os.path.join(info.root_dir, info.n_model)
-    if not os.path.exists(model_path):
-        type_dir = download_from_url(
-            info.n_model,
-            model_path,
-            key="model",
-            lang=info.lang,
-        )
+    if ".zip" not in info.n_model:
+        if not os.path.exists(model_path):
+            download_from_url(
+                info.n_model,
+                model_path,
+                key="model",
+                lang=info.lang,
+                root_dir=info.root_dir,
+            )
+        return model_path
+
+    extract_path = model_path[:model_path.rfind(".zip")]
+    if not os.path.exists(extract_path):
+        with file_lock(extract_path):
+            # Another process may have extracted the archive while we waited
+            if not os.path.exists(extract_path):
+                type_dir = download_from_url(
+                    info.n_model,
+                    model_path,
+                    key="model",
+                    lang=info.lang,
+                    root_dir=info.root_dir,
+                )
+                extract_zip(model_path, type_dir)
+    return extract_path
+
+
+def build_wordpiece_vocab(lang: str, path: str) -> None:
+    """
+    Build the contents of `tokenizers/wordpiece.{lang}.zip`, the `vocab.txt`
+    of the Hugging Face model the vocabulary was taken from
 
-        if ".zip" in info.n_model:
-            zip_file = zipfile.ZipFile(model_path)
-            zip_file.extractall(type_dir)
-            zip_file.close()
+    Args:
+        lang (str): language name
+        path (str): directory to create
 
-    if ".zip" in info.n_model:
-        model_path = model_path[:model_path.rfind(".zip")]
-    return model_path
+    """
+    from transformers import BertTokenizer
+
+    tmp_dir = tempfile.mkdtemp(prefix=".build-", dir=os.path.dirname(path))
+    try:
+        BertTokenizer.from_pretrained(
+            WORDPIECE_VOCABS[lang]).save_vocabulary(tmp_dir)
+        os.replace(tmp_dir, path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def download_or_load_wordpiece(info: DownloadInfo) -> str:
+    """
+    Download WordPiece vocabulary, or build it from Hugging Face if the
+    bundle is not served
+
+    Offline mode, checksum mismatches and local IO errors are raised as is,
+    only a missing bundle (HTTP 404) falls back to Hugging Face.
+
+    Args:
+        info (DownloadInfo): download information
+
+    Returns:
+        str: vocabulary directory path
+
+    """
+    try:
+        return download_or_load_misc(info)
+    except HTTPError as e:
+        if (e.code != 404 or is_offline() or
+                info.lang not in WORDPIECE_VOCABS):
+            raise
+
+        extract_path = os.path.join(
+            info.root_dir,
+            info.n_model[:info.n_model.rfind(".zip")],
+        )
+        logging.warning(f"{info.n_model} is not available ({e}), "
+                        f"building it from {WORDPIECE_VOCABS[info.lang]}")
+        with file_lock(extract_path):
+            if not os.path.exists(extract_path):
+                build_wordpiece_vocab(info.lang, extract_path)
+        return extract_path
 
 
 def download_or_load_bart(info: DownloadInfo) -> Union[str, Tuple[str, str]]:
@@ -253,6 +579,7 @@ def download_or_load_bart(info: DownloadInfo) -> Union[str, Tuple[str, str]]:
             model_path,
             key="model",
             lang=info.lang,
+            root_dir=info.root_dir,
         )
 
     return model_path
@@ -263,15 +590,20 @@ def download_from_url(
     model_path: str,
     key: str,
     lang: str,
+    root_dir: str = None,
 ) -> str:
     """
     Download specified model from Tenth
 
+    Concurrent callers for the same file are serialized with a file lock,
+    and only the first one downloads it.
+
     Args:
         n_model (str): model name
         model_path (str): pre-defined model path
         key (str): type key (either model or dict)
         lang (str): language name
+        root_dir (str, optional): save directory holding a checksum manifest
 
     Returns:
         str: default type directory
@@ -284,10 +616,17 @@ def download_from_url(
     # Get download tenth url
     url = get_download_url(n_model, key=key, lang=lang)
 
-    logging.info("Downloading user-selected model...")
-    wget.download(url, type_dir)
-    sys.stderr.write("\n")
-    sys.stderr.flush()
+    if is_offline() and not os.path.exists(model_path):
+        raise FileNotFoundError(
+            f"{model_path} is not available locally and PORORO_OFFLINE is set, "
+            "fetch it beforehand with `pororo fetch`")
+
+    with file_lock(model_path):
+        # Another process may have finished the download while we waited
+        if not os.path.exists(model_path):
+            logging.info("Downloading user-selected model...")
+            checksum = load_checksums(root_dir).get(f"{lang}/{key}s/{n_model}")
+            fetch(url, model_path, checksum=checksum)
 
     return type_dir
 
@@ -318,5 +657,55 @@ def download_or_load(
         return download_or_load_bert(info)
     if "bart" in n_model and "bpe" not in n_model:
         return download_or_load_bart(info)
+    if n_model.startswith("tokenizers/wordpiece"):
+        return download_or_load_wordpiece(info)
 
     return download_or_load_misc(info)
+
+
+def bert_assets(n_model: str, lang: str) -> List[Tuple[str, str]]:
+    """
+    Returns assets fetched when loading `bert/{n_model}` through its hub interface
+
+    Args:
+        n_model (str): model name
+        lang (str): language name
+
+    Returns:
+        List[Tuple[str, str]]: (asset name, lang) pairs
+
+    """
+    assets = [(f"bert/{n_model}", lang)]
+    if n_model.startswith("brainbert"):
+        assets.append((f"tokenizers/bpe32k.{lang}.zip", lang))
+    elif n_model.startswith(("jaberta", "zhberta")):
+        assets.append((f"tokenizers/wordpiece.{lang}.zip", lang))
+    elif n_model.startswith("roberta"):
+        assets.append(("misc/encoder.json", "en"))
+        assets.append(("misc/vocab.bpe", "en"))
+    return assets
+
+
+def download_assets(
+    assets: List[Tuple[str, str]],
+    custom_save_dir: str = None,
+    max_workers: int = 4,
+) -> List[Union[TransformerInfo, str, Tuple[str, str]]]:
+    """
+    Download or load several assets in parallel
+
+    Args:
+        assets (List[Tuple[str, str]]): (asset name, lang) pairs
+        custom_save_dir (str, optional): user-defined save directory path. defaults to None.
+        max_workers (int): number of concurrent downloads
+
+    Returns:
+        List[Union[TransformerInfo, str, Tuple[str, str]]]: `download_or_load` result of each asset
+
+    """
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(download_or_load, n_model, lang, custom_save_dir)
+            for n_model, lang in assets
+        ]
+        return [future.result() for future in futures]
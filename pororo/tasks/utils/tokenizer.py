@@ -1,9 +1,10 @@
-from typing import List, Optional, Union
+import unicodedata
+from typing import Dict, List, Optional, Union
 
-from tokenizers import Tokenizer, decoders, pre_tokenizers
+from tokenizers import Encoding, Tokenizer, decoders, pre_tokenizers
 from tokenizers.implementations import BaseTokenizer
-from tokenizers.models import BPE, Unigram
-from tokenizers.normalizers import NFKC
+from tokenizers.models import BPE, Unigram, WordPiece
+from tokenizers.normalizers import NFKC, BertNormalizer
 
 
 class CustomTokenizer(BaseTokenizer):
@@ -98,3 +99,68 @@ class CustomTokenizer(BaseTokenizer):
             s, e = offset
             result.append(text[s:e])
         return result
+
+
+class WordPieceTokenizer(BaseTokenizer):
+    """
+    WordPiece tokenizer over a BERT `vocab.txt`, gives the same tokens as the
+    `BertTokenizer` (or `BertJapaneseTokenizer` with `mecab=True`) of transformers
+
+    """
+
+    def __init__(
+        self,
+        vocab: Dict[str, int],
+        unk_token: str = "[UNK]",
+        lowercase: bool = False,
+        mecab: bool = False,
+    ):
+        tokenizer = Tokenizer(
+            WordPiece(
+                vocab,
+                unk_token=unk_token,
+                max_input_chars_per_word=100,
+            ))
+
+        # Japanese vocabularies are built over MeCab (ipadic) words, which
+        # are joined with spaces before the WordPiece model splits them
+        self.mecab = None
+        if mecab:
+            import fugashi
+            import ipadic
+
+            self.mecab = fugashi.GenericTagger(ipadic.MECAB_ARGS)
+            tokenizer.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+        else:
+            tokenizer.normalizer = BertNormalizer(lowercase=lowercase)
+            tokenizer.pre_tokenizer = pre_tokenizers.BertPreTokenizer()
+
+        tokenizer.decoder = decoders.WordPiece()
+
+        parameters = {
+            "model": "WordPiece",
+            "unk_token": unk_token,
+            "lowercase": lowercase,
+            "mecab": mecab,
+        }
+        super().__init__(tokenizer, parameters)
+
+    @staticmethod
+    def from_file(vocab_filename: str, **kwargs):
+        vocab = WordPiece.read_file(vocab_filename)
+        return WordPieceTokenizer(vocab, **kwargs)
+
+    def _segment_words(self, text: str) -> str:
+        if self.mecab is None:
+            return text
+        text = unicodedata.normalize("NFKC", text)
+        return " ".join(word.surface for word in self.mecab(text))
+
+    def encode(self, sequence: str, **kwargs) -> Encoding:
+        return super().encode(self._segment_words(sequence), **kwargs)
+
+    def encode_batch(self, inputs: List[str], **kwargs) -> List[Encoding]:
+        return super().encode_batch(
+            [self._segment_words(text) for text in inputs],
+            **kwargs,
+        )
@@ -6,7 +6,7 @@ from typing import Optional
 from whoosh.qparser import QueryParser
 
 from pororo.tasks.utils.base import PororoFactoryBase, PororoSimpleBase
-from pororo.tasks.utils.download_utils import download_or_load
+from pororo.tasks.utils.download_utils import VEC_MAP, download_or_load
 
 
 class PororoWordFactory(PororoFactoryBase):
@@ -213,6 +213,12 @@ class PororoWordFactory(PororoFactoryBase):
             "zh": ["wikipedia2vec.zh"],
         }
 
+    def get_assets(self):
+        return [
+            (f"misc/{VEC_MAP[self.config.lang]}", self.config.lang),
+            (f"misc/{self.config.lang}_indexdir.zip", self.config.lang),
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -229,15 +235,8 @@ class PororoWordFactory(PororoFactoryBase):
 
             from pororo.models.wikipedia2vec import Wikipedia2Vec
 
-            vec_map = {
-                "ko": "kowiki_20200720_100d.pkl",
-                "en": "enwiki_20180420_100d.pkl",
-                "ja": "jawiki_20180420_100d.pkl",
-                "zh": "zhwiki_20180420_100d.pkl",
-            }
-
             f_wikipedia2vec = download_or_load(
-                f"misc/{vec_map[self.config.lang]}",
+                f"misc/{VEC_MAP[self.config.lang]}",
                 self.config.lang,
             )
             wikipedia2vec = Wikipedia2Vec(f_wikipedia2vec, device)
@@ -52,6 +52,14 @@ class PororoWsdFactory(PororoFactoryBase):
             "ko": ["transformer.large.ko.wsd"],
         }
 
+    def get_assets(self):
+        return [
+            (f"transformer/{self.config.n_model}", self.config.lang),
+            (f"misc/morph2idx.{self.config.lang}.pkl", self.config.lang),
+            (f"misc/tag2idx.{self.config.lang}.pkl", self.config.lang),
+            (f"misc/wsd-dicts.{self.config.lang}.pkl", self.config.lang),
+        ]
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -222,9 +230,17 @@ class PororoTransformerWsd(PororoTaskGenerationBase):
 
         return result
 
+    def _convert(self, output: str, ignore_none: bool):
+        try:
+            result = self._postprocess(output)
+            return ([pair for pair in result if pair.meaning is not None]
+                    if ignore_none else result)
+        except:
+            print("Invalid inference result !")
+
     def predict(
         self,
-        text: str,
+        text: Union[str, List[str]],
         beam: int,
         **kwargs,
     ) -> Union[List[Tuple[str, str]], None]:
@@ -232,27 +248,28 @@ class PororoTransformerWsd(PororoTaskGenerationBase):
         Conduct Word Sense Disambiguation
 
         Args:
-            text (str): sentence to be inputted
+            text (Union[str, List[str]]): sentence or list of sentences to be inputted
             beam (int): beam search argument
             ignore_none (bool): whether to ignore `none` meaning
 
         Returns:
-            List[Tuple[str]]: list of token and its disambiguated information tuple
+            List[Tuple[str]]: list of token and its disambiguated information tuple, or a list of them for list input
 
         """
         ignore_none = kwargs.get("ignore_none", False)
 
-        text = self._preprocess(text)
+        if isinstance(text, str):
+            text = self._preprocess(text)
+        else:
+            text = [self._preprocess(t) for t in text]
 
+        # fairseq hub batches list input on its own
         output = self._model.translate(
             text,
             beam=beam,
             max_len_a=4,
             max_len_b=50,
         )
-        try:
-            result = self._postprocess(output)
-            return ([pair for pair in result if pair.meaning is not None]
-                    if ignore_none else result)
-        except:
-            print("Invalid inference result !")
+        if isinstance(output, str):
+            return self._convert(output, ignore_none)
+        return [self._convert(o, ignore_none) for o in output]
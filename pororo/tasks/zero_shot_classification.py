@@ -1,8 +1,9 @@
 """Zero-shot Classification related modeling class"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from pororo.tasks.utils.base import PororoBiencoderBase, PororoFactoryBase
+from pororo.tasks.utils.download_utils import bert_assets
 
 
 class PororoZeroShotFactory(PororoFactoryBase):
@@ -47,9 +48,15 @@ class PororoZeroShotFactory(PororoFactoryBase):
         >>> zsl = Pororo(task="zero-topic", lang="zh")
         >>> zsl("商务部14日发布数据显示，今年前10个月，我国累计对外投资904.6亿美元，同比增长5.9%。", ["政治", "经济", "国际化"])
         {'政治': 33.72, '经济': 3.9, '国际化': 13.67}
+        >>> zsl = Pororo(task="zero-topic")
+        >>> zsl(["Who are you voting for in 2020?", "The stock market hit a record high."], ["business", "politics"], max_tokens=4096)  # N sentences x M labels
+        [{...}, {...}]
 
     """
 
+    supports_quantize = True
+    supports_backend = True
+
     def __init__(self, task: str, lang: str, model: Optional[str]):
         super().__init__(task, lang, model)
 
@@ -66,6 +73,9 @@ class PororoZeroShotFactory(PororoFactoryBase):
             "en": ["roberta.base.en.nli"],
         }
 
+    def get_assets(self):
+        return bert_assets(self.config.n_model, self.config.lang)
+
     def load(self, device: str):
         """
         Load user-selected task-specific model
@@ -83,6 +93,8 @@ class PororoZeroShotFactory(PororoFactoryBase):
             model = BrainRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertZeroShot(model, self.config)
 
@@ -92,6 +104,8 @@ class PororoZeroShotFactory(PororoFactoryBase):
             model = JabertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertZeroShot(model, self.config)
 
@@ -101,6 +115,8 @@ class PororoZeroShotFactory(PororoFactoryBase):
             model = ZhbertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertZeroShot(model, self.config)
 
@@ -110,6 +126,8 @@ class PororoZeroShotFactory(PororoFactoryBase):
             model = CustomRobertaModel.load_model(
                 f"bert/{self.config.n_model}",
                 self.config.lang,
+                quantize=self.config.quantize,
+                backend=self.config.backend,
             ).eval().to(device)
             return PororoBertZeroShot(model, self.config)
 
@@ -128,49 +146,66 @@ class PororoBertZeroShot(PororoBiencoderBase):
 
     def predict(
         self,
-        sent: str,
+        sent: Union[str, List[str]],
         labels: List[str],
         **kwargs,
-    ) -> Dict[str, float]:
+    ) -> Union[Dict[str, float], List[Dict[str, float]]]:
         """
         Conduct zero-shot classification
 
+        Every (sentence, label hypothesis) pair is scored in length-bucketed
+        batches instead of one forward pass per label.
+
         Args:
-            sent (str): sentence to be classified
+            sent (Union[str, List[str]]): sentence or sentences to be classified
             labels (List[str]): candidate labels
+            max_tokens (int): maximum number of (padded) tokens per forward pass
 
         Returns:
-            List[Tuple(str, float)]: confidence scores corresponding to each input label
+            Union[Dict[str, float], List[Dict[str, float]]]: confidence scores corresponding to each input label
 
         """
+        max_tokens = kwargs.get("max_tokens", 8192)
+        sents = [sent] if isinstance(sent, str) else sent
+
         cands = [
             self._template[self.config.lang].format(label=label)
             for label in labels
         ]
 
-        result = dict()
-        for label, cand in zip(labels, cands):
-            if self.config.lang == "ko":
-                tokens = self._model.encode(
-                    sent,
+        if self.config.lang == "ko":
+            pairs = [
+                self._model.encode(
+                    s,
                     cand,
                     add_special_tokens=True,
                     no_separator=False,
-                )
-            else:
-                tokens = self._model.encode(
-                    sent,
+                ) for s in sents for cand in cands
+            ]
+        else:
+            pairs = [
+                self._model.encode(
+                    s,
                     cand,
                     no_separator=False,
-                )
-
-            # throw away "neutral" (dim 1) and take the probability of "entail" (2) as the probability of the label being true
-            pred = self._model.predict(
-                "sentence_classification_head",
-                tokens,
-                return_logits=True,
-            )[:, [0, 2]]
-            prob = pred.softmax(dim=1)[:, 1].item() * 100
-            result[label] = round(prob, 2)
-
-        return result
+                ) for s in sents for cand in cands
+            ]
+
+        if len(pairs) == 0:
+            return dict() if isinstance(sent, str) else [dict() for _ in sents]
+
+        # throw away "neutral" (dim 1) and take the probability of "entail" (2) as the probability of the label being true
+        preds = self._model.predict_batch(
+            "sentence_classification_head",
+            pairs,
+            batch_size=None,
+            max_tokens=max_tokens,
+            return_logits=True,
+        )[:, [0, 2]]
+        probs = (preds.softmax(dim=1)[:, 1] * 100).view(len(sents), len(labels))
+
+        results = [{
+            label: round(prob, 2) for label, prob in zip(labels, row)
+        } for row in probs.tolist()]
+
+        return results[0] if isinstance(sent, str) else results
@@ -29,8 +29,9 @@ setup(
     author_email="contact@kakaobrain.com",
     license="Apache-2.0",
     packages=find_packages(include=["pororo", "pororo.*"]),
+    entry_points={"console_scripts": ["pororo=pororo.cli:main"]},
     install_requires=requirements,
-    python_requires=">=3.6.0",
+    python_requires=">=3.7.0",
     setup_requires=["pytest-runner"],
     tests_require=["pytest"],
     package_data={},
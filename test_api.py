@@ -1,10 +1,16 @@
 # -*- coding: utf-8 -*-
 import json
+import time
+import asyncio
 from typing import Dict
 from urllib.parse import urlencode
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
-from api import app
+import torch
+
+from api import app, MicroBatcher, ModelExecutor, ModelPool
+from pororo.tasks.utils.base import module_nbytes
 
 
 client = TestClient(app)
@@ -18,6 +24,106 @@ def _(o):
     return json.loads(json.dumps(o))
 
 
+#===========================================================#
+# Micro-batching
+#===========================================================#
+
+
+def test_micro_batcher():
+    calls = []
+
+    def batch_fn(batch):
+        calls.append(batch)
+        return [i * 2 for i in batch]
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=4, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(*[batcher(i) for i in range(6)])
+
+    assert asyncio.run(run()) == [0, 2, 4, 6, 8, 10]
+    assert calls == [[0, 1, 2, 3], [4, 5]]
+
+
+def test_micro_batcher_overload():
+    batcher = MicroBatcher(lambda batch: batch, max_queue_size=1)
+
+    async def run():
+        return await asyncio.gather(*[batcher(i) for i in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert results[0] == 0
+    assert all(isinstance(i, HTTPException) and i.status_code == 503 for i in results[1:])
+
+
+def test_micro_batcher_errors():
+    # Too few outputs, a non-list and an exception all fail their own batch
+    results = iter([[0], {'a': 1}, ValueError('boom'), [6, 8]])
+
+    def batch_fn(batch):
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=2, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(*[batcher(i) for i in range(8)], return_exceptions=True)
+
+    outputs = asyncio.run(run())
+    assert all(isinstance(i, RuntimeError) for i in outputs[:4])
+    assert isinstance(outputs[4], ValueError) and isinstance(outputs[5], ValueError)
+    # The worker survives the failures and keeps serving the queue
+    assert outputs[6:] == [6, 8]
+
+
+def test_model_executor():
+    executor = ModelExecutor('test', max_pending=2, timeout=0.5)
+
+    async def run():
+        slow = asyncio.ensure_future(executor(time.sleep, 0.3))
+        # The event loop keeps serving other coroutines meanwhile
+        await asyncio.sleep(0.1)
+        assert not slow.done()
+        return await asyncio.gather(slow, executor(sum, [1, 2]), executor(sum, [3]), return_exceptions=True)
+
+    _, queued, overloaded = asyncio.run(run())
+    assert queued == 3
+    assert isinstance(overloaded, HTTPException) and overloaded.status_code == 503
+
+    try:
+        asyncio.run(executor(time.sleep, 1))
+        assert False, "Inference should have timed out"
+    except HTTPException as e:
+        assert e.status_code == 504
+
+
+#===========================================================#
+# Model Pool
+#===========================================================#
+
+
+def test_model_pool():
+    nbytes = module_nbytes(torch.nn.Linear(10, 10))
+    assert nbytes == (10 * 10 + 10) * 4
+    assert module_nbytes({'a': torch.nn.Linear(10, 10), 'b': [torch.nn.Linear(10, 10)]}) == 2 * nbytes
+
+    pool = ModelPool(budget_bytes=2 * nbytes)
+    pool['pos', 'ko'] = torch.nn.Linear(10, 10)
+    pool.pin(('pos', 'ko'))
+    pool['ner', 'en'] = torch.nn.Linear(10, 10)
+    pool['ner', 'ja'] = torch.nn.Linear(10, 10)
+
+    # Pinned model survives, least recently used one is evicted
+    assert ('pos', 'ko') in pool
+    assert ('ner', 'en') not in pool
+    assert ('ner', 'ja') in pool
+    pool['ner', 'ja']
+    assert pool.summary()['resident_bytes'] == 2 * nbytes
+    assert pool.stats == {'hits': 1, 'loads': 3, 'evictions': 1}
+
+
 #===========================================================#
 # Sequence Tagging
 #===========================================================#
@@ -0,0 +1,45 @@
+"""Test length-bucketing batch planner"""
+
+import random
+import unittest
+
+from pororo.tasks.utils.batching import bucket_by_length, plan_batches
+
+
+class PororoBatchingTester(unittest.TestCase):
+
+    def test_plan(self):
+        lengths = [random.Random(i).randint(1, 100) for i in range(100)]
+        plan = plan_batches(lengths, batch_size=8)
+
+        self.assertEqual(sorted(plan.order), list(range(len(lengths))))
+        self.assertTrue(all(len(batch) <= 8 for batch in plan))
+
+        # Every batch is made of samples of neighbouring lengths
+        maxima = [max(lengths[i] for i in batch) for batch in plan]
+        minima = [min(lengths[i] for i in batch) for batch in plan]
+        self.assertTrue(all(a <= b for a, b in zip(maxima, minima[1:])))
+
+        outputs = [lengths[i] for i in plan.order]
+        self.assertEqual(plan.restore(outputs), lengths)
+
+    def test_max_tokens(self):
+        lengths = [3, 10, 4, 9, 2, 30]
+        batches = bucket_by_length(lengths, max_tokens=20)
+        for batch in batches:
+            self.assertTrue(
+                len(batch) == 1 or
+                max(lengths[i] for i in batch) * len(batch) <= 20)
+        # Samples longer than the budget still get a batch of their own
+        self.assertIn([5], batches)
+
+    def test_padding(self):
+        lengths = [5, 1, 4, 2]
+        plan = plan_batches(lengths, batch_size=2)
+        self.assertEqual(plan.batches, [[1, 3], [2, 0]])
+        self.assertEqual(plan.padding(), 2)
+        self.assertEqual(plan.inverse, [3, 0, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
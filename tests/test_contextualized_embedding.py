@@ -1,5 +1,7 @@
 """Test Contextualized Embedding module"""
 
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -22,6 +24,28 @@ class PororoContextualizedTester(unittest.TestCase):
         cse_res = cse("おはようございます")
         self.assertIsInstance(cse_res, np.ndarray)
 
+    def test_batch(self):
+        cse = Pororo(task="cse", lang="ko")
+        sents = ["나는 동물을 좋아하는 사람이야", "하늘을 나는 새"]
+
+        res = cse(sents)
+        for sent, feature in zip(sents, res):
+            np.testing.assert_allclose(feature, cse(sent), atol=1e-4)
+
+        pooled = cse(sents, pooling="mean", dtype="float16")
+        self.assertEqual(pooled.dtype, np.float16)
+        np.testing.assert_allclose(pooled[1], res[1].mean(0), atol=1e-2)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "features.npy")
+            self.assertEqual(list(cse.stream(sents * 3, path, 6, chunk_size=4)),
+                             [4, 6])
+            np.testing.assert_allclose(
+                np.load(path)[:2],
+                cse(sents, pooling="mean"),
+                atol=1e-4,
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,268 @@
+"""Test model download utilities against a local HTTP server"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from pororo.tasks.utils import download_utils
+from pororo.tasks.utils.download_utils import (
+    download_assets,
+    download_or_load,
+)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serve `server.files` with HEAD and single byte-range support"""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body_only: bool):
+        data = self.server.files.get(self.path)
+        if data is None:
+            self.send_error(404)
+            return
+
+        self.server.requests.append((self.command, self.path,
+                                     self.headers.get("Range")))
+        start, end, status = 0, len(data) - 1, 200
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if match and self.server.ranges:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else end
+            if start >= len(data):
+                self.send_error(416)
+                return
+            status = 206
+
+        self.send_response(status)
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range",
+                             f"bytes {start}-{end}/{len(data)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if body_only:
+            self.wfile.write(data[start:end + 1])
+
+    def do_HEAD(self):
+        self._send(body_only=False)
+
+    def do_GET(self):
+        self._send(body_only=True)
+
+
+class PororoDownloadUtilsTester(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+        self.server.files = dict()
+        self.server.requests = list()
+        self.server.ranges = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        host = f"http://127.0.0.1:{self.server.server_port}"
+        self.prefix = mock.patch.dict(
+            download_utils.DEFAULT_PREFIX,
+            {
+                "model": host + "/{lang}/models",
+                "dict": host + "/{lang}/dicts",
+            },
+        )
+        self.prefix.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self):
+        self.prefix.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def gets(self):
+        return [r for r in self.server.requests if r[0] == "GET"]
+
+    def test_download(self):
+        data = os.urandom(10000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+
+        path = download_or_load("misc/blob.bin", "ko", self.root)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertFalse(os.path.exists(path + ".part"))
+
+        # Cached afterwards
+        download_or_load("misc/blob.bin", "ko", self.root)
+        self.assertEqual(len(self.gets()), 1)
+
+    def test_resume(self):
+        data = os.urandom(10000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+        os.makedirs(os.path.join(self.root, "misc"))
+        with open(os.path.join(self.root, "misc", "blob.bin.part"), "wb") as f:
+            f.write(data[:4000])
+
+        path = download_or_load("misc/blob.bin", "ko", self.root)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(self.gets()[0][2], "bytes=4000-")
+
+        # Servers without range support restart from scratch
+        self.server.ranges = False
+        with open(os.path.join(self.root, "misc", "other.bin.part"),
+                  "wb") as f:
+            f.write(b"stale")
+        self.server.files["/ko/models/misc/other.bin"] = data
+        path = download_or_load("misc/other.bin", "ko", self.root)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_checksum(self):
+        data = os.urandom(1000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+        self.server.files["/ko/models/misc/good.bin"] = data
+        with open(os.path.join(self.root, "checksums.json"), "w") as f:
+            json.dump(
+                {
+                    "ko/models/misc/blob.bin": "0" * 64,
+                    "ko/models/misc/good.bin": hashlib.sha256(data).hexdigest(),
+                },
+                f,
+            )
+
+        with self.assertRaises(IOError):
+            download_or_load("misc/blob.bin", "ko", self.root)
+        self.assertFalse(os.path.exists(os.path.join(self.root, "misc/blob.bin")))
+        self.assertTrue(
+            os.path.exists(download_or_load("misc/good.bin", "ko", self.root)))
+
+    def test_parallel_chunks(self):
+        data = os.urandom(10000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+
+        with mock.patch.object(download_utils, "PARALLEL_MIN_SIZE", 1000), \
+                mock.patch.object(download_utils, "PARALLEL_CHUNK_SIZE", 3000):
+            path = download_or_load("misc/blob.bin", "ko", self.root)
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(len(self.gets()), 4)
+        self.assertEqual(os.listdir(os.path.dirname(path)).count("blob.bin"), 1)
+        self.assertFalse(
+            [n for n in os.listdir(os.path.dirname(path)) if ".part" in n])
+
+    def test_zip(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zip_file:
+            zip_file.writestr("bpe.ko/vocab.txt", "hello")
+        self.server.files["/ko/models/tokenizers/bpe.ko.zip"] = buffer.getvalue()
+
+        path = download_or_load("tokenizers/bpe.ko.zip", "ko", self.root)
+        self.assertEqual(path, os.path.join(self.root, "tokenizers", "bpe.ko"))
+        with open(os.path.join(path, "vocab.txt")) as f:
+            self.assertEqual(f.read(), "hello")
+        self.assertFalse([
+            n for n in os.listdir(os.path.dirname(path))
+            if n.startswith(".extract-")
+        ])
+
+    def test_wordpiece_fallback(self):
+
+        def build(lang, path):
+            os.makedirs(path)
+            with open(os.path.join(path, "vocab.txt"), "w") as f:
+                f.write(lang)
+
+        # The bundle is not served, so the vocabulary is built locally
+        with mock.patch.object(download_utils, "build_wordpiece_vocab",
+                               side_effect=build) as builder:
+            path = download_or_load("tokenizers/wordpiece.ja.zip", "ja",
+                                    self.root)
+            download_or_load("tokenizers/wordpiece.ja.zip", "ja", self.root)
+
+        self.assertEqual(builder.call_count, 1)
+        self.assertEqual(path,
+                         os.path.join(self.root, "tokenizers", "wordpiece.ja"))
+        with open(os.path.join(path, "vocab.txt")) as f:
+            self.assertEqual(f.read(), "ja")
+
+    def test_wordpiece_no_fallback(self):
+        transformers = mock.MagicMock()
+
+        # Offline loads never reach Hugging Face
+        with mock.patch.dict(os.environ, {"PORORO_OFFLINE": "1"}), \
+                mock.patch.dict(sys.modules, {"transformers": transformers}):
+            with self.assertRaises(FileNotFoundError):
+                download_or_load("tokenizers/wordpiece.ja.zip", "ja",
+                                 self.root)
+
+        # Neither does a bundle failing its integrity check
+        self.server.files["/zh/models/tokenizers/wordpiece.zh.zip"] = b"zip"
+        with open(os.path.join(self.root, "checksums.json"), "w") as f:
+            json.dump({"zh/models/tokenizers/wordpiece.zh.zip": "0" * 64}, f)
+        with mock.patch.dict(sys.modules, {"transformers": transformers}):
+            with self.assertRaises(IOError):
+                download_or_load("tokenizers/wordpiece.zh.zip", "zh",
+                                 self.root)
+
+        transformers.BertTokenizer.from_pretrained.assert_not_called()
+
+    def test_concurrent(self):
+        data = os.urandom(100000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+
+        paths = list()
+        threads = [
+            threading.Thread(target=lambda: paths.append(
+                download_or_load("misc/blob.bin", "ko", self.root)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(len(self.gets()), 1)
+        with open(paths[0], "rb") as f:
+            self.assertEqual(f.read(), data)
+
+    def test_offline(self):
+        data = os.urandom(1000)
+        self.server.files["/ko/models/misc/blob.bin"] = data
+
+        with mock.patch.dict(os.environ, {"PORORO_OFFLINE": "1"}):
+            with self.assertRaises(FileNotFoundError):
+                download_or_load("misc/blob.bin", "ko", self.root)
+        self.assertEqual(self.server.requests, [])
+
+        path = download_or_load("misc/blob.bin", "ko", self.root)
+        with mock.patch.dict(os.environ, {"PORORO_OFFLINE": "1"}):
+            self.assertEqual(download_or_load("misc/blob.bin", "ko", self.root),
+                             path)
+
+    def test_download_assets(self):
+        for name in ["a", "b", "c"]:
+            self.server.files[f"/ko/models/misc/{name}.bin"] = name.encode()
+
+        assets = [(f"misc/{name}.bin", "ko") for name in ["a", "b", "c", "a"]]
+        with mock.patch.dict(os.environ, {"PORORO_HOME": self.root}):
+            paths = download_assets(assets)
+
+        self.assertEqual(paths[0], paths[3])
+        self.assertEqual(paths[1], os.path.join(self.root, "misc", "b.bin"))
+        self.assertEqual(len(self.gets()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,24 @@ class PororoBlankTester(unittest.TestCase):
         fill_res = fill("文在寅は__の大統領だ。")
         self.assertIsInstance(fill_res, list)
 
+    def test_batch(self):
+        fill = Pororo(task="fib", lang="en")
+        sents = [
+            "David Beckham is a famous __ player.",
+            "The __ sat on the mat.",
+        ]
+        # Every sentence of a list gets one candidate list per blank
+        self.assertEqual(fill(sents), [[fill(sent)] for sent in sents])
+
+        res = fill(["__ is the capital of __.", "The __ sat on the mat."])
+        self.assertEqual([len(masks) for masks in res], [2, 1])
+
+        res = fill("__ is the capital of __.", topk=3, show_probs=True)
+        self.assertEqual(len(res), 2)
+        for candidates in res:
+            self.assertEqual(len(candidates), 3)
+            self.assertNotIn(".", [token for token, _ in candidates])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,6 +16,24 @@ class PororoCounselingTester(unittest.TestCase):
         gec_res = gec_ko("이걸이 렇게 한다 고?")
         self.assertIsInstance(gec_res, str)
 
+    def test_batch(self):
+        sents = [
+            "This apple are so sweet.",
+            "Travel by bus is exspensive , bored and annoying .",
+            "'I've love you, before I meet her!'",
+        ]
+        gec_en = Pororo(task="gec", lang="en")
+        for correct_spell in (False, True):
+            batch_res = gec_en(sents, correct_spell=correct_spell, batch_size=2)
+            self.assertEqual(
+                batch_res,
+                [gec_en(sent, correct_spell=correct_spell) for sent in sents],
+            )
+
+        spacing = Pororo(task="gec", lang="ko")
+        sents = ["카 카오브 레인에서는 무슨 일을 하 나 요?", "아버지가방에들어간다."]
+        self.assertEqual(spacing(sents), [spacing(sent) for sent in sents])
+
 
 if __name__ == "__main__":
     unittest.main()
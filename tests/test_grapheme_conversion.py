@@ -39,6 +39,10 @@ class PororoGraphemeConversionTester(unittest.TestCase):
         p2g_ja_res = p2g_ja("python ga daisuki desu。")
         self.assertIsInstance(p2g_ja_res, str)
 
+        p2g_ja_res = p2g_ja(["python ga daisuki desu。", "nihon no shuto ha toukyou desu。"])
+        self.assertIsInstance(p2g_ja_res, list)
+        self.assertEqual(len(p2g_ja_res), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -15,6 +15,22 @@ class PororoMrcTester(unittest.TestCase):
         )
         self.assertIsInstance(mrc_res, tuple)
 
+    def test_long_context(self):
+        mrc = Pororo(task="mrc", lang="ko")
+        query = "카카오브레인이 공개한 라이브러리 이름은?"
+        context = "카카오브레인은 자연어 처리와 음성 관련 태스크를 쉽게 수행할 수 있도록 도와 주는 라이브러리 pororo를 공개하였습니다."
+        filler = "포즈는 AI 비전(VISION, 영상·화면분석) 분야 중 하나다. " * 60
+
+        # answer is out of the first window
+        res = mrc(query, filler + context, postprocess=False)
+        self.assertEqual(res[0], "pororo")
+
+        pairs = [(query, context), (query, filler + context)]
+        self.assertEqual(
+            mrc(pairs, postprocess=False),
+            [mrc(q, c, postprocess=False) for q, c in pairs],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
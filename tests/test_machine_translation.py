@@ -1,5 +1,7 @@
 """Test Machine Translation module"""
 
+import os
+import tempfile
 import unittest
 
 from pororo import Pororo
@@ -63,6 +65,88 @@ class PororoTranslationTester(unittest.TestCase):
         multi_res = multi("나는 여기에 산다.", src="ko", tgt="en")
         self.assertIsInstance(multi_res, str)
 
+    def test_batch(self):
+        multi = Pororo(task="mt", lang="multi")
+        docs = [
+            "나는 여기에 산다. 오늘은 날씨가 좋다.",
+            "케빈은 아직도 일을 하고 있다.",
+        ]
+
+        # Batched documents should match translating them one by one
+        batch_res = multi(docs, src="ko", tgt="en", beam=1)
+        self.assertEqual(
+            batch_res,
+            [multi(doc, src="ko", tgt="en", beam=1) for doc in docs],
+        )
+
+    def test_stream(self):
+        multi = Pororo(task="mt", lang="multi")
+        doc = "나는 여기에 산다. 오늘은 날씨가 좋다. 케빈은 아직도 일을 하고 있다."
+
+        for prefetch in [True, False]:
+            stream = multi.translate_stream(
+                doc,
+                src="ko",
+                tgt="en",
+                batch_size=2,
+                prefetch=prefetch,
+                beam=1,
+            )
+            self.assertEqual(" ".join(stream),
+                             multi(doc, src="ko", tgt="en", beam=1))
+
+        docs = [doc, "케빈은 아직도 일을 하고 있다."]
+        stream = multi.translate_documents_stream(
+            docs,
+            src="ko",
+            tgt="en",
+            batch_size=2,
+            beam=1,
+        )
+        self.assertEqual(list(stream), multi(docs, src="ko", tgt="en", beam=1))
+
+    def test_translation_memory(self):
+        from pororo.tasks.machine_translation import TranslationMemory
+
+        with tempfile.TemporaryDirectory() as root:
+            path = os.path.join(root, "memory.db")
+            memory = TranslationMemory(path, max_entries=2, capacity=1)
+            keys = [TranslationMemory.key("ko", "en", s, 5) for s in "abc"]
+
+            self.assertEqual(memory.get_many(keys[:1]), [None])
+            memory.put_many([(keys[0], "A"), (keys[1], "B")], elapsed=0.1)
+            self.assertEqual(memory.get_many(keys[:2]), ["A", "B"])
+
+            # Least recently used translation is evicted over the size limit
+            memory.put_many([(keys[2], "C")])
+            self.assertEqual(memory.get_many(keys), [None, "B", "C"])
+
+            stats = memory.stats()
+            self.assertEqual(stats["hits"], 4)
+            self.assertEqual(stats["misses"], 2)
+            self.assertEqual(stats["memory_hits"] + stats["disk_hits"], 4)
+
+            # Translations outlive the process
+            reopened = TranslationMemory(path)
+            self.assertEqual(reopened.get_many(keys[1:]), ["B", "C"])
+
+    def test_memory_module(self):
+        with tempfile.TemporaryDirectory() as root:
+            multi = Pororo(
+                task="mt",
+                lang="multi",
+                translation_memory=os.path.join(root, "mt.db"),
+            )
+            first = multi("나는 여기에 산다.", src="ko", tgt="en")
+            self.assertEqual(multi("나는  여기에 산다.", src="ko", tgt="en"),
+                             first)
+            self.assertEqual(multi.memory_stats()["hits"], 1)
+
+            # Misses see the same model input the memory is keyed on
+            plain = Pororo(task="mt", lang="multi")
+            self.assertEqual(plain("나는  여기에 산다.", src="ko", tgt="en"),
+                             first)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,27 @@ class PororoNERTester(unittest.TestCase):
         ner_res = ner("[UCL 리뷰] '디마리아 1골 2도움' PSG, 라이프치히 3-0 제압...사상 첫 결승행")
         self.assertIsInstance(ner_res, list)
 
+    def test_batch(self):
+        ner = Pororo(task="ner", lang="en")
+        sents = [
+            "Michael Jeffrey Jordan is an American businessman.",
+            "It was in midfield where Arsenal took control of the game, and that was mainly down to Thomas Partey.",
+            "Seoul is the capital.",
+        ]
+        self.assertEqual(ner(sents), [ner(sent) for sent in sents])
+
+    def test_batch_ko(self):
+        ner = Pororo(task="ner", lang="ko")
+        docs = [
+            "손흥민은 토트넘 홋스퍼 소속이다. 그는 2015년에 이적했다.\n경기는 3시에 시작한다.",
+            "[UCL 리뷰] '디마리아 1골 2도움' PSG, 라이프치히 3-0 제압...사상 첫 결승행",
+        ]
+        self.assertEqual(ner(docs), [ner(doc) for doc in docs])
+        self.assertEqual(
+            ner(docs, apply_wsd=True),
+            [ner(doc, apply_wsd=True) for doc in docs],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
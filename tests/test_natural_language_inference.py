@@ -15,6 +15,29 @@ class PororoNliTester(unittest.TestCase):
         )
         self.assertIsInstance(nli_res, str)
 
+    def test_encode(self):
+        pairs = [
+            ("BrainBert는 한국어 코퍼스에 학습된 언어모델이다.", "BrainBert는 한국어 모델이다."),
+            ("저는 지금 많이 피곤합니다", "저는 지금 쉬고 싶습니다"),
+        ]
+        for lang in ["ko", "ja", "zh"]:
+            model = Pororo(task="nli", lang=lang)._model
+
+            # Id-level encoding should match the string round-trip
+            for (a, b), tokens in zip(pairs, model.encode_batch(pairs)):
+                bpe_sentence = " ".join([
+                    model.tokenize(a, add_special_tokens=True),
+                    "</s>",
+                    model.tokenize(b),
+                    "</s>",
+                ])
+                expected = model.task.source_dictionary.encode_line(
+                    bpe_sentence,
+                    append_eos=False,
+                    add_if_not_exist=False,
+                )
+                self.assertEqual(tokens.tolist(), expected.long().tolist())
+
 
 if __name__ == "__main__":
     unittest.main()
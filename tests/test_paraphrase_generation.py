@@ -24,6 +24,13 @@ class PororoParaphraseTester(unittest.TestCase):
         para_zh_res = para_zh("我喜欢足球")
         self.assertIsInstance(para_zh_res, str)
 
+    def test_batch(self):
+        para_ko = Pororo(task="pg", lang="ko")
+        sents = ["나는 여기에 산다.", "노는게 제일 좋아.", "친구들 모여라."]
+
+        batch_res = para_ko(sents, beam=1)
+        self.assertEqual(batch_res, [para_ko(sent, beam=1) for sent in sents])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 """Test Pororo module"""
 
+import subprocess
+import sys
 import unittest
 
 from pororo import Pororo
@@ -14,6 +16,88 @@ class PororoPororoTester(unittest.TestCase):
         avail_models = Pororo.available_models("ner")
         self.assertIsInstance(avail_models, str)
 
+    def test_cache(self):
+        tok = Pororo(task="tokenization", lang="en", model="sent_en", cache=True)
+        self.assertIs(
+            tok,
+            Pororo(task="tokenize", lang="en", model="sent_en", cache=True),
+        )
+        self.assertIsNot(
+            tok,
+            Pororo(task="tokenization", lang="en", model="sent_en"),
+        )
+
+        usage = Pororo.memory_usage()
+        self.assertIn("total", usage)
+        self.assertTrue(
+            any(name.startswith("tokenization:en:sent_en") for name in usage))
+
+        Pororo.clear_cache()
+
+    def test_quantize(self):
+        import torch
+
+        sents = ("저는, 그냥 알아내려고 거기 있었어요", "나는 처음부터 그것을 잘 이해했다")
+        nli = Pororo(task="nli", lang="ko")
+        nli_int8 = Pororo(task="nli", lang="ko", quantize="int8")
+
+        self.assertEqual(nli(*sents), nli_int8(*sents))
+        self.assertFalse(
+            any(
+                type(module) is torch.nn.Linear
+                for module in nli_int8._model.model.modules()))
+
+        with self.assertRaises(ValueError):
+            Pororo(task="mt", lang="multi", quantize="int8")
+
+    def test_backend(self):
+        sents = ["배송이 버트 학습시키는 것 만큼 느리네요", "배송이 경량화되었는지 빠르네요"]
+        sa = Pororo(task="sentiment", lang="ko")
+        expected = [sa(sent, show_probs=True) for sent in sents]
+
+        for backend in ["torchscript", "onnx"]:
+            if backend == "onnx":
+                try:
+                    import onnxruntime  # noqa
+                except ImportError:
+                    continue
+
+            sa_exported = Pororo(task="sentiment", lang="ko", backend=backend)
+            for sent, probs in zip(sents, expected):
+                for label, prob in sa_exported(sent, show_probs=True).items():
+                    self.assertAlmostEqual(prob, probs[label], places=3)
+
+        with self.assertRaises(ValueError):
+            Pororo(task="fib", lang="en", backend="torchscript")
+
+    def test_resolve_assets(self):
+        from pororo.pororo import resolve_assets
+
+        assets = resolve_assets([("ner", "ko", None), ("mt", "multi", None)])
+        self.assertIn(("bert/charbert.base.ko.ner", "ko"), assets)
+        self.assertIn(("transformer/transformer.large.multi.mtpg", "multi"),
+                      assets)
+        # Assets only fetched on first use, and the ones of the WSD module
+        self.assertIn(("misc/wsd.cls.txt", "ko"), assets)
+        self.assertIn(("transformer/transformer.large.ko.wsd", "ko"), assets)
+        self.assertEqual(len(assets), len(set(assets)))
+
+    def test_lazy_import(self):
+        # `import pororo` should not import any factory or heavy dependency
+        heavy = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, pororo; print(','.join(m for m in "
+                "['torch', 'fairseq', 'transformers', 'pororo.tasks.tokenization'] "
+                "if m in sys.modules))",
+            ],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout.strip()
+        self.assertEqual(heavy, "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -24,6 +24,13 @@ class PororoStsTester(unittest.TestCase):
         sim_res = sim("야 너 몇 살이야?", "당신의 나이는 어떻게 되십니까?")
         self.assertIsInstance(sim_res, float)
 
+        sim_res = sim([
+            ("야 너 몇 살이야?", "당신의 나이는 어떻게 되십니까?"),
+            ("나는 동물을 좋아하는 사람이야", "강아지를 좋아하는 아버지"),
+        ])
+        self.assertIsInstance(sim_res, list)
+        self.assertEqual(len(sim_res), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,11 @@ class PororoSentimentTester(unittest.TestCase):
         sentiment_res = sentiment("진짜 재미있다")
         self.assertIsInstance(sentiment_res, str)
 
+        sentiment_res = sentiment(["진짜 재미있다", "진짜 재미없다"], batch_size=1)
+        self.assertIsInstance(sentiment_res, list)
+        self.assertEqual(len(sentiment_res), 2)
+        self.assertEqual(sentiment_res[0], sentiment("진짜 재미있다"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -14,6 +14,12 @@ class PororoSTTester(unittest.TestCase):
         with control_temp("https://twg.kakaocdn.net/pororo/ko/example/korean_speech.wav") as f_src:
             st_res = st(f_src, tgt="en")
             self.assertIsInstance(st_res, dict)
+
+            # Streamed sections are translated as the whole audio is
+            self.assertEqual(
+                [output["mt_output"] for output in st.stream(f_src, tgt="en")],
+                st_res["mt_outputs"],
+            )
         # yapf: enable
 
 
@@ -38,6 +38,27 @@ class PororoSummarizationTester(unittest.TestCase):
         )
         self.assertIsInstance(summarization_res, list)
 
+    def test_batch(self):
+        texts = [
+            "올해 8월 17일이 임시공휴일로 지정된다. 정세균 국무총리가 지난 19일 코로나19 장기화로 지친 의료진과 국민들의 휴식 및 내수 활성화를 위해 검토를 지시한지 이틀만이다. 정부는 21일 문재인 대통령 주재로 국무회의를 열어 '8월 17일 임시공휴일 지정안'을 의결했다고 밝혔다. 이번 임시공휴일은 관공서 뿐 아니라 근로기준법상 상시 300명  이상 근로자를 둔 사업장에 적용된다.",
+            "카카오 브레인에서 한국어 자연어 처리를 위한 새로운 데이터셋을 공개했다. 한국어로 된 NLI나 STS 공개 데이터셋이 없어 새로운 데이터셋을 만들었다. 기존의 영어 훈련 세트를 기계 번역하고 develop set과 test set을 수동으로 번역했다.",
+            "정부는 21일 국무회의를 열어 임시공휴일 지정안을 의결했다. 인사혁신처는 임시공휴일 확정을 위한 후속 조치에 착수한다. 관계 부처가 사전 대책을 마련하도록 요청할 예정이다.",
+        ]
+        for model in ("abstractive", "bullet"):
+            summarization = Pororo(task="summarization", lang="ko", model=model)
+            expected = [summarization(text) for text in texts]
+
+            # One text per batch gets the same output length limit as alone,
+            # so only the reordering of outputs is exercised here
+            self.assertEqual(summarization(texts, batch_size=1), expected)
+
+            # Texts batched together may be given a longer output length limit
+            batch_res = summarization(texts, batch_size=2, max_tokens=256)
+            self.assertEqual(len(batch_res), len(texts))
+            for res, single in zip(batch_res, expected):
+                self.assertIsInstance(res, type(single))
+                self.assertTrue(res)
+
 
 if __name__ == "__main__":
     unittest.main()
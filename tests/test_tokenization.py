@@ -40,6 +40,63 @@ class PororoTokenizerTester(unittest.TestCase):
         mecab_bpe_res = mecab_bpe("안녕 나는 민이라고 해.")
         self.assertIsInstance(mecab_bpe_res, list)
 
+    def test_load_shared(self):
+        from pororo.tasks import PororoTokenizationFactory
+
+        sent = PororoTokenizationFactory.load_shared(
+            task="tokenization",
+            lang="en",
+            model="sent_en",
+            device="cpu",
+        )
+        self.assertIs(
+            sent,
+            PororoTokenizationFactory.load_shared(
+                task="tokenization",
+                lang="en",
+                model="sent_en",
+                device="cpu",
+            ),
+        )
+        self.assertIsInstance(sent("Hello world. Bye world."), list)
+
+    def test_wordpiece(self):
+        from transformers import BertJapaneseTokenizer, BertTokenizer
+
+        from pororo.tasks.utils.download_utils import download_or_load
+        from pororo.tasks.utils.tokenizer import WordPieceTokenizer
+
+        # Bundled vocabularies should tokenize as the models were trained
+        cases = [
+            (
+                "ja",
+                dict(mecab=True),
+                BertJapaneseTokenizer.from_pretrained(
+                    "cl-tohoku/bert-base-japanese-whole-word-masking"),
+                ["日本の首都は東京です。", "カカオブレインは自然言語処理ライブラリを公開しました。"],
+            ),
+            (
+                "zh",
+                dict(lowercase=True),
+                BertTokenizer.from_pretrained(
+                    "bert-base-chinese",
+                    do_lower_case=True,
+                ),
+                ["中国的首都是北京。", "Kakao Brain发布了一个自然语言处理库。"],
+            ),
+        ]
+        for lang, options, reference, sents in cases:
+            tok_path = download_or_load(f"tokenizers/wordpiece.{lang}.zip",
+                                        lang)
+            tokenizer = WordPieceTokenizer.from_file(
+                f"{tok_path}/vocab.txt",
+                **options,
+            )
+            encodings = tokenizer.encode_batch(sents)
+            for sent, encoding in zip(sents, encodings):
+                self.assertEqual(encoding.tokens, reference.tokenize(sent))
+                self.assertEqual(encoding.ids, tokenizer.encode(sent).ids)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -32,6 +32,21 @@ class PororoZSLTester(unittest.TestCase):
             ],
         )
 
+        zsl_res = zsl(
+            [
+                "Who are you voting for in 2020?",
+                "The stock market hit a record high.",
+            ],
+            [
+                "business",
+                "politics",
+            ],
+            max_tokens=64,
+        )
+        self.assertIsInstance(zsl_res, list)
+        self.assertEqual(len(zsl_res), 2)
+        self.assertEqual(list(zsl_res[0].keys()), ["business", "politics"])
+
         zsl = Pororo(task="zero-topic", lang="ja")
         zsl(
             "香川 真司は、兵庫県神戸市垂水区出身のプロサッカー選手。元日本代表。ポジションはMF、FW。ボルシア・ドルトムント時代の2010-11シーズンでリーグ前半期17試合で8得点を記録し9シーズンぶりのリーグ優勝に貢献。キッカー誌が選定したブンデスリーガの年間ベスト イレブンに名を連ねた。",